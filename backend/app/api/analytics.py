@@ -0,0 +1,47 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import get_db
+from ..schemas.analytics import PortfolioAnalyticsResponse
+from ..utils.analytics import compute_portfolio_analytics, load_portfolio_arrays
+from ..utils.fx import UnknownCurrencyError, fx_rate_cache
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+@router.get("", response_model=PortfolioAnalyticsResponse)
+def portfolio_analytics(
+    db: Session = Depends(get_db),
+    cognito_id: Optional[str] = Query(None, description="Limit to one user's assets"),
+    top_n: int = Query(10, ge=1, le=100, description="Number of assets in the top-N share"),
+    include_inactive: bool = Query(False, description="Include inactive assets"),
+    base_currency: str = Query(settings.default_currency, min_length=3, max_length=10, description="Currency to report values in"),
+) -> PortfolioAnalyticsResponse:
+    """
+    Portfolio analytics for one user, or across every user when no
+    `cognito_id` is given.
+    
+    - **unrealized_gain** / **return_pct**: `balance_current - balance_cost_basis`
+      over assets with a balance and a known, positive cost basis
+    - **allocation**: value weights by `primary_asset_category`,
+      `wealth_asset_type` and `institution_name`
+    - **concentration**: top-N share and Herfindahl-Hirschman index (HHI)
+    
+    Assets excluded from net worth are never counted. All values are
+    converted to **base_currency** (default USD) using the cached exchange
+    rates.
+    """
+    rates = fx_rate_cache.get(db)
+    base_currency = base_currency.upper()
+    try:
+        rates.rate(base_currency)
+    except UnknownCurrencyError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    arrays = load_portfolio_arrays(db, cognito_id=cognito_id, include_inactive=include_inactive)
+    analytics = compute_portfolio_analytics(arrays, rates, base_currency=base_currency, top_n=top_n)
+    
+    return PortfolioAnalyticsResponse(cognito_id=cognito_id, base_currency=base_currency, **analytics)
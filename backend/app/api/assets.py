@@ -1,15 +1,87 @@
-from typing import Optional
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from ..config import settings
 from ..database import get_db
 from ..models.asset import Asset
-from ..schemas.asset import AssetListResponse
+from ..models.asset_detail import DETAIL_FIELDS, AssetDetail
+from ..schemas.asset import (
+    AssetListResponse,
+    AssetResponse,
+    AssetSummaryResponse,
+    CategorySummary,
+    SubcategorySummary,
+)
+from ..utils.events import asset_change_broker, format_sse
+from ..utils.export import EXPORT_FORMATS, iter_export_chunks
+from ..utils.fx import UnknownCurrencyError, fx_rate_cache
 
 router = APIRouter(prefix="/assets", tags=["assets"])
 
 
+def parse_include(include: Optional[str]) -> list[str]:
+    """Parse a comma-separated `include` parameter into detail field names."""
+    if not include:
+        return []
+    fields = [field.strip() for field in include.split(",") if field.strip()]
+    if "details" in fields:
+        return list(DETAIL_FIELDS)
+    unknown = sorted(set(fields) - set(DETAIL_FIELDS))
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown include fields: {', '.join(unknown)}",
+        )
+    return fields
+
+
+# Sortable columns; each is backed by an index in models/asset.py
+SORT_FIELDS = {
+    "balance_current": Asset.balance_current,
+    "balance_as_of": Asset.balance_as_of,
+    "modification_date": Asset.modification_date,
+}
+
+
+def parse_sort(sort: Optional[str]) -> list:
+    """
+    Parse a `sort` parameter such as "-balance_current" into ORDER BY clauses.
+    
+    Missing values sort lowest: last when descending, first when ascending.
+    Ties are broken by wid so pages are stable.
+    """
+    if not sort:
+        return [Asset.wid]
+    field = sort.removeprefix("-")
+    if field not in SORT_FIELDS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown sort field: {field}. Expected one of: {', '.join(SORT_FIELDS)}",
+        )
+    column = SORT_FIELDS[field]
+    if sort.startswith("-"):
+        return [column.desc().nulls_last(), Asset.wid.desc()]
+    return [column.asc().nulls_first(), Asset.wid.asc()]
+
+
+def to_asset_response(asset: Asset, include: list[str]) -> AssetResponse:
+    """Build an asset response, copying in the requested detail fields."""
+    response = AssetResponse.model_validate(asset)
+    if include and asset.details is not None:
+        response = response.model_copy(
+            update={field: getattr(asset.details, field) for field in include}
+        )
+    return response
+
+
 @router.get("", response_model=AssetListResponse)
 def list_assets(
     db: Session = Depends(get_db),
@@ -18,6 +90,13 @@ def list_assets(
     wealth_asset_type: Optional[str] = Query(None, description="Filter by asset type"),
     primary_asset_category: Optional[str] = Query(None, description="Filter by category"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    institution_id: Optional[int] = Query(None, description="Filter by institution"),
+    balance_current_min: Optional[float] = Query(None, description="Minimum current balance"),
+    balance_current_max: Optional[float] = Query(None, description="Maximum current balance"),
+    balance_as_of_after: Optional[datetime] = Query(None, description="Balances as of this time or later"),
+    balance_as_of_before: Optional[datetime] = Query(None, description="Balances as of before this time"),
+    sort: Optional[str] = Query(None, description="Sort field, prefixed with - for descending"),
+    include: Optional[str] = Query(None, description="Comma-separated detail fields to include"),
 ) -> AssetListResponse:
     """
     List all assets with optional filtering and pagination.
@@ -27,7 +106,18 @@ def list_assets(
     - **wealth_asset_type**: Filter by asset type (e.g., "Cash", "Investment")
     - **primary_asset_category**: Filter by category (e.g., "Cash", "Retirement")
     - **is_active**: Filter by active status (true/false)
+    - **institution_id**: Filter by institution
+    - **balance_current_min** / **balance_current_max**: Inclusive balance range
+    - **balance_as_of_after** / **balance_as_of_before**: Balance date range
+      (after is inclusive, before is exclusive)
+    - **sort**: One of "balance_current", "balance_as_of" or
+      "modification_date", prefixed with "-" for descending, e.g.
+      "-balance_current" for the largest assets first
+    - **include**: Detail fields to load, e.g. "holdings,ownership", or
+      "details" for all of them. Omitted fields are returned as null.
     """
+    include_fields = parse_include(include)
+    order_by = parse_sort(sort)
     query = db.query(Asset)
     
     # Apply filters
@@ -37,6 +127,16 @@ def list_assets(
         query = query.filter(Asset.primary_asset_category == primary_asset_category)
     if is_active is not None:
         query = query.filter(Asset.is_active == is_active)
+    if institution_id is not None:
+        query = query.filter(Asset.institution_id == institution_id)
+    if balance_current_min is not None:
+        query = query.filter(Asset.balance_current >= balance_current_min)
+    if balance_current_max is not None:
+        query = query.filter(Asset.balance_current <= balance_current_max)
+    if balance_as_of_after is not None:
+        query = query.filter(Asset.balance_as_of >= balance_as_of_after)
+    if balance_as_of_before is not None:
+        query = query.filter(Asset.balance_as_of < balance_as_of_before)
     
     # Get total count
     total = query.count()
@@ -45,14 +145,189 @@ def list_assets(
     skip = (page - 1) * page_size
     pages = (total + page_size - 1) // page_size if total > 0 else 1
     
-    # Get paginated results
-    assets = query.offset(skip).limit(page_size).all()
+    # Get paginated results, loading only the requested detail columns
+    if include_fields:
+        query = query.options(
+            selectinload(Asset.details).load_only(
+                *(getattr(AssetDetail, field) for field in include_fields)
+            )
+        )
+    assets = query.order_by(*order_by).offset(skip).limit(page_size).all()
     
     return AssetListResponse(
-        items=assets,
+        items=[to_asset_response(asset, include_fields) for asset in assets] if include_fields else assets,
         total=total,
         page=page,
         page_size=page_size,
         pages=pages,
     )
 
+
+@router.get("/summary", response_model=AssetSummaryResponse)
+def summarize_assets(
+    db: Session = Depends(get_db),
+    base_currency: str = Query(settings.default_currency, min_length=3, max_length=10, description="Currency to report totals in"),
+    wealth_asset_type: Optional[str] = Query(None, description="Filter by asset type"),
+    primary_asset_category: Optional[str] = Query(None, description="Filter by category"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+) -> AssetSummaryResponse:
+    """
+    Balance totals by category and subcategory, converted to one currency.
+    
+    - **base_currency**: Currency code to convert totals to (default USD)
+    - **wealth_asset_type**, **primary_asset_category**, **is_active**:
+      Same filters as the asset listing
+    
+    The database sums balances per (category, type, currency), and only those
+    group rows are converted, using the cached exchange rates. Assets without
+    a `currency_code` are treated as the default currency. Balances in a
+    currency with no known rate are left out of the totals; their currencies
+    are listed in `unconverted_currencies` and the number of assets left out
+    is `unconverted_count`.
+    """
+    rates = fx_rate_cache.get(db)
+    try:
+        rates.rate(base_currency)
+    except UnknownCurrencyError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    category = func.coalesce(Asset.primary_asset_category, "Other")
+    subcategory = func.coalesce(Asset.wealth_asset_type, "Other")
+    currency = func.upper(func.coalesce(Asset.currency_code, settings.default_currency))
+    query = select(
+        category,
+        subcategory,
+        currency,
+        func.count(),
+        func.coalesce(func.sum(Asset.balance_current), 0.0),
+    ).group_by(category, subcategory, currency)
+    
+    # Apply filters
+    if wealth_asset_type is not None:
+        query = query.where(Asset.wealth_asset_type == wealth_asset_type)
+    if primary_asset_category is not None:
+        query = query.where(Asset.primary_asset_category == primary_asset_category)
+    if is_active is not None:
+        query = query.where(Asset.is_active == is_active)
+    
+    rows = db.execute(query).all()
+    
+    # Convert every group total in one vectorized pass
+    currencies = np.array([row[2] for row in rows], dtype=str)
+    amounts = np.array([row[4] for row in rows], dtype=float)
+    converted = rates.convert_array(amounts, currencies, base_currency.upper())
+    
+    categories: dict[str, dict[str, list]] = {}
+    unconverted: set[str] = set()
+    unconverted_count = 0
+    for (cat, subcat, code, count, _), value in zip(rows, converted):
+        if np.isnan(value):
+            unconverted.add(code)
+            unconverted_count += count
+            value = 0.0
+        totals = categories.setdefault(cat, {}).setdefault(subcat, [0.0, 0])
+        totals[0] += value
+        totals[1] += count
+    
+    category_summaries = [
+        CategorySummary(
+            name=cat,
+            total=sum(total for total, _ in subcats.values()),
+            count=sum(count for _, count in subcats.values()),
+            subcategories=[
+                SubcategorySummary(name=name, total=total, count=count)
+                for name, (total, count) in sorted(subcats.items())
+            ],
+        )
+        for cat, subcats in sorted(categories.items())
+    ]
+    
+    return AssetSummaryResponse(
+        base_currency=base_currency.upper(),
+        fx_version=rates.version,
+        total=sum(c.total for c in category_summaries),
+        count=sum(c.count for c in category_summaries),
+        categories=category_summaries,
+        unconverted_currencies=sorted(unconverted),
+        unconverted_count=unconverted_count,
+    )
+
+
+@router.get("/stream")
+async def stream_asset_changes(request: Request) -> StreamingResponse:
+    """
+    Stream asset changes as server-sent events.
+    
+    Emits an `assets_changed` event listing the wids of inserted and updated
+    assets, batched over a short window. A `resync` event means changes were
+    too numerous or the client fell behind, and it should refetch the list.
+    Comment heartbeats keep idle connections open through proxies.
+    """
+    queue = asset_change_broker.subscribe()
+    
+    async def event_stream():
+        try:
+            yield ": connected\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(
+                        queue.get(), timeout=settings.asset_events_heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(message)
+        finally:
+            asset_change_broker.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/export")
+def export_assets(
+    db: Session = Depends(get_db),
+    format: Literal["parquet", "arrow"] = Query("parquet", description="Export file format"),
+) -> StreamingResponse:
+    """
+    Export the full assets table in a columnar format.
+    
+    - **format**: `parquet` (zstd-compressed Parquet file) or `arrow`
+      (Arrow IPC stream)
+    
+    Rows are streamed from a server-side cursor as typed record batches, so
+    large snapshots never need to be held in memory or encoded as JSON.
+    """
+    def export_stream():
+        try:
+            yield from iter_export_chunks(db, format)
+        finally:
+            db.close()
+    
+    extension = "parquet" if format == "parquet" else "arrows"
+    return StreamingResponse(
+        export_stream(),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="assets.{extension}"'},
+    )
+
+
+@router.get("/{wid}", response_model=AssetResponse)
+def get_asset(wid: uuid.UUID, db: Session = Depends(get_db)) -> AssetResponse:
+    """
+    Get a single asset, including its detail fields (vendor response,
+    holdings, ownership, beneficiary composition and estate plan).
+    """
+    asset = (
+        db.query(Asset)
+        .options(joinedload(Asset.details))
+        .filter(Asset.wid == wid)
+        .first()
+    )
+    if asset is None:
+        raise HTTPException(status_code=404, detail=f"Asset not found: {wid}")
+    
+    return to_asset_response(asset, list(DETAIL_FIELDS))
@@ -0,0 +1,164 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import Float, String, column, func, select, values
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import get_db
+from ..models.asset import Asset
+from ..models.holding import AssetHolding
+from ..schemas.holding import (
+    ExposureEntry,
+    ExposureResponse,
+    HoldingListResponse,
+    HoldingResponse,
+)
+from ..utils.fx import UnknownCurrencyError, fx_rate_cache
+
+router = APIRouter(prefix="/holdings", tags=["holdings"])
+
+
+@router.get("", response_model=HoldingListResponse)
+def list_holdings(
+    db: Session = Depends(get_db),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    symbol: Optional[str] = Query(None, description="Filter by security symbol"),
+    minor_asset_class: Optional[str] = Query(None, description="Filter by asset class"),
+    cognito_id: Optional[str] = Query(None, description="Filter by user"),
+) -> HoldingListResponse:
+    """
+    List individual positions, e.g. everyone holding a given symbol.
+    
+    - **symbol**: Filter by security symbol (case-insensitive, e.g. "BTC")
+    - **minor_asset_class**: Filter by asset class (e.g. "PrivateEquity")
+    - **cognito_id**: Filter by the owning user
+    """
+    query = (
+        db.query(
+            AssetHolding.asset_wid,
+            Asset.cognito_id,
+            Asset.currency_code,
+            AssetHolding.symbol,
+            AssetHolding.major_asset_class,
+            AssetHolding.minor_asset_class,
+            AssetHolding.quantity,
+            AssetHolding.price,
+            AssetHolding.value,
+            AssetHolding.cost_basis,
+        )
+        .join(Asset, Asset.wid == AssetHolding.asset_wid)
+    )
+    
+    # Apply filters
+    if symbol is not None:
+        query = query.filter(AssetHolding.symbol == symbol.upper())
+    if minor_asset_class is not None:
+        query = query.filter(AssetHolding.minor_asset_class == minor_asset_class)
+    if cognito_id is not None:
+        query = query.filter(Asset.cognito_id == cognito_id)
+    
+    # Get total count
+    total = query.count()
+    
+    # Calculate pagination
+    skip = (page - 1) * page_size
+    pages = (total + page_size - 1) // page_size if total > 0 else 1
+    
+    # Get paginated results, largest positions first
+    holdings = (
+        query.order_by(AssetHolding.value.desc().nulls_last(), AssetHolding.id)
+        .offset(skip)
+        .limit(page_size)
+        .all()
+    )
+    
+    return HoldingListResponse(
+        items=[HoldingResponse.model_validate(holding) for holding in holdings],
+        total=total,
+        page=page,
+        page_size=page_size,
+        pages=pages,
+    )
+
+
+@router.get("/exposure", response_model=ExposureResponse)
+def holdings_exposure(
+    db: Session = Depends(get_db),
+    group_by: Literal["symbol", "minor_asset_class", "major_asset_class"] = Query(
+        "symbol", description="Aggregate by security or by asset class"
+    ),
+    base_currency: str = Query(settings.default_currency, min_length=3, max_length=10, description="Currency to report values in"),
+    cognito_id: Optional[str] = Query(None, description="Limit to one user's positions"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of entries"),
+) -> ExposureResponse:
+    """
+    Aggregate exposure per security or asset class across assets and users.
+    
+    Values are converted to **base_currency** inside the aggregate query by
+    joining against the cached exchange rates; positions in a currency with
+    no known rate are left out and listed in `unconverted_currencies`.
+    """
+    rates = fx_rate_cache.get(db)
+    base_currency = base_currency.upper()
+    try:
+        base_rate = rates.rate(base_currency)
+    except UnknownCurrencyError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    fx = values(
+        column("currency_code", String),
+        column("factor", Float),
+        name="fx",
+    ).data([(code, rate / base_rate) for code, rate in rates.rates.items()])
+    
+    key = getattr(AssetHolding, group_by)
+    currency = func.upper(func.coalesce(Asset.currency_code, settings.default_currency))
+    query = (
+        select(
+            key,
+            func.sum(AssetHolding.value * fx.c.factor),
+            func.sum(AssetHolding.quantity),
+            func.sum(AssetHolding.cost_basis * fx.c.factor),
+            func.count(),
+            func.count(func.distinct(AssetHolding.asset_wid)),
+            func.count(func.distinct(Asset.cognito_id)),
+        )
+        .join(Asset, Asset.wid == AssetHolding.asset_wid)
+        .join(fx, fx.c.currency_code == currency)
+        .where(key.is_not(None))
+        .group_by(key)
+        .order_by(func.sum(AssetHolding.value * fx.c.factor).desc().nulls_last())
+        .limit(limit)
+    )
+    unconverted_query = (
+        select(currency)
+        .select_from(AssetHolding)
+        .join(Asset, Asset.wid == AssetHolding.asset_wid)
+        .where(key.is_not(None), currency.not_in(list(rates.rates)))
+        .distinct()
+    )
+    if cognito_id is not None:
+        query = query.where(Asset.cognito_id == cognito_id)
+        unconverted_query = unconverted_query.where(Asset.cognito_id == cognito_id)
+    
+    items = [
+        ExposureEntry(
+            key=row[0],
+            value=row[1] or 0.0,
+            quantity=row[2],
+            cost_basis=row[3],
+            position_count=row[4],
+            asset_count=row[5],
+            user_count=row[6],
+        )
+        for row in db.execute(query)
+    ]
+    
+    return ExposureResponse(
+        group_by=group_by,
+        base_currency=base_currency,
+        items=items,
+        unconverted_currencies=sorted(db.execute(unconverted_query).scalars()),
+    )
@@ -1,28 +1,98 @@
-from fastapi import APIRouter, Depends, HTTPException
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from ..database import get_db
-from ..utils.seed import seed_database, get_seed_data_path
+from ..models.seed_job import SeedJob
+from ..utils.seed import get_seed_data_path
+from ..utils.seed_jobs import FINISHED_STATUSES, job_progress, seed_job_runner
 
 router = APIRouter(prefix="/seed", tags=["seed"])
 
 
-class SeedResponse(BaseModel):
-    """Response model for seed operation."""
-    message: str
+class SeedJobResponse(BaseModel):
+    """Response model for a background seed job."""
+    id: uuid.UUID
+    status: str
+    sync: bool
+    deactivate_missing: bool
+    cancel_requested: bool
+    total_rows: Optional[int]
+    processed_rows: int
     inserted: int
+    updated: int
+    unchanged: int
     skipped: int
+    deactivated: int
     errors: list[str]
+    attempts: int
+    rows_per_second: Optional[float]
+    eta_seconds: Optional[float]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+
+def to_job_response(job: SeedJob) -> SeedJobResponse:
+    """Build a job response, including throughput and ETA."""
+    rows_per_second, eta_seconds = job_progress(job)
+    return SeedJobResponse(
+        id=job.id,
+        status=job.status,
+        sync=job.sync,
+        deactivate_missing=job.deactivate_missing,
+        cancel_requested=job.cancel_requested,
+        total_rows=job.total_rows,
+        processed_rows=job.processed_rows,
+        inserted=job.inserted,
+        updated=job.updated,
+        unchanged=job.unchanged,
+        skipped=job.skipped,
+        deactivated=job.deactivated,
+        errors=job.errors,
+        attempts=job.attempts,
+        rows_per_second=rows_per_second,
+        eta_seconds=eta_seconds,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+def job_session_factory(db: Session) -> sessionmaker:
+    """Sessions for jobs, which outlive the request's session, on the same database."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=db.get_bind())
 
 
-@router.post("", response_model=SeedResponse)
-def seed_assets(db: Session = Depends(get_db)) -> SeedResponse:
+def get_job_or_404(db: Session, job_id: uuid.UUID) -> SeedJob:
+    job = db.get(SeedJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Seed job not found: {job_id}")
+    return job
+
+
+@router.post("", response_model=SeedJobResponse, status_code=202)
+def seed_assets(
+    db: Session = Depends(get_db),
+    sync: bool = Query(False, description="Update changed assets instead of skipping existing ones"),
+    deactivate_missing: bool = Query(False, description="With sync, deactivate assets missing from the file"),
+) -> SeedJobResponse:
     """
-    Seed the database with asset data from the default seed file.
+    Start seeding the database with asset data from the default seed file.
+    
+    This endpoint returns a job straight away; assets from
+    `backend/data/assets.json` are inserted on a background thread,
+    committing every `SEED_CHUNK_SIZE` rows. A job interrupted by a restart
+    or a dead worker is resumed from its last chunk. Assets that already exist (by asset_id)
+    are skipped. Poll `GET /seed/{job_id}` for progress.
     
-    This endpoint loads assets from `backend/data/assets.json` and inserts
-    them into the database. Assets that already exist (by wid) are skipped.
+    - **sync**: Incrementally sync instead: new assets are inserted, assets
+      whose content changed are updated and unchanged ones are left alone
+    - **deactivate_missing**: With sync, mark assets not in the file inactive
     
     **Note**: This endpoint is intended for development and testing purposes.
     """
@@ -34,25 +104,48 @@ def seed_assets(db: Session = Depends(get_db)) -> SeedResponse:
             detail=f"Seed file not found: {seed_file}"
         )
     
-    try:
-        result = seed_database(db)
-    except Exception as e:
+    job = SeedJob(
+        sync=sync,
+        deactivate_missing=deactivate_missing and sync,
+        file_path=str(seed_file),
+        heartbeat_at=datetime.now(timezone.utc),
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    
+    # Run on the app's job pool rather than as a request background task,
+    # which would hold the request (and its admission slot) open until done
+    seed_job_runner.submit(job_session_factory(db), job.id)
+    
+    return to_job_response(job)
+
+
+@router.get("/{job_id}", response_model=SeedJobResponse)
+def get_seed_job(job_id: uuid.UUID, db: Session = Depends(get_db)) -> SeedJobResponse:
+    """
+    Get the progress of a seed job: rows processed, counts, errors,
+    throughput (rows per second) and estimated seconds remaining.
+    """
+    return to_job_response(get_job_or_404(db, job_id))
+
+
+@router.post("/{job_id}/cancel", response_model=SeedJobResponse)
+def cancel_seed_job(job_id: uuid.UUID, db: Session = Depends(get_db)) -> SeedJobResponse:
+    """
+    Request cancellation of a seed job.
+    
+    The job stops before its next chunk; chunks already committed are kept.
+    """
+    job = get_job_or_404(db, job_id)
+    if job.status in FINISHED_STATUSES:
         raise HTTPException(
-            status_code=500,
-            detail=f"Error seeding database: {str(e)}"
+            status_code=409,
+            detail=f"Seed job already {job.status}"
         )
     
-    if result.inserted > 0:
-        message = f"Successfully seeded {result.inserted} assets"
-    elif result.skipped > 0:
-        message = f"All {result.skipped} assets already exist in the database"
-    else:
-        message = "No assets were processed"
-    
-    return SeedResponse(
-        message=message,
-        inserted=result.inserted,
-        skipped=result.skipped,
-        errors=result.errors,
-    )
-
+    job.cancel_requested = True
+    db.commit()
+    db.refresh(job)
+    
+    return to_job_response(job)
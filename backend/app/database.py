@@ -3,7 +3,35 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 
 from .config import settings
 
-engine = create_engine(settings.database_url)
+
+def pool_limits(connection_budget: int, workers: int) -> tuple[int, int]:
+    """
+    Split a global connection budget evenly across worker processes.
+    
+    One connection per worker is left for the asset change LISTEN connection;
+    the rest is divided between the persistent pool and overflow, so
+    ``workers * (pool_size + max_overflow + 1)`` never exceeds the budget.
+    
+    Returns:
+        Tuple of (pool_size, max_overflow) for each worker's engine.
+    
+    Raises:
+        ValueError: If the budget leaves a worker fewer than two connections.
+    """
+    workers = max(1, workers)
+    per_worker = connection_budget // workers
+    if per_worker < 2:
+        raise ValueError(
+            f"DB_CONNECTION_BUDGET={connection_budget} is too small for {workers} workers; "
+            f"each worker needs at least 2 connections"
+        )
+    usable = per_worker - 1
+    pool_size = max(1, usable // 2)
+    return pool_size, usable - pool_size
+
+
+pool_size, max_overflow = pool_limits(settings.db_connection_budget, settings.web_concurrency or 1)
+engine = create_engine(settings.database_url, pool_size=pool_size, max_overflow=max_overflow)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -3,19 +3,38 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .api.analytics import router as analytics_router
 from .api.assets import router as assets_router
+from .api.holdings import router as holdings_router
 from .api.seed import router as seed_router
 from .config import settings
-from .database import create_tables
+from .database import SessionLocal, create_tables, engine, max_overflow, pool_size
+from .middleware import (
+    AdmissionControlMiddleware,
+    CompressionMiddleware,
+    QueryProfilingMiddleware,
+    RequestCoalescingMiddleware,
+)
+from .utils.events import asset_change_broker
+from .utils.profiling import install_query_profiling
+from .utils.seed_jobs import seed_job_runner
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
-    # Startup: Create database tables
-    create_tables()
+    # Startup: Create database tables (done once by the master process when
+    # running under gunicorn)
+    if settings.create_tables_on_startup:
+        create_tables()
+    # Resume seed jobs interrupted by the last shutdown, and keep taking over
+    # jobs whose worker died
+    seed_job_runner.start(SessionLocal)
     yield
-    # Shutdown: Nothing to clean up
+    # Shutdown: Release the shared asset change listener, and stop seed jobs
+    # after their current chunk so the next worker resumes them
+    asset_change_broker.close()
+    seed_job_runner.close()
 
 
 app = FastAPI(
@@ -25,7 +44,56 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Configure CORS for frontend access
+# Time every statement, log slow ones, and count statements per request to
+# warn about N+1 patterns
+if settings.sql_profiling_enabled or settings.sql_slow_query_ms:
+    install_query_profiling(
+        engine,
+        slow_query_ms=settings.sql_slow_query_ms,
+        explain_slow_queries=settings.sql_explain_slow_queries,
+    )
+if settings.sql_profiling_enabled:
+    app.add_middleware(
+        QueryProfilingMiddleware,
+        n_plus_one_threshold=settings.sql_n_plus_one_threshold,
+    )
+
+# Shed load with 503 once more requests are queued than the pool can absorb.
+# The change stream holds no pooled connection, so it is not counted.
+if settings.admission_control_enabled:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        max_concurrent=settings.admission_max_concurrent or pool_size + max_overflow,
+        max_queue=settings.admission_max_queue,
+        retry_after_seconds=settings.admission_retry_after_seconds,
+        path_prefix=settings.api_v1_prefix,
+        exempt_paths=[f"{settings.api_v1_prefix}/assets/stream"],
+    )
+
+# Identical concurrent list and summary requests share one execution
+if settings.request_coalescing_enabled:
+    app.add_middleware(
+        RequestCoalescingMiddleware,
+        paths=[
+            f"{settings.api_v1_prefix}/assets",
+            f"{settings.api_v1_prefix}/assets/summary",
+        ],
+    )
+
+# Compress large JSON responses for clients that accept it
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+        zstd_level=settings.compression_zstd_level,
+        cache_max_bytes=settings.compression_cache_max_bytes,
+    )
+
+# Configure CORS for frontend access. Added last so it wraps every other
+# middleware: coalesced, cached and shed responses are shared between
+# callers, and must get CORS headers for each caller's own Origin
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -37,6 +105,8 @@ app.add_middleware(
 # Include routers
 app.include_router(assets_router, prefix=settings.api_v1_prefix)
 app.include_router(seed_router, prefix=settings.api_v1_prefix)
+app.include_router(analytics_router, prefix=settings.api_v1_prefix)
+app.include_router(holdings_router, prefix=settings.api_v1_prefix)
 
 
 @app.get("/health")
@@ -0,0 +1,11 @@
+from .admission import AdmissionControlMiddleware
+from .coalescing import RequestCoalescingMiddleware
+from .compression import CompressionMiddleware
+from .profiling import QueryProfilingMiddleware
+
+__all__ = [
+    "AdmissionControlMiddleware",
+    "CompressionMiddleware",
+    "QueryProfilingMiddleware",
+    "RequestCoalescingMiddleware",
+]
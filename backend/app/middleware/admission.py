@@ -0,0 +1,77 @@
+import asyncio
+import json
+from typing import Iterable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class AdmissionControlMiddleware:
+    """
+    Cap the number of concurrent database-bound requests.
+
+    At most ``max_concurrent`` requests under ``path_prefix`` run at once;
+    up to ``max_queue`` more wait for a slot. Past that, requests are shed
+    immediately with ``503 Service Unavailable`` and a ``Retry-After`` header
+    rather than piling up on the connection pool.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrent: int,
+        max_queue: int = 64,
+        retry_after_seconds: int = 1,
+        path_prefix: str = "/",
+        exempt_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.retry_after_seconds = retry_after_seconds
+        self.path_prefix = path_prefix
+        self.exempt_paths = frozenset(exempt_paths)
+        self.shed = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or not path.startswith(self.path_prefix)
+            or path in self.exempt_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            self.shed += 1
+            await self._reject(send)
+            return
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._semaphore.release()
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": "Server is busy, please retry"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(self.retry_after_seconds).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
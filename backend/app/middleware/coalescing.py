@@ -0,0 +1,94 @@
+import asyncio
+from typing import Iterable
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# (response start message, complete body) shared with coalesced requests
+CapturedResponse = tuple[Message, bytes]
+
+# Request headers that can change a response; requests only share a response
+# when these match. CORS headers are added outside this middleware.
+KEY_HEADERS = (b"authorization", b"cookie")
+
+
+def request_key(scope: Scope) -> str:
+    """
+    Identify a GET request by its path, order-independent query string and
+    the credential headers in ``KEY_HEADERS``.
+    """
+    query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+    headers = sorted(
+        (name, value) for name, value in scope.get("headers", []) if name in KEY_HEADERS
+    )
+    key = f"{scope['path']}?{urlencode(sorted(query))}"
+    if headers:
+        key += "\n" + "\n".join(f"{name.decode()}: {value.decode('latin-1')}" for name, value in headers)
+    return key
+
+
+class RequestCoalescingMiddleware:
+    """
+    Single-flight execution of identical concurrent GET requests.
+
+    The first request for a key runs normally; requests for the same path and
+    query arriving while it is in flight wait for it and are sent a copy of its
+    response instead of running their own queries. Nothing is kept once the
+    leading request completes, so results are never served stale.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.coalesced = 0
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        key = request_key(scope)
+        leader = self._in_flight.get(key)
+        if leader is not None:
+            captured = await asyncio.shield(leader)
+            # The leading request failed; run this one on its own
+            if captured is None:
+                await self.app(scope, receive, send)
+                return
+            self.coalesced += 1
+            await self._replay(captured, send)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            captured = await self._capture(scope, receive)
+            future.set_result(captured)
+        finally:
+            del self._in_flight[key]
+            if not future.done():
+                future.set_result(None)
+        await self._replay(captured, send)
+
+    async def _capture(self, scope: Scope, receive: Receive) -> CapturedResponse:
+        start_message: Message | None = None
+        body_parts: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+            elif message["type"] == "http.response.body":
+                body_parts.append(message.get("body", b""))
+
+        await self.app(scope, receive, send_wrapper)
+        assert start_message is not None
+        return start_message, b"".join(body_parts)
+
+    @staticmethod
+    async def _replay(captured: CapturedResponse, send: Send) -> None:
+        start_message, body = captured
+        # Each caller gets its own copy: outer middleware may rewrite headers
+        await send({**start_message, "headers": list(start_message["headers"])})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,234 @@
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Callable
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Content types worth compressing. Event streams are deliberately excluded:
+# they are never buffered and must reach the client as soon as they are sent.
+COMPRESSIBLE_TYPES = ("application/json", "text/plain", "text/html", "text/csv")
+
+# Payloads above this size are compressed off the event loop.
+THREADPOOL_THRESHOLD = 256 * 1024
+
+
+class CompressedPayloadCache:
+    """
+    Size-bounded LRU of compressed response bodies.
+
+    Entries are keyed by a digest of the uncompressed body plus the encoding,
+    so any request that produces an identical payload (the same asset page
+    requested by many dashboards) reuses the bytes compressed the first time.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[bytes, str], bytes] = OrderedDict()
+
+    def get(self, key: tuple[bytes, str]) -> bytes | None:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: tuple[bytes, str], value: bytes) -> None:
+        if len(value) > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = value
+        self.current_bytes += len(value)
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+def build_compressors(
+    gzip_level: int, brotli_quality: int, zstd_level: int
+) -> dict[str, Callable[[bytes], bytes]]:
+    """Return the available encoders, in server preference order."""
+    compressors: dict[str, Callable[[bytes], bytes]] = {}
+    if zstandard is not None:
+        compressors["zstd"] = lambda body: zstandard.ZstdCompressor(
+            level=zstd_level
+        ).compress(body)
+    if brotli is not None:
+        compressors["br"] = lambda body: brotli.compress(body, quality=brotli_quality)
+    compressors["gzip"] = lambda body: gzip.compress(
+        body, compresslevel=gzip_level, mtime=0
+    )
+    return compressors
+
+
+def negotiate_encoding(accept_encoding: str, available: list[str]) -> str | None:
+    """
+    Pick a content coding from an Accept-Encoding header.
+
+    The highest q-value wins; ties go to the earliest entry in ``available``.
+    Returns None when the client accepts none of the available encodings.
+    """
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Negotiated gzip / brotli / zstd response compression.
+
+    Only complete (non-streaming) responses of a compressible content type and
+    at least ``minimum_size`` bytes are compressed. Compressed bodies of
+    successful GET responses are cached, so repeated identical payloads skip
+    recompression.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        zstd_level: int = 3,
+        cache_max_bytes: int = 32 * 1024 * 1024,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressors = build_compressors(gzip_level, brotli_quality, zstd_level)
+        self.cache = CompressedPayloadCache(cache_max_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(
+            request_headers.get("accept-encoding", ""), list(self.compressors)
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        cacheable_request = scope["method"] in ("GET", "HEAD")
+        start_message: Message | None = None
+        passthrough = False
+        body_parts: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                passthrough = (
+                    "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                )
+                if passthrough:
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                if len(body_parts) == 1:
+                    # Streaming response: send it as-is rather than buffering.
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                return
+
+            body = b"".join(body_parts)
+            await self._send_complete(
+                start_message, body, encoding, cacheable_request, send
+            )
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_complete(
+        self,
+        start_message: Message,
+        body: bytes,
+        encoding: str,
+        cacheable_request: bool,
+        send: Send,
+    ) -> None:
+        # Rewrite a copy; the start message may be shared with other requests
+        start_message = {**start_message, "headers": list(start_message["headers"])}
+        headers = MutableHeaders(raw=start_message["headers"])
+        headers.add_vary_header("Accept-Encoding")
+
+        if len(body) < self.minimum_size:
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        cacheable = (
+            cacheable_request
+            and start_message["status"] == 200
+            and "no-store" not in headers.get("cache-control", "")
+        )
+        compressed = None
+        if cacheable:
+            key = (hashlib.blake2b(body, digest_size=16).digest(), encoding)
+            compressed = self.cache.get(key)
+
+        if compressed is None:
+            compress = self.compressors[encoding]
+            if len(body) > THREADPOOL_THRESHOLD:
+                compressed = await run_in_threadpool(compress, body)
+            else:
+                compressed = compress(body)
+            if cacheable:
+                self.cache.put(key, compressed)
+
+        headers["Content-Encoding"] = encoding
+        headers["Content-Length"] = str(len(compressed))
+        await send(start_message)
+        await send({"type": "http.response.body", "body": compressed})
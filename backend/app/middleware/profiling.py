@@ -0,0 +1,49 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..utils.profiling import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryProfilingMiddleware:
+    """
+    Count the SQL statements each request executes.
+
+    Adds ``X-Query-Count`` and a ``Server-Timing`` entry for database time to
+    every response, and logs a warning when one statement shape runs at least
+    ``n_plus_one_threshold`` times in a request, the signature of an N+1 loop.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 5):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-Query-Count"] = str(stats.count)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.total_seconds * 1000:.1f};desc="{stats.count} queries"',
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        for statement, count in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "Possible N+1 in %s %s: statement ran %d times: %s",
+                scope["method"],
+                scope["path"],
+                count,
+                " ".join(statement.split()),
+            )
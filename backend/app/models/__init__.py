@@ -1,4 +1,7 @@
 from .asset import Asset
+from .asset_detail import AssetDetail
+from .fx_rate import FxRate
+from .holding import AssetHolding
+from .seed_job import SeedJob
 
-__all__ = ["Asset"]
-
+__all__ = ["Asset", "AssetDetail", "AssetHolding", "FxRate", "SeedJob"]
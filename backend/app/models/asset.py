@@ -2,10 +2,11 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Float, String, Text
+from sqlalchemy import DDL, Boolean, DateTime, Float, Index, Integer, String, Text, event
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from ..config import settings
 from ..database import Base
 
 
@@ -60,20 +61,15 @@ class Asset(Base):
     
     # Owner fields
     asset_owner_name: Mapped[Optional[str]] = mapped_column(String(255))
-    ownership: Mapped[Optional[str]] = mapped_column(Text)
-    beneficiary_composition: Mapped[Optional[str]] = mapped_column(Text)
     
     # Vendor fields
     vendor_account_type: Mapped[Optional[str]] = mapped_column(String(100))
     vendor_container: Mapped[Optional[str]] = mapped_column(String(100))
-    vendor_response: Mapped[Optional[str]] = mapped_column(Text)
     vendor_response_type: Mapped[Optional[str]] = mapped_column(String(100))
     
     # Additional metadata
     asset_mask: Mapped[Optional[str]] = mapped_column(String(50))
     currency_code: Mapped[Optional[str]] = mapped_column(String(10))
-    description_estate_plan: Mapped[Optional[str]] = mapped_column(Text)
-    holdings: Mapped[Optional[str]] = mapped_column(Text)
     logo_name: Mapped[Optional[str]] = mapped_column(String(255))
     note: Mapped[Optional[str]] = mapped_column(Text)
     note_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
@@ -88,6 +84,112 @@ class Asset(Base):
     next_update: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     deactivate_by: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
+    # SHA-256 of the source feed record, used by incremental syncs to skip
+    # unchanged assets
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    
+    # Consecutive failed vendor refreshes, used for backoff by the refresh
+    # scheduler (see app/utils/refresh.py)
+    refresh_failures: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    
+    # Large payloads (vendor_response, holdings, ownership, beneficiary
+    # composition, estate plan) live in asset_details. Loading them must be
+    # explicit, so an ORM access never drags them into a list query.
+    details: Mapped[Optional["AssetDetail"]] = relationship(  # noqa: F821
+        back_populates="asset",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
+    
     def __repr__(self) -> str:
         return f"<Asset(wid={self.wid}, nickname={self.nickname}, type={self.wealth_asset_type})>"
 
+
+# Columns added to assets after it was first released. create_all never alters
+# an existing table, so they are added here, idempotently, before anything
+# that depends on them.
+asset_columns_ddl = DDL(
+    """
+    ALTER TABLE assets ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+    ALTER TABLE assets ADD COLUMN IF NOT EXISTS refresh_failures INTEGER NOT NULL DEFAULT 0;
+    """
+)
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    asset_columns_ddl.execute_if(dialect="postgresql"),
+)
+
+
+# Publish a NOTIFY for every inserted or updated asset row so the change
+# stream (see app/utils/events.py) can push updates to connected clients.
+# Notifications are delivered on commit, and identical payloads raised in the
+# same transaction are folded by Postgres.
+asset_notify_ddl = DDL(
+    f"""
+    CREATE OR REPLACE FUNCTION notify_asset_change() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify(
+            '{settings.asset_events_channel}',
+            json_build_object('op', lower(TG_OP), 'wid', NEW.wid)::text
+        );
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS assets_notify_change ON assets;
+    CREATE TRIGGER assets_notify_change
+        AFTER INSERT OR UPDATE ON assets
+        FOR EACH ROW EXECUTE FUNCTION notify_asset_change();
+    """
+)
+
+# Attached to the metadata rather than the table so the idempotent DDL also
+# runs against databases whose assets table predates the trigger.
+event.listen(
+    Base.metadata,
+    "after_create",
+    asset_notify_ddl.execute_if(dialect="postgresql"),
+)
+
+
+# Indexes backing the list endpoint's range filters and sort orders. Each sort
+# index is descending with nulls last and ends in wid, matching the endpoint's
+# ORDER BY, so a top-N query in either direction (ascending scans it backward)
+# reads only the first N entries.
+asset_query_indexes = [
+    Index("ix_assets_institution_id", Asset.institution_id),
+    Index(
+        "ix_assets_balance_current_sort",
+        Asset.balance_current.desc().nulls_last(),
+        Asset.wid.desc(),
+    ),
+    Index(
+        "ix_assets_balance_as_of_sort",
+        Asset.balance_as_of.desc().nulls_last(),
+        Asset.wid.desc(),
+    ),
+    Index(
+        "ix_assets_modification_date_sort",
+        Asset.modification_date.desc().nulls_last(),
+        Asset.wid.desc(),
+    ),
+    # Due queue for the refresh scheduler. Partial, so unlinked and inactive
+    # assets never sit at the head of the queue.
+    Index(
+        "ix_assets_refresh_due",
+        Asset.next_update,
+        postgresql_where=Asset.is_linked_vendor.is_(True) & Asset.is_active.is_not(False),
+    ),
+]
+
+
+def create_asset_query_indexes(target, connection, **kw):
+    """Add any query indexes missing from an existing assets table."""
+    for index in asset_query_indexes:
+        index.create(connection, checkfirst=True)
+
+
+event.listen(Base.metadata, "after_create", create_asset_query_indexes)
@@ -0,0 +1,63 @@
+import uuid
+import zlib
+from typing import Optional
+
+from sqlalchemy import ForeignKey, LargeBinary
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
+
+from ..database import Base
+
+
+class CompressedText(TypeDecorator):
+    """Text stored zlib-compressed in a bytea column."""
+    
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return zlib.compress(value.encode("utf-8"), 6)
+    
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return zlib.decompress(value).decode("utf-8")
+
+
+# Asset fields kept in asset_details rather than on the assets row
+DETAIL_FIELDS = (
+    "vendor_response",
+    "holdings",
+    "ownership",
+    "beneficiary_composition",
+    "description_estate_plan",
+)
+
+
+class AssetDetail(Base):
+    """
+    Large, rarely read payloads of an asset, kept out of the ``assets`` row.
+    
+    List queries never touch this table, so raw vendor responses and holdings
+    blobs don't widen the hot table or its cache footprint.
+    """
+    
+    __tablename__ = "asset_details"
+    
+    asset_wid: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("assets.wid", ondelete="CASCADE"), primary_key=True
+    )
+    
+    vendor_response: Mapped[Optional[str]] = mapped_column(CompressedText)
+    holdings: Mapped[Optional[str]] = mapped_column(CompressedText)
+    ownership: Mapped[Optional[str]] = mapped_column(CompressedText)
+    beneficiary_composition: Mapped[Optional[str]] = mapped_column(CompressedText)
+    description_estate_plan: Mapped[Optional[str]] = mapped_column(CompressedText)
+    
+    asset: Mapped["Asset"] = relationship(back_populates="details")  # noqa: F821
+    
+    def __repr__(self) -> str:
+        return f"<AssetDetail(asset_wid={self.asset_wid})>"
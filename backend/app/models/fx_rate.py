@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database import Base
+
+
+class FxRate(Base):
+    """Exchange rate of one currency, expressed as its value in USD."""
+    
+    __tablename__ = "fx_rates"
+    
+    currency_code: Mapped[str] = mapped_column(String(10), primary_key=True)
+    usd_rate: Mapped[float] = mapped_column(Float, nullable=False)
+    as_of: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    
+    # Bumped on every ingest so in-process caches know when to reload
+    version: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    
+    def __repr__(self) -> str:
+        return f"<FxRate(currency_code={self.currency_code}, usd_rate={self.usd_rate})>"
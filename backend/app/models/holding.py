@@ -0,0 +1,36 @@
+import uuid
+from typing import Optional
+
+from sqlalchemy import BigInteger, Float, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database import Base
+
+
+class AssetHolding(Base):
+    """
+    One position held within an asset, normalized out of ``Asset.holdings``.
+    
+    Security positions carry a ``symbol``; asset-class allocation lines carry
+    ``major_asset_class`` / ``minor_asset_class`` instead.
+    """
+    
+    __tablename__ = "asset_holdings"
+    
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    asset_wid: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("assets.wid", ondelete="CASCADE"), index=True
+    )
+    
+    symbol: Mapped[Optional[str]] = mapped_column(String(50), index=True)
+    major_asset_class: Mapped[Optional[str]] = mapped_column(String(100))
+    minor_asset_class: Mapped[Optional[str]] = mapped_column(String(100), index=True)
+    
+    quantity: Mapped[Optional[float]] = mapped_column(Float)
+    price: Mapped[Optional[float]] = mapped_column(Float)
+    value: Mapped[Optional[float]] = mapped_column(Float)
+    cost_basis: Mapped[Optional[float]] = mapped_column(Float)
+    
+    def __repr__(self) -> str:
+        return f"<AssetHolding(asset_wid={self.asset_wid}, symbol={self.symbol}, value={self.value})>"
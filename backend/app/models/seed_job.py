@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Boolean, DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database import Base
+
+
+class SeedJob(Base):
+    """
+    Progress of a background seed or sync run.
+    
+    Stored in the database rather than in memory so any worker process can
+    report on, or cancel, a job started by another.
+    """
+    
+    __tablename__ = "seed_jobs"
+    
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    
+    # pending, running, completed, failed or cancelled
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    sync: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    deactivate_missing: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    
+    # Progress counters, updated as each chunk is committed
+    total_rows: Mapped[Optional[int]] = mapped_column(Integer)
+    processed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    inserted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unchanged: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    deactivated: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    errors: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    
+    # Seed file the job reads, so another worker can resume it
+    file_path: Mapped[Optional[str]] = mapped_column(String(1000))
+    # Written by the running worker after every chunk. An unfinished job whose
+    # heartbeat is older than SEED_JOB_STALE_SECONDS lost its worker and is
+    # taken over; NULL marks a job interrupted by a shutdown, which is resumed
+    # straight away. attempts counts the workers that have run the job.
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    
+    def __repr__(self) -> str:
+        return f"<SeedJob(id={self.id}, status={self.status}, processed={self.processed_rows})>"
+
@@ -1,4 +1,16 @@
-from .asset import AssetResponse, AssetListResponse
-
-__all__ = ["AssetResponse", "AssetListResponse"]
+from .analytics import AllocationEntry, ConcentrationMetrics, PortfolioAnalyticsResponse
+from .asset import AssetResponse, AssetListResponse, AssetSummaryResponse
+from .holding import ExposureEntry, ExposureResponse, HoldingListResponse, HoldingResponse
 
+__all__ = [
+    "AllocationEntry",
+    "ConcentrationMetrics",
+    "PortfolioAnalyticsResponse",
+    "AssetResponse",
+    "AssetListResponse",
+    "AssetSummaryResponse",
+    "ExposureEntry",
+    "ExposureResponse",
+    "HoldingListResponse",
+    "HoldingResponse",
+]
@@ -0,0 +1,42 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class AllocationEntry(BaseModel):
+    """Value and share of the portfolio held under one grouping key."""
+    
+    key: str
+    value: float
+    weight: float
+    count: int
+    unrealized_gain: float
+    return_pct: Optional[float] = None
+
+
+class ConcentrationMetrics(BaseModel):
+    """Concentration of the portfolio across individual (positive) assets."""
+    
+    asset_count: int
+    top_n: int
+    top_n_share: Optional[float] = None
+    hhi: Optional[float] = None
+    effective_n: Optional[float] = None
+
+
+class PortfolioAnalyticsResponse(BaseModel):
+    """Portfolio gains, allocation weights and concentration metrics."""
+    
+    cognito_id: Optional[str] = None
+    base_currency: str
+    asset_count: int
+    total_value: float
+    total_cost_basis: float
+    unrealized_gain: float
+    return_pct: Optional[float] = None
+    allocation: dict[str, list[AllocationEntry]]
+    concentration: ConcentrationMetrics
+    # Currencies without an exchange rate, and the number of assets in them;
+    # their balances are left out of every figure
+    unconverted_currencies: list[str] = []
+    unconverted_count: int = 0
@@ -52,20 +52,15 @@ class AssetBase(BaseModel):
     
     # Owner fields
     asset_owner_name: Optional[str] = None
-    ownership: Optional[str] = None
-    beneficiary_composition: Optional[str] = None
     
     # Vendor fields
     vendor_account_type: Optional[str] = None
     vendor_container: Optional[str] = None
-    vendor_response: Optional[str] = None
     vendor_response_type: Optional[str] = None
     
     # Additional metadata
     asset_mask: Optional[str] = None
     currency_code: Optional[str] = None
-    description_estate_plan: Optional[str] = None
-    holdings: Optional[str] = None
     logo_name: Optional[str] = None
     note: Optional[str] = None
     note_date: Optional[datetime] = None
@@ -81,8 +76,23 @@ class AssetBase(BaseModel):
     deactivate_by: Optional[datetime] = None
 
 
-class AssetResponse(AssetBase):
-    """Response schema for a single asset."""
+class AssetDetailFields(BaseModel):
+    """Large asset payloads, stored in asset_details rather than on the asset row."""
+    
+    vendor_response: Optional[str] = None
+    holdings: Optional[str] = None
+    ownership: Optional[str] = None
+    beneficiary_composition: Optional[str] = None
+    description_estate_plan: Optional[str] = None
+
+
+class AssetResponse(AssetDetailFields, AssetBase):
+    """
+    Response schema for a single asset.
+    
+    The AssetDetailFields are null unless requested with `include=` on the
+    list endpoint, or fetched from the single-asset endpoint.
+    """
     
     wid: UUID
     
@@ -98,3 +108,34 @@ class AssetListResponse(BaseModel):
     page_size: int
     pages: int
 
+
+
+class SubcategorySummary(BaseModel):
+    """Converted balance total of one wealth_asset_type within a category."""
+    
+    name: str
+    total: float
+    count: int
+
+
+class CategorySummary(BaseModel):
+    """Converted balance total of one primary_asset_category."""
+    
+    name: str
+    total: float
+    count: int
+    subcategories: list[SubcategorySummary]
+
+
+class AssetSummaryResponse(BaseModel):
+    """Balance totals converted to a single base currency."""
+    
+    base_currency: str
+    fx_version: int
+    total: float
+    count: int
+    categories: list[CategorySummary]
+    # Currencies without an exchange rate, and the number of assets in them;
+    # their balances are not in any total
+    unconverted_currencies: list[str]
+    unconverted_count: int = 0
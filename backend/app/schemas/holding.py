@@ -0,0 +1,52 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class HoldingResponse(BaseModel):
+    """A single position, with the owning asset's user and currency."""
+    
+    asset_wid: UUID
+    cognito_id: Optional[str] = None
+    currency_code: Optional[str] = None
+    symbol: Optional[str] = None
+    major_asset_class: Optional[str] = None
+    minor_asset_class: Optional[str] = None
+    quantity: Optional[float] = None
+    price: Optional[float] = None
+    value: Optional[float] = None
+    cost_basis: Optional[float] = None
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class HoldingListResponse(BaseModel):
+    """Paginated response schema for listing positions."""
+    
+    items: list[HoldingResponse]
+    total: int
+    page: int
+    page_size: int
+    pages: int
+
+
+class ExposureEntry(BaseModel):
+    """Aggregate exposure to one security or asset class."""
+    
+    key: str
+    value: float
+    quantity: Optional[float] = None
+    cost_basis: Optional[float] = None
+    position_count: int
+    asset_count: int
+    user_count: int
+
+
+class ExposureResponse(BaseModel):
+    """Exposure per security or asset class across assets and users."""
+    
+    group_by: str
+    base_currency: str
+    items: list[ExposureEntry]
+    unconverted_currencies: list[str]
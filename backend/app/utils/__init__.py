@@ -1,4 +1,11 @@
-from .seed import load_seed_data, seed_database, SeedResult
-
-__all__ = ["load_seed_data", "seed_database", "SeedResult"]
+from .events import AssetChangeBroker, asset_change_broker
+from .seed import load_seed_data, seed_database, SeedResult, sync_database
 
+__all__ = [
+    "AssetChangeBroker",
+    "asset_change_broker",
+    "load_seed_data",
+    "seed_database",
+    "SeedResult",
+    "sync_database",
+]
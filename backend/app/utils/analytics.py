@@ -0,0 +1,197 @@
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.asset import Asset
+from .fx import FxRates
+
+# Dimensions that allocation weights can be grouped by. Missing values are
+# grouped under "Other", matching the frontend's category grouping.
+ALLOCATION_DIMENSIONS = ("primary_asset_category", "wealth_asset_type", "institution_name")
+
+
+@dataclass
+class PortfolioArrays:
+    """Numeric and grouping columns of the selected assets, one array each."""
+    balance_current: np.ndarray
+    balance_cost_basis: np.ndarray
+    currencies: np.ndarray
+    groups: dict[str, np.ndarray]
+
+    @property
+    def size(self) -> int:
+        return len(self.balance_current)
+
+
+def load_portfolio_arrays(
+    db: Session,
+    cognito_id: str | None = None,
+    include_inactive: bool = False,
+) -> PortfolioArrays:
+    """
+    Load only the columns analytics needs into NumPy arrays.
+
+    Selects plain column tuples (no ORM objects) and transposes them once;
+    NULL balances become NaN, and NULL group keys and currencies become
+    "Other" and the default currency in SQL.
+    Assets excluded from net worth are always left out.
+    """
+    query = select(
+        Asset.balance_current,
+        Asset.balance_cost_basis,
+        func.upper(func.coalesce(Asset.currency_code, settings.default_currency)),
+        *(func.coalesce(getattr(Asset, dim), "Other") for dim in ALLOCATION_DIMENSIONS),
+    ).where(or_(Asset.include_in_net_worth.is_(None), Asset.include_in_net_worth.is_(True)))
+
+    if not include_inactive:
+        query = query.where(or_(Asset.is_active.is_(None), Asset.is_active.is_(True)))
+    if cognito_id is not None:
+        query = query.where(Asset.cognito_id == cognito_id)
+
+    rows = db.execute(query).all()
+    if not rows:
+        empty = np.array([], dtype=float)
+        return PortfolioArrays(
+            balance_current=empty,
+            balance_cost_basis=empty,
+            currencies=np.array([], dtype=str),
+            groups={dim: np.array([], dtype=str) for dim in ALLOCATION_DIMENSIONS},
+        )
+
+    columns = list(zip(*rows))
+    return PortfolioArrays(
+        balance_current=np.array(columns[0], dtype=float),
+        balance_cost_basis=np.array(columns[1], dtype=float),
+        currencies=np.array(columns[2], dtype=str),
+        groups={
+            dim: np.array(columns[i + 3], dtype=str)
+            for i, dim in enumerate(ALLOCATION_DIMENSIONS)
+        },
+    )
+
+
+def _safe_ratio(numerator: float, denominator: float) -> float | None:
+    return float(numerator / denominator) if denominator else None
+
+
+def summarize_gains(values: np.ndarray, cost_basis: np.ndarray) -> dict:
+    """
+    Total value, cost basis and unrealized gain.
+
+    Gains are only meaningful where both a balance and a cost basis are
+    known, so assets with a missing balance, or a missing or zero cost basis,
+    contribute to the total value but not to the gain or return. Counting a
+    missing balance as zero would report a loss of the whole cost basis.
+    """
+    has_basis = (np.nan_to_num(cost_basis) > 0) & ~np.isnan(values)
+    values = np.nan_to_num(values)
+    basis = cost_basis[has_basis].sum()
+    gain = (values[has_basis] - cost_basis[has_basis]).sum()
+    return {
+        "total_value": float(values.sum()),
+        "total_cost_basis": float(basis),
+        "unrealized_gain": float(gain),
+        "return_pct": _safe_ratio(gain * 100, basis),
+    }
+
+
+def allocation_by(keys: np.ndarray, values: np.ndarray, cost_basis: np.ndarray) -> list[dict]:
+    """
+    Group values by key with one sort and a handful of bincounts.
+
+    Returns one entry per key, largest value first, with the key's share of
+    the total value and its unrealized gain.
+    """
+    if keys.size == 0:
+        return []
+
+    basis = np.nan_to_num(cost_basis)
+    # As in summarize_gains, a missing balance has no gain
+    has_basis = (basis > 0) & ~np.isnan(values)
+    values = np.nan_to_num(values)
+    gains = np.where(has_basis, values - basis, 0.0)
+
+    labels, inverse = np.unique(keys, return_inverse=True)
+    group_values = np.bincount(inverse, weights=values, minlength=labels.size)
+    group_basis = np.bincount(inverse, weights=np.where(has_basis, basis, 0.0), minlength=labels.size)
+    group_gains = np.bincount(inverse, weights=gains, minlength=labels.size)
+    group_counts = np.bincount(inverse, minlength=labels.size)
+
+    total = values.sum()
+    weights = group_values / total if total else np.zeros_like(group_values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(group_basis > 0, group_gains * 100 / group_basis, np.nan)
+
+    order = np.argsort(-group_values, kind="stable")
+    return [
+        {
+            "key": str(labels[i]),
+            "value": float(group_values[i]),
+            "weight": float(weights[i]),
+            "count": int(group_counts[i]),
+            "unrealized_gain": float(group_gains[i]),
+            "return_pct": None if np.isnan(returns[i]) else float(returns[i]),
+        }
+        for i in order
+    ]
+
+
+def concentration(values: np.ndarray, top_n: int) -> dict:
+    """
+    Concentration of the portfolio across individual assets.
+
+    Only positive balances are considered, so liabilities do not distort the
+    weights. ``hhi`` is the Herfindahl-Hirschman index (sum of squared
+    weights, from 1/n for an even spread up to 1 for a single asset), and
+    ``effective_n`` is its reciprocal.
+    """
+    positive = np.nan_to_num(values)
+    positive = positive[positive > 0]
+    gross = positive.sum()
+    if positive.size == 0 or not gross:
+        return {"asset_count": 0, "top_n": top_n, "top_n_share": None, "hhi": None, "effective_n": None}
+
+    weights = positive / gross
+    n = min(top_n, positive.size)
+    # Partitioning finds the top N without sorting every asset
+    top = np.partition(weights, positive.size - n)[positive.size - n:]
+    hhi = float(np.square(weights).sum())
+    return {
+        "asset_count": int(positive.size),
+        "top_n": top_n,
+        "top_n_share": float(top.sum()),
+        "hhi": hhi,
+        "effective_n": 1 / hhi,
+    }
+
+
+def compute_portfolio_analytics(
+    arrays: PortfolioArrays,
+    rates: FxRates,
+    base_currency: str = settings.default_currency,
+    top_n: int = 10,
+) -> dict:
+    """
+    Compute gains, allocation weights and concentration for the selected
+    assets, after converting every balance to ``base_currency``.
+
+    Balances in a currency without a known rate are left out, and reported
+    in ``unconverted_currencies`` and ``unconverted_count``.
+    """
+    values = rates.convert_array(arrays.balance_current, arrays.currencies, base_currency)
+    cost_basis = rates.convert_array(arrays.balance_cost_basis, arrays.currencies, base_currency)
+    unconverted = np.isnan(rates.convert_array(np.ones(arrays.size), arrays.currencies, base_currency))
+    return {
+        **summarize_gains(values, cost_basis),
+        "asset_count": arrays.size,
+        "allocation": {
+            dim: allocation_by(keys, values, cost_basis)
+            for dim, keys in arrays.groups.items()
+        },
+        "concentration": concentration(values, top_n),
+        "unconverted_currencies": sorted(set(arrays.currencies[unconverted].tolist())),
+        "unconverted_count": int(unconverted.sum()),
+    }
@@ -0,0 +1,56 @@
+from typing import Any
+
+from sqlalchemy import column, inspect, insert, select, table, text
+from sqlalchemy.orm import Session
+
+from ..models.asset_detail import DETAIL_FIELDS, AssetDetail
+
+
+def legacy_detail_columns(db: Session) -> list[str]:
+    """Detail fields still present as inline columns on the ``assets`` table."""
+    existing = {col["name"] for col in inspect(db.get_bind()).get_columns("assets")}
+    return [field for field in DETAIL_FIELDS if field in existing]
+
+
+def migrate_inline_details(db: Session, batch_size: int = 1000) -> int:
+    """
+    Move detail payloads from inline ``assets`` columns into ``asset_details``.
+
+    Databases created before the split still carry the payload columns on
+    ``assets``. Their values are copied (compressed) into ``asset_details``
+    for assets that don't have a detail row yet, then the columns are dropped.
+
+    Returns:
+        Number of detail rows written.
+    """
+    legacy = legacy_detail_columns(db)
+    if not legacy:
+        return 0
+
+    assets = table("assets", column("wid"), *(column(field) for field in legacy))
+    query = (
+        select(assets)
+        .outerjoin(AssetDetail, AssetDetail.asset_wid == assets.c.wid)
+        .where(AssetDetail.asset_wid.is_(None))
+    )
+    result = db.execute(query, execution_options={"yield_per": batch_size})
+
+    written = 0
+    rows: list[dict[str, Any]] = []
+    for row in result:
+        values = {field: row._mapping[field] for field in legacy}
+        if all(value is None for value in values.values()):
+            continue
+        rows.append({"asset_wid": row.wid, **values})
+        if len(rows) >= batch_size:
+            db.execute(insert(AssetDetail), rows)
+            written += len(rows)
+            rows = []
+    if rows:
+        db.execute(insert(AssetDetail), rows)
+        written += len(rows)
+
+    for field in legacy:
+        db.execute(text(f"ALTER TABLE assets DROP COLUMN {field}"))
+    db.commit()
+    return written
@@ -0,0 +1,192 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+from sqlalchemy.engine import Engine
+
+from ..config import settings
+from ..database import engine
+
+logger = logging.getLogger(__name__)
+
+
+RESYNC_EVENT: dict[str, Any] = {"event": "resync"}
+
+
+class AssetChangeBroker:
+    """
+    Fan out Postgres asset change notifications to SSE subscribers.
+
+    A single LISTEN connection is held per process and shared by every
+    subscriber. Notifications are buffered for a short window and flushed as
+    one ``assets_changed`` event, so a seed that touches thousands of rows
+    produces a handful of messages rather than thousands.
+
+    Each subscriber owns a bounded queue. A subscriber that falls behind has
+    its queue replaced by a single ``resync`` event, telling the client to
+    refetch instead of replaying every missed change.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        channel: str = settings.asset_events_channel,
+        coalesce_seconds: float = settings.asset_events_coalesce_ms / 1000,
+        queue_size: int = settings.asset_events_queue_size,
+        max_wids_per_event: int = settings.asset_events_max_wids,
+        reconnect_seconds: float = 5.0,
+    ):
+        self.engine = engine
+        self.channel = channel
+        self.coalesce_seconds = coalesce_seconds
+        self.queue_size = queue_size
+        self.max_wids_per_event = max_wids_per_event
+        self.reconnect_seconds = reconnect_seconds
+
+        self._subscribers: set[asyncio.Queue] = set()
+        self._pending: dict[str, set[str]] = {}
+        self._overflowed = False
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._reconnect_handle: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._conn = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a new subscriber, starting the listener if needed."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        if self._conn is None and self._reconnect_handle is None:
+            self._loop = asyncio.get_running_loop()
+            self._connect()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber, releasing the listener once nobody is left."""
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self.close()
+
+    def close(self) -> None:
+        """Stop listening and drop any buffered notifications."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._reconnect_handle is not None:
+            self._reconnect_handle.cancel()
+            self._reconnect_handle = None
+        self._pending.clear()
+        self._overflowed = False
+        self._disconnect()
+
+    def _connect(self) -> None:
+        self._reconnect_handle = None
+        try:
+            # Detach from the pool: the LISTEN connection lives for as long as
+            # there are subscribers and must not be handed to request sessions.
+            raw = self.engine.raw_connection()
+            conn = raw.driver_connection
+            raw.detach()
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self.channel}"')
+        except Exception:
+            logger.exception("Could not open asset change listener")
+            self._schedule_reconnect()
+            return
+
+        self._conn = conn
+        self._loop.add_reader(conn.fileno(), self._on_readable)
+
+    def _disconnect(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._loop.remove_reader(self._conn.fileno())
+        except Exception:
+            pass
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+
+    def _schedule_reconnect(self) -> None:
+        if self._subscribers and self._loop is not None:
+            self._reconnect_handle = self._loop.call_later(
+                self.reconnect_seconds, self._connect
+            )
+
+    def _on_readable(self) -> None:
+        try:
+            self._conn.poll()
+        except Exception:
+            logger.exception("Asset change listener connection lost")
+            self._disconnect()
+            # Changes may have been missed while the connection was down.
+            self._broadcast(RESYNC_EVENT)
+            self._schedule_reconnect()
+            return
+
+        notifies = self._conn.notifies
+        while notifies:
+            self._buffer(notifies.pop(0).payload)
+
+    def _buffer(self, payload: str) -> None:
+        """Add a raw notification payload to the pending batch."""
+        try:
+            data = json.loads(payload)
+            op, wid = data["op"], str(data["wid"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed asset notification: %r", payload)
+            return
+
+        if not self._overflowed:
+            wids = self._pending.setdefault(op, set())
+            wids.add(wid)
+            if sum(len(w) for w in self._pending.values()) > self.max_wids_per_event:
+                # Too many rows to be worth listing; clients just refetch.
+                self._pending.clear()
+                self._overflowed = True
+
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self.coalesce_seconds, self._flush
+            )
+
+    def _flush(self) -> None:
+        """Publish everything buffered since the last flush as one event."""
+        self._flush_handle = None
+        if self._overflowed:
+            message = RESYNC_EVENT
+        else:
+            message = {
+                "event": "assets_changed",
+                "inserted": sorted(self._pending.get("insert", ())),
+                "updated": sorted(self._pending.get("update", ())),
+            }
+        self._pending.clear()
+        self._overflowed = False
+        self._broadcast(message)
+
+    def _broadcast(self, message: dict[str, Any]) -> None:
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow consumer: collapse its backlog into a single resync.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC_EVENT)
+
+
+def format_sse(message: dict[str, Any]) -> str:
+    """Serialize a broker message as a server-sent event frame."""
+    return f"event: {message['event']}\ndata: {json.dumps(message)}\n\n"
+
+
+asset_change_broker = AssetChangeBroker(engine)
@@ -0,0 +1,144 @@
+import json
+from typing import Any, BinaryIO, Iterator
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, DateTime, Float, Integer, select
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Session
+
+from ..models.asset import Asset
+
+EXPORT_FORMATS = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def arrow_type_for(column_type: Any) -> pa.DataType:
+    """Map a SQLAlchemy column type to the Arrow type used for export."""
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    return pa.string()
+
+
+ASSET_COLUMNS = list(Asset.__table__.columns)
+
+ASSET_SCHEMA = pa.schema(
+    [pa.field(column.name, arrow_type_for(column.type)) for column in ASSET_COLUMNS]
+)
+
+# Columns whose Python values need converting before Arrow can take them.
+_UUID_COLUMNS = {c.name for c in ASSET_COLUMNS if isinstance(c.type, UUID)}
+_JSON_COLUMNS = {c.name for c in ASSET_COLUMNS if isinstance(c.type, JSONB)}
+
+
+def _column_values(name: str, values: tuple) -> list | tuple:
+    if name in _UUID_COLUMNS:
+        return [None if v is None else str(v) for v in values]
+    if name in _JSON_COLUMNS:
+        return [None if v is None else json.dumps(v) for v in values]
+    return values
+
+
+def iter_asset_record_batches(
+    db: Session, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[pa.RecordBatch]:
+    """
+    Yield the assets table as Arrow record batches.
+
+    Rows are read through a server-side cursor in chunks of ``batch_size``
+    and transposed straight into typed columns, without building ORM objects.
+    """
+    result = db.execute(
+        select(*ASSET_COLUMNS),
+        execution_options={"yield_per": batch_size},
+    )
+    for rows in result.partitions():
+        columns = zip(*rows)
+        arrays = [
+            pa.array(_column_values(field.name, values), type=field.type)
+            for field, values in zip(ASSET_SCHEMA, columns)
+        ]
+        yield pa.RecordBatch.from_arrays(arrays, schema=ASSET_SCHEMA)
+
+
+def write_assets(
+    db: Session,
+    sink: BinaryIO,
+    format: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[int]:
+    """
+    Write the assets table to ``sink`` as Parquet or an Arrow IPC stream.
+
+    This is a generator: it writes one record batch (one Parquet row group)
+    per step and yields the number of rows written, so callers can flush the
+    sink between batches.
+
+    Raises:
+        ValueError: If ``format`` is not a supported export format.
+    """
+    if format == "parquet":
+        writer = pq.ParquetWriter(sink, ASSET_SCHEMA, compression="zstd")
+    elif format == "arrow":
+        writer = pa.ipc.new_stream(sink, ASSET_SCHEMA)
+    else:
+        raise ValueError(f"Unsupported export format: {format}")
+
+    with writer:
+        for batch in iter_asset_record_batches(db, batch_size):
+            writer.write_batch(batch)
+            yield batch.num_rows
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back to the caller."""
+
+    closed = False
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_export_chunks(
+    db: Session, format: str, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Yield an encoded export of the assets table, one batch at a time."""
+    sink = _ChunkSink()
+    for _ in write_assets(db, sink, format, batch_size):
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    # Trailing bytes: the Parquet footer or the IPC end-of-stream marker
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
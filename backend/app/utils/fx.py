@@ -0,0 +1,177 @@
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import String, all_, bindparam, delete, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.fx_rate import FxRate
+from .seed import parse_datetime
+
+
+# Transaction-level advisory lock serializing rate ingests
+FX_INGEST_LOCK_ID = 0x66785F72  # "fx_r"
+
+
+class UnknownCurrencyError(ValueError):
+    """Raised when a conversion is requested for a currency without a rate."""
+
+
+def get_fx_rates_path() -> Path:
+    """Get the path to the FX rates file."""
+    if settings.fx_rates_file:
+        return Path(settings.fx_rates_file)
+    return Path(__file__).parent.parent.parent / "data" / "fx_rates.json"
+
+
+def load_fx_file(file_path: Path | None = None) -> tuple[dict[str, float], datetime | None]:
+    """
+    Load exchange rates from a JSON file.
+
+    The file holds an ``as_of`` timestamp and a ``rates`` object mapping each
+    currency code to the USD value of one unit of that currency.
+
+    Returns:
+        Tuple of (rates by upper-case currency code, as_of).
+    """
+    if file_path is None:
+        file_path = get_fx_rates_path()
+
+    with open(file_path, "r") as f:
+        data = json.load(f)
+
+    rates = {code.upper(): float(rate) for code, rate in data["rates"].items()}
+    return rates, parse_datetime(data.get("as_of"))
+
+
+def ingest_fx_rates(
+    db: Session, rates: dict[str, float], as_of: datetime | None = None
+) -> int:
+    """
+    Replace the stored exchange rates with ``rates`` under a new version.
+
+    Currencies missing from ``rates`` are deleted, so a version never mixes
+    rates from different files. The whole replacement is one transaction,
+    and concurrent ingests are serialized with an advisory lock, so each gets
+    its own version.
+
+    Returns:
+        The new rate version.
+    """
+    # An empty rate set is more likely a broken export than no currencies
+    if not rates:
+        raise ValueError("No exchange rates to ingest")
+    rows = [
+        {"currency_code": code.upper(), "usd_rate": rate, "as_of": as_of}
+        for code, rate in rates.items()
+    ]
+
+    db.execute(select(func.pg_advisory_xact_lock(FX_INGEST_LOCK_ID)))
+    current = db.execute(select(func.max(FxRate.version))).scalar()
+    version = (current or 0) + 1
+
+    codes = [row["currency_code"] for row in rows]
+    db.execute(delete(FxRate).where(
+        FxRate.currency_code != all_(bindparam("codes", codes, type_=ARRAY(String)))
+    ))
+    stmt = insert(FxRate).values([{**row, "version": version} for row in rows])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[FxRate.currency_code],
+        set_={
+            "usd_rate": stmt.excluded.usd_rate,
+            "as_of": stmt.excluded.as_of,
+            "version": stmt.excluded.version,
+        },
+    )
+    db.execute(stmt)
+    db.commit()
+
+    # Other processes notice the new version on their next lookup
+    fx_rate_cache.invalidate()
+    return version
+
+
+@dataclass
+class FxRates:
+    """An immutable snapshot of exchange rates at one version."""
+    version: int
+    rates: dict[str, float]
+    _codes: np.ndarray = field(init=False, repr=False)
+    _usd_rates: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        codes = sorted(self.rates)
+        self._codes = np.array(codes, dtype=str)
+        self._usd_rates = np.array([self.rates[c] for c in codes], dtype=float)
+
+    def rate(self, currency_code: str) -> float:
+        """USD value of one unit of ``currency_code``."""
+        try:
+            return self.rates[currency_code.upper()]
+        except KeyError:
+            raise UnknownCurrencyError(f"No exchange rate for currency: {currency_code}")
+
+    def convert_array(self, amounts: np.ndarray, currencies: np.ndarray, base_currency: str) -> np.ndarray:
+        """
+        Convert amounts to ``base_currency`` in one vectorized pass.
+
+        ``currencies`` holds upper-case codes, one per amount. Amounts in a
+        currency without a rate become NaN.
+        """
+        base_rate = self.rate(base_currency)
+        if amounts.size == 0:
+            return amounts.astype(float)
+
+        positions = np.searchsorted(self._codes, currencies)
+        positions = np.minimum(positions, len(self._codes) - 1)
+        known = self._codes[positions] == currencies
+        factors = np.where(known, self._usd_rates[positions] / base_rate, np.nan)
+        return amounts * factors
+
+
+class FxRateCache:
+    """
+    Process-wide cache of exchange rates with versioned invalidation.
+
+    Each lookup reads only ``max(version)`` from ``fx_rates``; the full table
+    is reloaded only when an ingest has bumped the version. When the table is
+    empty, rates come from the local FX file (version 0).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: FxRates | None = None
+
+    def get(self, db: Session) -> FxRates:
+        version = db.execute(select(func.max(FxRate.version))).scalar() or 0
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = self._load(db, version)
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
+    @staticmethod
+    def _load(db: Session, version: int) -> FxRates:
+        if version == 0:
+            path = get_fx_rates_path()
+            rates = load_fx_file(path)[0] if path.exists() else {}
+        else:
+            rates = dict(db.execute(select(FxRate.currency_code, FxRate.usd_rate)).all())
+        # Rates are quoted in USD, so USD itself is always convertible
+        rates.setdefault("USD", 1.0)
+        return FxRates(version=version, rates=rates)
+
+
+fx_rate_cache = FxRateCache()
+
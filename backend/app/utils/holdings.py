@@ -0,0 +1,173 @@
+import json
+import uuid
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from ..models.asset import Asset
+from ..models.asset_detail import AssetDetail
+from ..models.holding import AssetHolding
+
+# Keys under which vendor payloads list individual security positions
+POSITION_LIST_KEYS = ("positions", "holdings", "securities")
+
+# Rows per INSERT when writing positions in bulk
+INSERT_CHUNK_SIZE = 5000
+
+POSITION_FIELDS = (
+    "symbol",
+    "major_asset_class",
+    "minor_asset_class",
+    "quantity",
+    "price",
+    "value",
+    "cost_basis",
+)
+
+
+def _as_dict(value: Any) -> Any:
+    """Decode a JSON string, passing already-decoded values through."""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return None
+    return value
+
+
+def _number(value: Any) -> float | None:
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _security_positions(holdings: Any) -> list[dict[str, Any]]:
+    if isinstance(holdings, dict):
+        holdings = next(
+            (holdings[key] for key in POSITION_LIST_KEYS if isinstance(holdings.get(key), list)),
+            None,
+        )
+    if not isinstance(holdings, list):
+        return []
+
+    positions = []
+    for entry in holdings:
+        if not isinstance(entry, dict) or not entry.get("symbol"):
+            continue
+        positions.append({
+            "symbol": str(entry["symbol"]).upper(),
+            "quantity": _number(entry.get("quantity")),
+            "price": _number(entry.get("price")),
+            "value": _number(entry.get("value", entry.get("marketValue"))),
+            "cost_basis": _number(entry.get("costBasis", entry.get("cost_basis"))),
+        })
+    return positions
+
+
+def _asset_class_positions(holdings: Any) -> list[dict[str, Any]]:
+    if not isinstance(holdings, dict):
+        return []
+
+    positions = []
+    for major in holdings.get("majorAssetClasses") or []:
+        for minor in major.get("assetClasses") or []:
+            value = _number(minor.get("value"))
+            # Most allocation lines are zero placeholders; don't store them
+            if not value:
+                continue
+            positions.append({
+                "major_asset_class": major.get("majorClass"),
+                "minor_asset_class": minor.get("minorAssetClass"),
+                "value": value,
+            })
+    return positions
+
+
+def extract_positions(asset: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Flatten an asset's holdings into position rows.
+
+    ``asset`` uses the snake_case keys of the Asset model. Positions come from:
+
+    - a vendor list of securities (entries with a ``symbol``) in ``holdings``
+    - otherwise, a manual asset's own ``asset_info.symbol`` (e.g. crypto),
+      valued from the asset's balance fields
+    - non-zero lines of the ``majorAssetClasses`` breakdown in ``holdings``
+    """
+    holdings = _as_dict(asset.get("holdings"))
+    positions = _security_positions(holdings)
+
+    asset_info = _as_dict(asset.get("asset_info")) or {}
+    if not positions and isinstance(asset_info, dict) and asset_info.get("symbol"):
+        quantity = _number(asset.get("balance_quantity_current")) or _number(asset_info.get("quantity"))
+        value = _number(asset.get("balance_current"))
+        price = _number(asset.get("balance_price"))
+        if price is None and value is not None and quantity:
+            price = value / quantity
+        positions.append({
+            "symbol": str(asset_info["symbol"]).upper(),
+            "quantity": quantity,
+            "price": price,
+            "value": value,
+            "cost_basis": _number(asset.get("balance_cost_basis")),
+        })
+
+    return positions + _asset_class_positions(holdings)
+
+
+def insert_positions(db: Session, rows: list[dict[str, Any]]) -> None:
+    """Insert position rows with multi-row INSERTs, in chunks."""
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        db.execute(insert(AssetHolding), rows[start:start + INSERT_CHUNK_SIZE])
+
+
+def position_rows(wid: uuid.UUID, asset: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Position rows for one asset, ready for ``insert_positions``.
+
+    Every row carries every column so a batch compiles to a single INSERT.
+    """
+    return [
+        {"asset_wid": wid, **{name: position.get(name) for name in POSITION_FIELDS}}
+        for position in extract_positions(asset)
+    ]
+
+
+def rebuild_holdings(db: Session, batch_size: int = 1000) -> int:
+    """
+    Repopulate ``asset_holdings`` from every asset's stored holdings.
+
+    Used to backfill assets ingested before positions were normalized.
+
+    Returns:
+        Number of position rows written.
+    """
+    db.execute(delete(AssetHolding))
+
+    columns = (
+        Asset.wid,
+        AssetDetail.holdings,
+        Asset.asset_info,
+        Asset.balance_current,
+        Asset.balance_cost_basis,
+        Asset.balance_price,
+        Asset.balance_quantity_current,
+    )
+    query = select(*columns).outerjoin(AssetDetail, AssetDetail.asset_wid == Asset.wid)
+    result = db.execute(query, execution_options={"yield_per": batch_size})
+
+    written = 0
+    rows: list[dict[str, Any]] = []
+    for row in result:
+        rows.extend(position_rows(row.wid, row._asdict()))
+        if len(rows) >= INSERT_CHUNK_SIZE:
+            insert_positions(db, rows)
+            written += len(rows)
+            rows = []
+    insert_positions(db, rows)
+    written += len(rows)
+
+    db.commit()
+    return written
@@ -0,0 +1,164 @@
+import logging
+import threading
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Statements shown per repeated shape in reports
+REPORT_STATEMENT_LENGTH = 200
+
+
+class QueryStats:
+    """
+    Statements executed during one unit of work.
+
+    Statements are grouped by their SQL text, which holds placeholders rather
+    than values, so the same query issued for every row of a loop (an N+1
+    pattern) shows up as one shape with a high count. An ``executemany`` is
+    recorded once.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.shapes: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.shapes[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed at least ``threshold`` times, most first."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+    def report(self) -> str:
+        """Human-readable summary, most repeated statements first."""
+        lines = [f"{self.count} statements in {self.total_seconds * 1000:.1f} ms"]
+        for shape, n in self.shapes.most_common():
+            lines.append(f"  {n}x {' '.join(shape.split())[:REPORT_STATEMENT_LENGTH]}")
+        return "\n".join(lines)
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+# Engines that already carry the profiling listeners
+_profiled_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count statements executed in the current context, e.g. one request.
+
+    Only engines with ``install_query_profiling`` report to it. The context
+    is copied into threadpool calls, so sync endpoints are included.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[QueryStats]:
+    """Count every statement executed on ``engine``, from any thread, in the block."""
+    stats = QueryStats()
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["count_queries_start"] = time.perf_counter()
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("count_queries_start", None)
+        stats.record(statement, time.perf_counter() - started if started else 0.0)
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+        event.remove(engine, "after_cursor_execute", after)
+
+
+def explain_analyze(cursor, statement: str, parameters) -> str:
+    """
+    Run ``EXPLAIN (ANALYZE, BUFFERS)`` for a statement on its DBAPI connection.
+
+    Runs inside a savepoint so a failure can't abort the caller's transaction.
+    """
+    explain_cursor = cursor.connection.cursor()
+    try:
+        explain_cursor.execute("SAVEPOINT explain_slow_query")
+        try:
+            explain_cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            plan = "\n".join(row[0] for row in explain_cursor.fetchall())
+        except Exception as e:
+            explain_cursor.execute("ROLLBACK TO SAVEPOINT explain_slow_query")
+            plan = f"EXPLAIN failed: {e}"
+        explain_cursor.execute("RELEASE SAVEPOINT explain_slow_query")
+        return plan
+    finally:
+        explain_cursor.close()
+
+
+def install_query_profiling(
+    engine: Engine, slow_query_ms: float = 0, explain_slow_queries: bool = False
+) -> None:
+    """
+    Attach profiling listeners to ``engine``.
+
+    Every statement is timed and reported to the active ``track_queries``
+    context, if any. Statements slower than ``slow_query_ms`` (when set) are
+    logged with their parameters and, with ``explain_slow_queries``, the
+    ``EXPLAIN (ANALYZE, BUFFERS)`` plan of read-only statements. Explaining
+    runs the statement a second time, so enable it only while investigating.
+    """
+    if engine in _profiled_engines:
+        return
+    _profiled_engines.add(engine)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info["query_start"].pop()
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, seconds)
+
+        if not slow_query_ms or seconds * 1000 < slow_query_ms:
+            return
+        plan = None
+        # Only plain SELECTs are re-run; a CTE may wrap a write
+        if explain_slow_queries and not executemany and statement.lstrip().upper().startswith("SELECT"):
+            plan = explain_analyze(cursor, statement, parameters)
+        logger.warning(
+            "Slow query (%.1f ms): %s\nParameters: %r%s",
+            seconds * 1000,
+            statement,
+            parameters,
+            f"\n{plan}" if plan else "",
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        # Keep the timing stack balanced when a statement fails
+        starts = context.connection.info.get("query_start") if context.connection else None
+        if starts:
+            starts.pop()
@@ -0,0 +1,307 @@
+import importlib
+import logging
+import random
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Protocol
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.asset import Asset
+
+logger = logging.getLogger(__name__)
+
+# Longest status message stored on a failed asset (Asset.status is String(100))
+MAX_STATUS_LENGTH = 100
+
+
+@dataclass
+class RefreshTarget:
+    """A claimed asset, as handed to the vendor client."""
+    wid: uuid.UUID
+    integration: str | None
+    integration_account_id: str | None
+    user_institution_id: str | None
+    refresh_failures: int
+    # next_update written by the claim; the write-back only applies while the
+    # asset still carries it, i.e. while this worker owns the claim
+    lease: datetime
+
+
+@dataclass
+class VendorBalance:
+    """Balance fields returned by a vendor."""
+    balance_current: float
+    balance_as_of: datetime | None = None
+    balance_cost_basis: float | None = None
+    balance_price: float | None = None
+    balance_quantity_current: float | None = None
+
+
+class VendorError(Exception):
+    """Raised by vendor clients when a refresh fails."""
+
+
+class VendorClient(Protocol):
+    """Fetches the current balance of a linked account from its vendor."""
+
+    def fetch_balance(self, target: RefreshTarget) -> VendorBalance: ...
+
+
+class StubVendorClient:
+    """
+    Local vendor client for development and tests.
+
+    Returns balances from ``balances`` (keyed by integration account id, or
+    a fixed default) and raises VendorError for accounts in ``failing``.
+    ``on_fetch`` is called with each target before it is answered.
+    """
+
+    def __init__(
+        self,
+        balances: dict[str, float] | None = None,
+        default_balance: float = 0.0,
+        failing: set[str] | None = None,
+        on_fetch: Callable[[RefreshTarget], None] | None = None,
+    ):
+        self.balances = balances or {}
+        self.default_balance = default_balance
+        self.failing = failing or set()
+        self.on_fetch = on_fetch
+        self.calls: list[uuid.UUID] = []
+
+    def fetch_balance(self, target: RefreshTarget) -> VendorBalance:
+        self.calls.append(target.wid)
+        if self.on_fetch is not None:
+            self.on_fetch(target)
+        if target.integration_account_id in self.failing:
+            raise VendorError(f"Vendor unavailable for {target.integration_account_id}")
+        return VendorBalance(
+            balance_current=self.balances.get(target.integration_account_id, self.default_balance),
+            balance_as_of=datetime.now(timezone.utc),
+        )
+
+
+def load_vendor_client(path: str | None = None) -> VendorClient:
+    """Instantiate the vendor client class named by ``module:Class``."""
+    module_name, _, class_name = (path or settings.refresh_vendor_client).partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def backoff_delay(failures: int, base_seconds: float, max_seconds: float) -> timedelta:
+    """Exponential backoff with jitter after ``failures`` consecutive failures."""
+    delay = min(max_seconds, base_seconds * 2 ** max(0, failures - 1))
+    # Up to 10% jitter so accounts that failed together don't retry together
+    return timedelta(seconds=delay * random.uniform(0.9, 1.0))
+
+
+def claim_due_assets(
+    db: Session, limit: int, lease_seconds: float, now: datetime | None = None
+) -> list[RefreshTarget]:
+    """
+    Claim up to ``limit`` due assets and commit.
+
+    Due rows are picked from the ``ix_assets_refresh_due`` index with
+    ``FOR UPDATE SKIP LOCKED``, so concurrent schedulers never claim the same
+    row, and their ``next_update`` is pushed out by ``lease_seconds``. Row
+    locks are released on commit; the lease keeps other schedulers away while
+    the vendor is called, and lets the asset become due again if this worker
+    dies.
+    """
+    now = now or datetime.now(timezone.utc)
+    lease = now + timedelta(seconds=lease_seconds)
+
+    due = (
+        select(Asset.wid)
+        .where(
+            Asset.is_linked_vendor.is_(True),
+            Asset.is_active.is_not(False),
+            Asset.next_update <= now,
+        )
+        .order_by(Asset.next_update)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .cte("due")
+    )
+    stmt = (
+        update(Asset)
+        .where(Asset.wid == due.c.wid)
+        .values(next_update=lease, last_update_attempt=now)
+        .returning(
+            Asset.wid,
+            Asset.integration,
+            Asset.integration_account_id,
+            Asset.user_institution_id,
+            Asset.refresh_failures,
+        )
+    )
+    rows = db.execute(stmt).all()
+    db.commit()
+
+    return [
+        RefreshTarget(
+            wid=row.wid,
+            integration=row.integration,
+            integration_account_id=row.integration_account_id,
+            user_institution_id=row.user_institution_id,
+            refresh_failures=row.refresh_failures or 0,
+            lease=lease,
+        )
+        for row in rows
+    ]
+
+
+@dataclass
+class RefreshStats:
+    """Result of one scheduler pass."""
+    claimed: int = 0
+    refreshed: int = 0
+    failed: int = 0
+    # Write-backs dropped because the claim had expired and been taken over
+    lost: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class RefreshScheduler:
+    """
+    Refreshes due vendor-linked asset balances.
+
+    Each pass claims a batch of due assets, fetches their balances through
+    ``client`` on a thread pool, with at most ``integration_limits[name]``
+    (or ``default_limit``) calls in flight per integration, and writes the
+    results back. Any number of schedulers can run side by side, in one
+    process or many.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        client: VendorClient,
+        batch_size: int = settings.refresh_batch_size,
+        max_workers: int = settings.refresh_max_workers,
+        default_limit: int = settings.refresh_integration_limit,
+        integration_limits: dict[str, int] | None = None,
+        interval_seconds: float = settings.refresh_interval_seconds,
+        lease_seconds: float = settings.refresh_lease_seconds,
+        backoff_base_seconds: float = settings.refresh_backoff_base_seconds,
+        backoff_max_seconds: float = settings.refresh_backoff_max_seconds,
+    ):
+        self.session_factory = session_factory
+        self.client = client
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.default_limit = default_limit
+        self.integration_limits = (
+            settings.refresh_integration_limits if integration_limits is None else integration_limits
+        )
+        self.interval_seconds = interval_seconds
+        self.lease_seconds = lease_seconds
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+        self._limits_lock = threading.Lock()
+        self._limits: dict[str | None, threading.BoundedSemaphore] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="refresh")
+
+    def _limit(self, integration: str | None) -> threading.BoundedSemaphore:
+        with self._limits_lock:
+            if integration not in self._limits:
+                limit = self.integration_limits.get(integration or "", self.default_limit)
+                self._limits[integration] = threading.BoundedSemaphore(limit)
+            return self._limits[integration]
+
+    def _fetch(self, target: RefreshTarget) -> VendorBalance | Exception:
+        with self._limit(target.integration):
+            try:
+                return self.client.fetch_balance(target)
+            except Exception as e:
+                return e
+
+    def run_once(self, now: datetime | None = None) -> RefreshStats:
+        """Claim one batch of due assets, refresh them and write back."""
+        db = self.session_factory()
+        try:
+            targets = claim_due_assets(db, self.batch_size, self.lease_seconds, now)
+            stats = RefreshStats(claimed=len(targets))
+            if not targets:
+                return stats
+
+            results = list(self._executor.map(self._fetch, targets))
+
+            finished = now or datetime.now(timezone.utc)
+            for target, result in zip(targets, results):
+                if isinstance(result, Exception):
+                    applied = self._record_failure(db, target, result, finished)
+                    if applied:
+                        stats.failed += 1
+                        stats.errors.append(f"{target.wid}: {result}")
+                else:
+                    applied = self._record_success(db, target, result, finished)
+                    if applied:
+                        stats.refreshed += 1
+                if not applied:
+                    stats.lost += 1
+            db.commit()
+            return stats
+        finally:
+            db.close()
+
+    def _owned(self, target: RefreshTarget):
+        return update(Asset).where(Asset.wid == target.wid, Asset.next_update == target.lease)
+
+    def _record_success(
+        self, db: Session, target: RefreshTarget, balance: VendorBalance, now: datetime
+    ) -> bool:
+        values = {
+            "balance_current": balance.balance_current,
+            "balance_as_of": balance.balance_as_of or now,
+            "balance_from": "Vendor",
+            "last_update": now,
+            "next_update": now + timedelta(seconds=self.interval_seconds),
+            "refresh_failures": 0,
+            "status": None,
+            "status_code": "Updated",
+        }
+        for name in ("balance_cost_basis", "balance_price", "balance_quantity_current"):
+            if getattr(balance, name) is not None:
+                values[name] = getattr(balance, name)
+        return db.execute(self._owned(target).values(**values)).rowcount == 1
+
+    def _record_failure(
+        self, db: Session, target: RefreshTarget, error: Exception, now: datetime
+    ) -> bool:
+        failures = target.refresh_failures + 1
+        logger.warning("Refresh of asset %s failed (%d in a row): %s", target.wid, failures, error)
+        values = {
+            "next_update": now + backoff_delay(
+                failures, self.backoff_base_seconds, self.backoff_max_seconds
+            ),
+            "refresh_failures": failures,
+            "status": str(error)[:MAX_STATUS_LENGTH],
+            "status_code": "RefreshFailed",
+        }
+        return db.execute(self._owned(target).values(**values)).rowcount == 1
+
+    def run_forever(self, stop: threading.Event, poll_seconds: float = settings.refresh_poll_seconds) -> None:
+        """Run passes until ``stop`` is set, sleeping only when nothing was due."""
+        while not stop.is_set():
+            try:
+                stats = self.run_once()
+            except Exception:
+                logger.exception("Refresh pass failed")
+                stats = RefreshStats()
+            if stats.claimed:
+                logger.info(
+                    "Refreshed %d assets (%d failed, %d lost)",
+                    stats.refreshed, stats.failed, stats.lost,
+                )
+            if stats.claimed < self.batch_size:
+                stop.wait(poll_seconds)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
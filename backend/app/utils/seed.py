@@ -1,3 +1,4 @@
+import hashlib
 import json
 import uuid
 from dataclasses import dataclass
@@ -5,9 +6,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from sqlalchemy import String, all_, bindparam, delete, false, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
 from ..models.asset import Asset
+from ..models.asset_detail import DETAIL_FIELDS, AssetDetail
+from ..models.holding import AssetHolding
+from .holdings import insert_positions, position_rows
+
+# Feed records written per upsert statement during a sync
+SYNC_BATCH_SIZE = 1000
 
 
 @dataclass
@@ -16,6 +26,9 @@ class SeedResult:
     inserted: int
     skipped: int
     errors: list[str]
+    updated: int = 0
+    unchanged: int = 0
+    deactivated: int = 0
 
 
 def get_seed_data_path() -> Path:
@@ -131,13 +144,98 @@ def convert_to_snake_case(data: dict[str, Any]) -> dict[str, Any]:
     return converted
 
 
-def seed_database(db: Session, data: list[dict[str, Any]] | None = None) -> SeedResult:
+def content_hash(item: dict[str, Any]) -> str:
+    """SHA-256 of a feed record, independent of key order."""
+    canonical = json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def asset_values(converted: dict[str, Any]) -> dict[str, Any]:
+    """
+    Column values for the ``assets`` row of a converted feed record.
+    
+    Args:
+        converted: Feed record with snake_case keys.
+    """
+    return {
+        "asset_id": converted.get("asset_id"),
+        "cognito_id": converted.get("cognito_id"),
+        "nickname": converted.get("nickname"),
+        "asset_name": converted.get("asset_name"),
+        "asset_description": converted.get("asset_description"),
+        "asset_info_type": converted.get("asset_info_type"),
+        "wealth_asset_type": converted.get("wealth_asset_type"),
+        "primary_asset_category": converted.get("primary_asset_category"),
+        "asset_info": parse_asset_info(converted.get("asset_info")),
+        "balance_current": converted.get("balance_current"),
+        "balance_cost_basis": converted.get("balance_cost_basis"),
+        "balance_quantity_current": converted.get("balance_quantity_current"),
+        "balance_as_of": parse_datetime(converted.get("balance_as_of")),
+        "balance_from": converted.get("balance_from"),
+        "balance_cost_from": converted.get("balance_cost_from"),
+        "balance_price": converted.get("balance_price"),
+        "balance_price_from": converted.get("balance_price_from"),
+        "is_active": converted.get("is_active"),
+        "is_asset": converted.get("is_asset"),
+        "is_favorite": converted.get("is_favorite"),
+        "include_in_net_worth": converted.get("include_in_net_worth"),
+        "has_investment": converted.get("has_investment"),
+        "is_linked_vendor": converted.get("is_linked_vendor"),
+        "institution_id": converted.get("institution_id"),
+        "institution_name": converted.get("institution_name"),
+        "user_institution_id": converted.get("user_institution_id"),
+        "integration": converted.get("integration"),
+        "integration_account_id": converted.get("integration_account_id"),
+        "asset_owner_name": converted.get("asset_owner_name"),
+        "vendor_account_type": converted.get("vendor_account_type"),
+        "vendor_container": converted.get("vendor_container"),
+        "vendor_response_type": converted.get("vendor_response_type"),
+        "asset_mask": converted.get("asset_mask"),
+        "currency_code": converted.get("currency_code"),
+        "logo_name": converted.get("logo_name"),
+        "note": converted.get("note"),
+        "note_date": parse_datetime(converted.get("note_date")),
+        "status": converted.get("status"),
+        "status_code": converted.get("status_code"),
+        "creation_date": parse_datetime(converted.get("creation_date")),
+        "modification_date": parse_datetime(converted.get("modification_date")),
+        "last_update": parse_datetime(converted.get("last_update")),
+        "last_update_attempt": parse_datetime(converted.get("last_update_attempt")),
+        "next_update": parse_datetime(converted.get("next_update")),
+        "deactivate_by": parse_datetime(converted.get("deactivate_by")),
+    }
+
+
+def detail_values(converted: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Column values for the ``asset_details`` row of a converted feed record,
+    or None when the record carries no detail payloads.
+    """
+    details = {field: converted.get(field) for field in DETAIL_FIELDS}
+    
+    # Convert holdings dict to JSON string if present
+    if isinstance(details["holdings"], dict):
+        details["holdings"] = json.dumps(details["holdings"])
+    
+    if all(value is None for value in details.values()):
+        return None
+    return details
+
+
+def seed_database(
+    db: Session, data: list[dict[str, Any]] | None = None, commit: bool = True
+) -> SeedResult:
     """
     Seed the database with asset data.
     
+    Assets whose ``asset_id`` already exists are skipped; use
+    ``sync_database`` to apply changes to existing assets.
+    
     Args:
         db: SQLAlchemy database session.
         data: List of asset dictionaries. If None, loads from default file.
+        commit: Commit the changes. Pass False to commit them together with
+            other work in the caller's transaction.
     
     Returns:
         SeedResult with counts of inserted, skipped, and any errors.
@@ -148,87 +246,45 @@ def seed_database(db: Session, data: list[dict[str, Any]] | None = None) -> Seed
     inserted = 0
     skipped = 0
     errors: list[str] = []
+    positions: list[dict[str, Any]] = []
+    
+    # Look up existing asset_ids in bulk rather than with a query per record
+    asset_ids = list({
+        asset_id
+        for item in data
+        if isinstance(item, dict) and (asset_id := convert_to_snake_case(item).get("asset_id"))
+    })
+    existing: set[str] = set()
+    for start in range(0, len(asset_ids), SYNC_BATCH_SIZE):
+        chunk = asset_ids[start:start + SYNC_BATCH_SIZE]
+        existing.update(db.scalars(select(Asset.asset_id).where(Asset.asset_id.in_(chunk))))
     
     for item in data:
         try:
             # Convert camelCase to snake_case
             converted = convert_to_snake_case(item)
             
-            # Check if asset already exists by asset_id
+            # Skip assets that already exist, or appeared earlier in the feed
             asset_id = converted.get("asset_id")
             if asset_id:
-                existing = db.query(Asset).filter(Asset.asset_id == asset_id).first()
-                if existing:
+                if asset_id in existing:
                     skipped += 1
                     continue
+                existing.add(asset_id)
             
             # Always generate a new wid (primary key) for each asset
             wid = uuid.uuid4()
             
-            # Parse special fields
-            asset_info = parse_asset_info(converted.get("asset_info"))
+            values = asset_values(converted)
+            asset = Asset(wid=wid, content_hash=content_hash(item), **values)
             
-            # Convert holdings dict to JSON string if present
-            holdings = converted.get("holdings")
-            if holdings is not None and isinstance(holdings, dict):
-                holdings = json.dumps(holdings)
-            
-            # Create asset instance
-            asset = Asset(
-                wid=wid,
-                asset_id=converted.get("asset_id"),
-                cognito_id=converted.get("cognito_id"),
-                nickname=converted.get("nickname"),
-                asset_name=converted.get("asset_name"),
-                asset_description=converted.get("asset_description"),
-                asset_info_type=converted.get("asset_info_type"),
-                wealth_asset_type=converted.get("wealth_asset_type"),
-                primary_asset_category=converted.get("primary_asset_category"),
-                asset_info=asset_info,
-                balance_current=converted.get("balance_current"),
-                balance_cost_basis=converted.get("balance_cost_basis"),
-                balance_quantity_current=converted.get("balance_quantity_current"),
-                balance_as_of=parse_datetime(converted.get("balance_as_of")),
-                balance_from=converted.get("balance_from"),
-                balance_cost_from=converted.get("balance_cost_from"),
-                balance_price=converted.get("balance_price"),
-                balance_price_from=converted.get("balance_price_from"),
-                is_active=converted.get("is_active"),
-                is_asset=converted.get("is_asset"),
-                is_favorite=converted.get("is_favorite"),
-                include_in_net_worth=converted.get("include_in_net_worth"),
-                has_investment=converted.get("has_investment"),
-                is_linked_vendor=converted.get("is_linked_vendor"),
-                institution_id=converted.get("institution_id"),
-                institution_name=converted.get("institution_name"),
-                user_institution_id=converted.get("user_institution_id"),
-                integration=converted.get("integration"),
-                integration_account_id=converted.get("integration_account_id"),
-                asset_owner_name=converted.get("asset_owner_name"),
-                ownership=converted.get("ownership"),
-                beneficiary_composition=converted.get("beneficiary_composition"),
-                vendor_account_type=converted.get("vendor_account_type"),
-                vendor_container=converted.get("vendor_container"),
-                vendor_response=converted.get("vendor_response"),
-                vendor_response_type=converted.get("vendor_response_type"),
-                asset_mask=converted.get("asset_mask"),
-                currency_code=converted.get("currency_code"),
-                description_estate_plan=converted.get("description_estate_plan"),
-                holdings=holdings,
-                logo_name=converted.get("logo_name"),
-                note=converted.get("note"),
-                note_date=parse_datetime(converted.get("note_date")),
-                status=converted.get("status"),
-                status_code=converted.get("status_code"),
-                creation_date=parse_datetime(converted.get("creation_date")),
-                modification_date=parse_datetime(converted.get("modification_date")),
-                last_update=parse_datetime(converted.get("last_update")),
-                last_update_attempt=parse_datetime(converted.get("last_update_attempt")),
-                next_update=parse_datetime(converted.get("next_update")),
-                deactivate_by=parse_datetime(converted.get("deactivate_by")),
-            )
+            # Large payloads are stored separately from the assets row
+            details = detail_values(converted)
+            if details is not None:
+                asset.details = AssetDetail(**details)
             
             db.add(asset)
+            positions.extend(position_rows(wid, {**converted, "asset_info": values["asset_info"]}))
             inserted += 1
             
         except Exception as e:
@@ -236,7 +292,190 @@ def seed_database(db: Session, data: list[dict[str, Any]] | None = None) -> Seed
     
     # Commit all changes
     if inserted > 0:
-        db.commit()
+        # Assets must exist before their positions reference them
+        db.flush()
+        insert_positions(db, positions)
+        if commit:
+            db.commit()
     
     return SeedResult(inserted=inserted, skipped=skipped, errors=errors)
 
+
+def sync_database(
+    db: Session,
+    data: list[dict[str, Any]] | None = None,
+    deactivate_missing: bool = False,
+    commit: bool = True,
+) -> SeedResult:
+    """
+    Incrementally sync the database with a full asset feed.
+    
+    Each record's content hash is compared with the stored hash in bulk, and
+    only new or changed records are written, with
+    ``INSERT ... ON CONFLICT (asset_id) DO UPDATE ... WHERE content_hash
+    IS DISTINCT FROM excluded.content_hash``. Unchanged rows are not touched,
+    so they generate no WAL, dead tuples or change notifications.
+    
+    Args:
+        db: SQLAlchemy database session.
+        data: List of asset dictionaries. If None, loads from default file.
+        deactivate_missing: Mark active assets whose ``asset_id`` is not in
+            the feed as inactive.
+        commit: Commit the changes. Pass False to commit them together with
+            other work in the caller's transaction.
+    
+    Returns:
+        SeedResult with counts of inserted, updated, unchanged and
+        deactivated assets, and any errors.
+    """
+    if data is None:
+        data = load_seed_data()
+    
+    errors: list[str] = []
+    # asset_id -> (content hash, converted record, assets row values)
+    records: dict[str, tuple[str, dict[str, Any], dict[str, Any]]] = {}
+    feed_ids: list[str] = []
+    for item in data:
+        try:
+            converted = convert_to_snake_case(item)
+            asset_id = converted.get("asset_id")
+            if not asset_id:
+                errors.append("Error processing asset: missing assetId, cannot sync")
+                continue
+            # Malformed records must not deactivate their stored asset
+            feed_ids.append(asset_id)
+            # Convert up front so a malformed record is reported, not fatal
+            values = asset_values(converted)
+            detail_values(converted)
+            records[asset_id] = (content_hash(item), converted, values)
+        except Exception as e:
+            errors.append(f"Error processing asset: {str(e)}")
+    
+    # Compare hashes in bulk and keep only new or changed records
+    stored: dict[str, str | None] = {}
+    asset_ids = list(records)
+    for start in range(0, len(asset_ids), SYNC_BATCH_SIZE):
+        chunk = asset_ids[start:start + SYNC_BATCH_SIZE]
+        stored.update(db.execute(
+            select(Asset.asset_id, Asset.content_hash).where(Asset.asset_id.in_(chunk))
+        ).all())
+    changed = [
+        asset_id for asset_id, (digest, _, _) in records.items()
+        if asset_id not in stored or stored[asset_id] != digest
+    ]
+    
+    inserted = 0
+    updated = 0
+    failed = 0
+    for start in range(0, len(changed), SYNC_BATCH_SIZE):
+        batch = changed[start:start + SYNC_BATCH_SIZE]
+        try:
+            with db.begin_nested():
+                written = _upsert_assets(db, batch, records)
+        except DBAPIError:
+            # A value the database rejects fails the whole statement; retry
+            # record by record so only the bad ones are skipped
+            written = {}
+            for asset_id in batch:
+                try:
+                    with db.begin_nested():
+                        written.update(_upsert_assets(db, [asset_id], records))
+                except DBAPIError as e:
+                    failed += 1
+                    errors.append(f"Error processing asset {asset_id}: {e.orig}")
+        
+        for asset_id in written:
+            if asset_id in stored:
+                updated += 1
+            else:
+                inserted += 1
+    
+    deactivated = 0
+    if deactivate_missing:
+        deactivated = deactivate_missing_assets(db, feed_ids)
+    
+    if commit:
+        db.commit()
+    
+    return SeedResult(
+        inserted=inserted,
+        skipped=0,
+        errors=errors,
+        updated=updated,
+        unchanged=len(records) - inserted - updated - failed,
+        deactivated=deactivated,
+    )
+
+
+def _upsert_assets(
+    db: Session,
+    asset_ids: list[str],
+    records: dict[str, tuple[str, dict[str, Any], dict[str, Any]]],
+) -> dict[str, uuid.UUID]:
+    """
+    Upsert new or changed assets and their dependents in one statement.
+    
+    Returns:
+        wid of every asset written, by asset_id.
+    """
+    rows = [
+        {"wid": uuid.uuid4(), "content_hash": records[asset_id][0], **records[asset_id][2]}
+        for asset_id in asset_ids
+    ]
+    stmt = insert(Asset).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Asset.asset_id],
+        set_={name: stmt.excluded[name] for name in rows[0] if name != "wid"},
+        where=Asset.content_hash.is_distinct_from(stmt.excluded.content_hash),
+    ).returning(Asset.wid, Asset.asset_id)
+    written = {asset_id: wid for wid, asset_id in db.execute(stmt)}
+    _replace_dependents(db, {wid: records[asset_id][1] for asset_id, wid in written.items()})
+    return written
+
+
+def deactivate_missing_assets(db: Session, asset_ids: list[str]) -> int:
+    """
+    Mark active assets whose ``asset_id`` is not in ``asset_ids`` inactive.
+    
+    Returns:
+        Number of assets deactivated.
+    """
+    # An empty feed is more likely a broken export than a closed portfolio
+    if not asset_ids:
+        return 0
+    
+    stmt = (
+        update(Asset)
+        .where(
+            Asset.asset_id.is_not(None),
+            # One array parameter rather than a bound parameter per id
+            Asset.asset_id != all_(bindparam("asset_ids", asset_ids, type_=ARRAY(String))),
+            Asset.is_active.is_distinct_from(false()),
+        )
+        # Clearing the hash makes the asset rewritten if it reappears
+        .values(is_active=False, content_hash=None)
+    )
+    return db.execute(stmt).rowcount
+
+
+def _replace_dependents(db: Session, assets: dict[uuid.UUID, dict[str, Any]]) -> None:
+    """Rewrite the detail row and positions of freshly upserted assets."""
+    if not assets:
+        return
+    wids = list(assets)
+    
+    db.execute(delete(AssetDetail).where(AssetDetail.asset_wid.in_(wids)))
+    detail_rows = [
+        {"asset_wid": wid, **details}
+        for wid, converted in assets.items()
+        if (details := detail_values(converted)) is not None
+    ]
+    if detail_rows:
+        db.execute(insert(AssetDetail), detail_rows)
+    
+    db.execute(delete(AssetHolding).where(AssetHolding.asset_wid.in_(wids)))
+    positions: list[dict[str, Any]] = []
+    for wid, converted in assets.items():
+        asset_info = parse_asset_info(converted.get("asset_info"))
+        positions.extend(position_rows(wid, {**converted, "asset_info": asset_info}))
+    insert_positions(db, positions)
@@ -0,0 +1,315 @@
+import logging
+import threading
+import uuid
+from concurrent import futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import and_, case, func, or_, update
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.seed_job import SeedJob
+from .seed import (
+    convert_to_snake_case,
+    deactivate_missing_assets,
+    load_seed_data,
+    seed_database,
+    sync_database,
+)
+
+logger = logging.getLogger(__name__)
+
+# Errors kept on a job row; later ones are only counted in the log
+MAX_JOB_ERRORS = 100
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def job_progress(job: SeedJob, now: datetime | None = None) -> tuple[float | None, float | None]:
+    """
+    Throughput and remaining time of a job.
+    
+    Returns:
+        Tuple of (rows per second, estimated seconds remaining). Either is
+        None until it can be computed.
+    """
+    if job.started_at is None or not job.processed_rows:
+        return None, None
+    
+    end = job.finished_at or now or _now()
+    elapsed = (end - job.started_at).total_seconds()
+    if elapsed <= 0:
+        return None, None
+    
+    throughput = job.processed_rows / elapsed
+    if job.status in FINISHED_STATUSES:
+        return throughput, 0.0
+    if job.total_rows is None:
+        return throughput, None
+    return throughput, (job.total_rows - job.processed_rows) / throughput
+
+
+def claim_seed_jobs(
+    db: Session,
+    stale_seconds: float | None = None,
+    max_attempts: int | None = None,
+    now: datetime | None = None,
+) -> list[uuid.UUID]:
+    """
+    Claim unfinished jobs that no worker is running, and commit.
+    
+    A job is claimable when a shutdown interrupted it (``heartbeat_at`` is
+    NULL and it is pending) or when its heartbeat is older than
+    ``stale_seconds`` because its worker died. Claiming refreshes the
+    heartbeat in a single UPDATE, so concurrent workers never claim the same
+    job. Stale jobs that have already run ``max_attempts`` times are failed
+    instead, so a job that keeps killing its worker can't be polled forever.
+    
+    Returns:
+        Ids of the claimed jobs, to be passed to ``run_seed_job``.
+    """
+    stale_seconds = settings.seed_job_stale_seconds if stale_seconds is None else stale_seconds
+    max_attempts = max_attempts or settings.seed_job_max_attempts
+    now = now or _now()
+    
+    unfinished = SeedJob.status.not_in(FINISHED_STATUSES)
+    interrupted = and_(SeedJob.status == "pending", SeedJob.heartbeat_at.is_(None))
+    stale = SeedJob.heartbeat_at < now - timedelta(seconds=stale_seconds)
+    conditions = [unfinished, or_(interrupted, stale)]
+    
+    db.execute(
+        update(SeedJob)
+        .where(*conditions, stale, SeedJob.attempts >= max_attempts)
+        .values(
+            status="failed",
+            finished_at=now,
+            errors=SeedJob.errors.op("||")(
+                func.jsonb_build_array(f"Job failed: worker stopped responding {max_attempts} times")
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    claimed = db.scalars(
+        update(SeedJob)
+        .where(*conditions)
+        # An interrupted job stopped cleanly; only a takeover counts as a new attempt
+        .values(
+            heartbeat_at=now,
+            attempts=SeedJob.attempts + case((SeedJob.heartbeat_at.is_(None), 0), else_=1),
+        )
+        .returning(SeedJob.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.commit()
+    return list(claimed)
+
+
+def run_seed_job(
+    session_factory: Callable[[], Session],
+    job_id: uuid.UUID,
+    file_path: Path | None = None,
+    chunk_size: int | None = None,
+    stop: threading.Event | None = None,
+) -> None:
+    """
+    Run a seed job, committing and recording progress after every chunk.
+    
+    The job's ``cancel_requested`` flag is checked between chunks; chunks
+    committed before a cancellation or failure stay committed. Each chunk is
+    committed in the same transaction as the job's counters, with the job row
+    locked, so the counters describe exactly what was written and a
+    concurrent takeover waits for the chunk to finish.
+    
+    A job resumes after its last committed chunk. When ``stop`` is set, the
+    job is left pending with no heartbeat after the current chunk, to be
+    resumed by the next worker that calls ``claim_seed_jobs``. If another
+    worker takes the job over, this run stops without writing to it.
+    """
+    chunk_size = chunk_size or settings.seed_chunk_size
+    attempt = None
+    db = session_factory()
+    try:
+        job = db.get(SeedJob, job_id)
+        if job.status in FINISHED_STATUSES:
+            return
+        # A takeover increments attempts; it identifies this run's ownership
+        attempt = job.attempts
+        if stop is not None and stop.is_set():
+            _interrupt(db, job)
+            return
+        
+        job.status = "running"
+        job.started_at = job.started_at or _now()
+        job.heartbeat_at = _now()
+        if file_path is not None:
+            job.file_path = str(file_path)
+        db.commit()
+        
+        data = load_seed_data(Path(job.file_path) if job.file_path else None)
+        job.total_rows = len(data)
+        job.heartbeat_at = _now()
+        db.commit()
+        
+        for start in range(job.processed_rows, len(data), chunk_size):
+            # Pick up cancellation or a takeover by any process, and hold the
+            # job row until this chunk and its counters are committed
+            db.refresh(job, with_for_update=True)
+            if job.attempts != attempt or job.status != "running":
+                return
+            if job.cancel_requested:
+                job.status = "cancelled"
+                break
+            if stop is not None and stop.is_set():
+                _interrupt(db, job)
+                return
+            
+            chunk = data[start:start + chunk_size]
+            if job.sync:
+                result = sync_database(db, chunk, commit=False)
+            else:
+                result = seed_database(db, chunk, commit=False)
+            
+            job.processed_rows += len(chunk)
+            job.inserted += result.inserted
+            job.updated += result.updated
+            job.unchanged += result.unchanged
+            job.skipped += result.skipped
+            if result.errors and len(job.errors) < MAX_JOB_ERRORS:
+                job.errors = (job.errors + result.errors)[:MAX_JOB_ERRORS]
+            job.heartbeat_at = _now()
+            db.commit()
+        else:
+            if job.sync and job.deactivate_missing:
+                asset_ids = [
+                    asset_id for item in data
+                    if (asset_id := convert_to_snake_case(item).get("asset_id"))
+                ]
+                job.deactivated = deactivate_missing_assets(db, asset_ids)
+            job.status = "completed"
+        
+        job.finished_at = _now()
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        job = db.get(SeedJob, job_id)
+        if attempt is not None and job.attempts != attempt:
+            return
+        job.status = "failed"
+        job.errors = (job.errors + [f"Job failed: {str(e)}"])[-MAX_JOB_ERRORS:]
+        job.finished_at = _now()
+        db.commit()
+    finally:
+        db.close()
+
+
+def _interrupt(db: Session, job: SeedJob) -> None:
+    """Leave a job for another worker to resume straight away."""
+    job.status = "pending"
+    job.heartbeat_at = None
+    db.commit()
+
+
+class SeedJobRunner:
+    """
+    Runs seed jobs on a thread pool owned by the app rather than a request.
+    
+    A job outlives the request that started it, so it neither holds an
+    admission control slot nor counts as an in-flight request during a
+    graceful restart. ``start`` resumes unfinished jobs and keeps taking
+    over stale ones; ``close`` stops running jobs after their current chunk
+    and leaves them to be resumed by the next worker to start.
+    """
+    
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._stop = threading.Event()
+        self._futures: set[Future] = set()
+        self._monitor: threading.Thread | None = None
+    
+    def _pool(self) -> ThreadPoolExecutor:
+        """The job pool, created on first use after ``close``. Call with the lock held."""
+        if self._executor is None:
+            self._stop = threading.Event()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="seed-job"
+            )
+        return self._executor
+    
+    def submit(self, session_factory: Callable[[], Session], job_id: uuid.UUID) -> Future:
+        with self._lock:
+            future = self._pool().submit(run_seed_job, session_factory, job_id, stop=self._stop)
+            self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
+    
+    def resume(self, session_factory: Callable[[], Session]) -> list[uuid.UUID]:
+        """Claim interrupted or stale jobs and run them here."""
+        db = session_factory()
+        try:
+            claimed = claim_seed_jobs(db)
+        finally:
+            db.close()
+        for claimed_id in claimed:
+            self.submit(session_factory, claimed_id)
+        return claimed
+    
+    def start(
+        self, session_factory: Callable[[], Session], interval: float | None = None
+    ) -> list[uuid.UUID]:
+        """
+        Resume unfinished jobs, then look for stale ones every ``interval``
+        seconds until ``close``.
+        
+        Returns:
+            Ids of the jobs resumed straight away.
+        """
+        interval = interval or settings.seed_job_check_seconds
+        with self._lock:
+            self._pool()
+            stop = self._stop
+        claimed = self.resume(session_factory)
+        self._monitor = threading.Thread(
+            target=self._take_over_stale_jobs,
+            args=(session_factory, interval, stop),
+            name="seed-job-monitor",
+            daemon=True,
+        )
+        self._monitor.start()
+        return claimed
+    
+    def _take_over_stale_jobs(
+        self, session_factory: Callable[[], Session], interval: float, stop: threading.Event
+    ) -> None:
+        while not stop.wait(interval):
+            try:
+                self.resume(session_factory)
+            except Exception:
+                logger.exception("Could not check for stale seed jobs")
+    
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for every submitted job to finish or stop."""
+        futures.wait(list(self._futures), timeout=timeout)
+    
+    def close(self) -> None:
+        """Stop jobs after their current chunk and shut the pool down."""
+        self._stop.set()
+        # The monitor may still be submitting a job it just claimed
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+seed_job_runner = SeedJobRunner()
@@ -0,0 +1,66 @@
+"""
+Gunicorn configuration for the production serving mode.
+
+Runs the FastAPI app in several uvicorn worker processes:
+
+    cd backend
+    gunicorn -c gunicorn.conf.py app.main:app
+
+The worker count defaults to one per CPU and can be set with WEB_CONCURRENCY.
+Each worker's database pool is sized from DB_CONNECTION_BUDGET (see
+``app.database.pool_limits``), so adding workers never exceeds the budget.
+
+Send SIGHUP to the master to gracefully restart the workers. The app is
+preloaded in the master, so picking up new code needs a fresh master: send
+SIGUSR2 to start one, then SIGTERM to the old master once it is serving.
+"""
+import multiprocessing
+import os
+import sys
+
+from app.config import settings
+
+# Settings are read when the app is imported, so resolve the worker count
+# before preloading it. Each worker needs at least two connections (one
+# pooled, one for LISTEN), which caps the worker count at half the budget.
+workers = settings.web_concurrency or multiprocessing.cpu_count()
+max_workers = max(1, settings.db_connection_budget // 2)
+if workers > max_workers:
+    print(
+        f"DB_CONNECTION_BUDGET={settings.db_connection_budget} allows at most "
+        f"{max_workers} workers; starting {max_workers} instead of {workers}",
+        file=sys.stderr,
+    )
+    workers = max_workers
+settings.web_concurrency = workers
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# Tables are created once in the master instead of racing in every worker
+settings.create_tables_on_startup = False
+os.environ["CREATE_TABLES_ON_STARTUP"] = "false"
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# Long-lived SSE streams get this long to finish on reload or shutdown
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.environ.get("WORKER_TIMEOUT", "60"))
+keepalive = 5
+
+accesslog = "-"
+
+
+def on_starting(server):
+    """Create database tables once, before any worker is forked."""
+    from app.database import create_tables, engine
+
+    create_tables()
+    engine.dispose()
+
+
+def post_fork(server, worker):
+    """Drop pool connections inherited from the master."""
+    from app.database import engine
+
+    engine.dispose(close=False)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+CLI script to measure API throughput as the number of gunicorn workers grows.
+
+Starts the production server (gunicorn.conf.py) once per worker count, drives
+it with concurrent clients for a fixed duration and prints requests/second
+and latency percentiles for each run.
+
+Usage:
+    cd backend
+    python scripts/benchmark_workers.py [--workers 1 2 4] [--path /api/v1/assets?page_size=100]
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+
+def start_server(workers: int, port: int, database_url: str | None) -> subprocess.Popen:
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), PORT=str(port))
+    if database_url:
+        env["DATABASE_URL"] = database_url
+    # Access logging would dominate the measurement
+    return subprocess.Popen(
+        ["gunicorn", "-c", "gunicorn.conf.py", "--access-logfile", "/dev/null", "app.main:app"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+async def drive_load(url: str, concurrency: int, duration: float) -> tuple[list[float], int]:
+    """Issue requests from ``concurrency`` clients until ``duration`` elapses."""
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def client_loop(client: httpx.AsyncClient):
+        nonlocal errors
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            response = await client.get(url)
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+    return latencies, errors
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark API throughput across gunicorn worker counts."
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="Worker counts to benchmark. Defaults to 1 2 4",
+    )
+    parser.add_argument(
+        "--path",
+        type=str,
+        default="/api/v1/assets?page_size=100",
+        help="Request path to load. Defaults to the first page of 100 assets",
+    )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=32,
+        help="Number of concurrent clients. Defaults to 32",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=10.0,
+        help="Seconds of load per worker count. Defaults to 10",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Port to run the benchmark server on. Defaults to 8765",
+    )
+    parser.add_argument(
+        "--database-url",
+        "-d",
+        type=str,
+        default=None,
+        help="Database URL. Defaults to DATABASE_URL environment variable.",
+    )
+
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    print(f"CPUs: {os.cpu_count()}, clients: {args.concurrency}, path: {args.path}\n")
+    print(f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7} {'speedup':>8}")
+
+    baseline = None
+    for workers in args.workers:
+        server = start_server(workers, args.port, args.database_url)
+        try:
+            wait_until_ready(base_url)
+            # Warm up connection pools and caches before measuring
+            asyncio.run(drive_load(base_url + args.path, args.concurrency, 1.0))
+            latencies, errors = asyncio.run(
+                drive_load(base_url + args.path, args.concurrency, args.duration)
+            )
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait()
+
+        if not latencies:
+            print(f"{workers:>7} {'-':>9} {'-':>8} {'-':>8} {errors:>7} {'-':>8}")
+            continue
+
+        throughput = len(latencies) / args.duration
+        baseline = baseline or throughput
+        print(
+            f"{workers:>7} {throughput:>9.1f} "
+            f"{percentile(latencies, 50) * 1000:>8.1f} {percentile(latencies, 99) * 1000:>8.1f} "
+            f"{errors:>7} {throughput / baseline:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+CLI script to export the assets table as Parquet or an Arrow IPC stream.
+
+Usage:
+    cd backend
+    python scripts/export.py --output assets.parquet [--format parquet|arrow]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.utils.export import DEFAULT_BATCH_SIZE, EXPORT_FORMATS, write_assets
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export the assets table to a columnar file."
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        required=True,
+        help="Path of the file to write.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(EXPORT_FORMATS),
+        default=None,
+        help="Export format. Defaults to the output file extension, or parquet.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows per record batch. Defaults to {DEFAULT_BATCH_SIZE}.",
+    )
+    parser.add_argument(
+        "--database-url",
+        "-d",
+        type=str,
+        default=None,
+        help="Database URL. Defaults to DATABASE_URL environment variable.",
+    )
+    
+    args = parser.parse_args()
+    
+    export_format = args.format
+    if export_format is None:
+        export_format = "arrow" if args.output.suffix in (".arrow", ".arrows") else "parquet"
+    
+    # Connect to the database
+    database_url = args.database_url or settings.database_url
+    print(f"Connecting to database...")
+    
+    engine = create_engine(database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    db = SessionLocal()
+    try:
+        print(f"Exporting assets as {export_format} to: {args.output}")
+        total = 0
+        with open(args.output, "wb") as sink:
+            for rows in write_assets(db, sink, export_format, args.batch_size):
+                total += rows
+                print(f"  {total} rows written")
+        
+        print(f"\nExported {total} assets.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
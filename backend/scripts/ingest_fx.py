@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+CLI script to load exchange rates into the fx_rates table.
+
+Usage:
+    cd backend
+    python scripts/ingest_fx.py [--file path/to/fx_rates.json]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.database import Base
+from app.utils.fx import get_fx_rates_path, ingest_fx_rates, load_fx_file
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load exchange rates from a JSON file into the database."
+    )
+    parser.add_argument(
+        "--file",
+        "-f",
+        type=Path,
+        default=None,
+        help="Path to the JSON rates file. Defaults to backend/data/fx_rates.json",
+    )
+    parser.add_argument(
+        "--database-url",
+        "-d",
+        type=str,
+        default=None,
+        help="Database URL. Defaults to DATABASE_URL environment variable.",
+    )
+    
+    args = parser.parse_args()
+    
+    file_path = args.file or get_fx_rates_path()
+    
+    if not file_path.exists():
+        print(f"Error: FX rates file not found: {file_path}")
+        sys.exit(1)
+    
+    try:
+        rates, as_of = load_fx_file(file_path)
+    except Exception as e:
+        print(f"Error loading FX rates: {e}")
+        sys.exit(1)
+    
+    # Connect to the database
+    database_url = args.database_url or settings.database_url
+    print(f"Connecting to database...")
+    
+    engine = create_engine(database_url)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    # Ensure tables exist
+    Base.metadata.create_all(bind=engine)
+    
+    db = SessionLocal()
+    try:
+        version = ingest_fx_rates(db, rates, as_of)
+        print(f"Loaded {len(rates)} exchange rates from {file_path} (version {version})")
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+CLI script to run the vendor balance refresh scheduler.
+
+Any number of these can run at once, on one host or many; each claims its
+own batches of due assets.
+
+Usage:
+    cd backend
+    python scripts/refresh.py [--once] [--batch-size 100]
+"""
+import argparse
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.database import Base
+from app.utils.refresh import RefreshScheduler, load_vendor_client
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Refresh balances of vendor-linked assets as they come due."
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Run a single pass and exit instead of polling.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        "-b",
+        type=int,
+        default=settings.refresh_batch_size,
+        help=f"Assets claimed per pass. Defaults to {settings.refresh_batch_size}",
+    )
+    parser.add_argument(
+        "--vendor-client",
+        type=str,
+        default=None,
+        help="Vendor client class as module:Class. Defaults to REFRESH_VENDOR_CLIENT.",
+    )
+    parser.add_argument(
+        "--database-url",
+        "-d",
+        type=str,
+        default=None,
+        help="Database URL. Defaults to DATABASE_URL environment variable.",
+    )
+    
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    
+    # Connect to the database
+    database_url = args.database_url or settings.database_url
+    print(f"Connecting to database...")
+    
+    engine = create_engine(database_url, pool_size=2)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    # Ensure tables exist
+    Base.metadata.create_all(bind=engine)
+    
+    scheduler = RefreshScheduler(
+        SessionLocal,
+        load_vendor_client(args.vendor_client),
+        batch_size=args.batch_size,
+    )
+    try:
+        if args.once:
+            stats = scheduler.run_once()
+            print(f"Claimed {stats.claimed}, refreshed {stats.refreshed}, failed {stats.failed}, lost {stats.lost}")
+            for error in stats.errors:
+                print(f"  - {error}")
+            return
+        
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        print("Refreshing due assets (Ctrl+C to stop)...")
+        scheduler.run_forever(stop)
+    finally:
+        scheduler.close()
+
+
+if __name__ == "__main__":
+    main()
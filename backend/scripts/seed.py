@@ -5,6 +5,7 @@ CLI script to seed the database with asset data from assets.json.
 Usage:
     cd backend
     python scripts/seed.py [--file path/to/assets.json]
+    python scripts/seed.py --rebuild-holdings
 """
 import argparse
 import sys
@@ -18,7 +19,9 @@ from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
 from app.database import Base
-from app.utils.seed import load_seed_data, seed_database, get_seed_data_path
+from app.utils.details import migrate_inline_details
+from app.utils.holdings import rebuild_holdings
+from app.utils.seed import load_seed_data, seed_database, get_seed_data_path, sync_database
 
 
 def main():
@@ -39,6 +42,26 @@ def main():
         default=None,
         help="Database URL. Defaults to DATABASE_URL environment variable.",
     )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Insert new assets and update changed ones instead of skipping existing assets.",
+    )
+    parser.add_argument(
+        "--deactivate-missing",
+        action="store_true",
+        help="With --sync, mark assets that are not in the file as inactive.",
+    )
+    parser.add_argument(
+        "--rebuild-holdings",
+        action="store_true",
+        help="Rebuild the asset_holdings positions table from existing assets instead of seeding.",
+    )
+    parser.add_argument(
+        "--migrate-details",
+        action="store_true",
+        help="Move inline detail payloads from the assets table into asset_details instead of seeding.",
+    )
     
     args = parser.parse_args()
     
@@ -59,6 +82,26 @@ def main():
     # Ensure tables exist
     Base.metadata.create_all(bind=engine)
     
+    if args.migrate_details:
+        db = SessionLocal()
+        try:
+            print("Moving asset details out of the assets table...")
+            written = migrate_inline_details(db)
+            print(f"Wrote {written} detail rows.")
+        finally:
+            db.close()
+        return
+    
+    if args.rebuild_holdings:
+        db = SessionLocal()
+        try:
+            print("Rebuilding asset holdings...")
+            written = rebuild_holdings(db)
+            print(f"Wrote {written} positions.")
+        finally:
+            db.close()
+        return
+    
     # Load and seed data
     print(f"Loading seed data from: {file_path}")
     
@@ -69,6 +112,26 @@ def main():
         print(f"Error loading seed data: {e}")
         sys.exit(1)
     
+    if args.sync:
+        db = SessionLocal()
+        try:
+            print("Syncing database...")
+            result = sync_database(db, data, deactivate_missing=args.deactivate_missing)
+            
+            print(f"\nSync completed:")
+            print(f"  Inserted: {result.inserted}")
+            print(f"  Updated: {result.updated}")
+            print(f"  Unchanged: {result.unchanged}")
+            print(f"  Deactivated: {result.deactivated}")
+            
+            if result.errors:
+                print(f"  Errors: {len(result.errors)}")
+                for error in result.errors:
+                    print(f"    - {error}")
+        finally:
+            db.close()
+        return
+    
     # Seed the database
     db = SessionLocal()
     try:
@@ -1,5 +1,6 @@
 import os
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Generator
 
@@ -11,6 +12,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from app.database import Base, get_db
 from app.main import app
 from app.models.asset import Asset
+from app.utils.profiling import count_queries
 
 # Use test database URL
 TEST_DATABASE_URL = os.environ.get(
@@ -55,6 +57,35 @@ def client(db: Session) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def assert_max_queries():
+    """
+    Fail a block that runs more statements than expected.
+    
+    Usage::
+    
+        with assert_max_queries(3, max_repeats=1):
+            client.get("/api/v1/assets")
+    
+    ``max_repeats`` bounds how often any single statement shape may run,
+    which catches N+1 loops even when the total stays small.
+    """
+    
+    @contextmanager
+    def check(max_queries: int, max_repeats: int | None = None):
+        with count_queries(engine) as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"Expected at most {max_queries} statements:\n{stats.report()}"
+        )
+        if max_repeats is not None:
+            assert not stats.repeated(max_repeats + 1), (
+                f"Statement repeated more than {max_repeats} times:\n{stats.report()}"
+            )
+    
+    return check
+
+
 @pytest.fixture
 def sample_asset_data() -> dict:
     """Return sample asset data matching the JSON format."""
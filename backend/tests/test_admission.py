@@ -0,0 +1,187 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.main import app as main_app
+from app.middleware.admission import AdmissionControlMiddleware
+from app.middleware.coalescing import RequestCoalescingMiddleware, request_key
+from app.middleware.compression import CompressionMiddleware
+
+
+def make_app() -> tuple[FastAPI, dict]:
+    """An app whose /slow endpoint blocks until ``state['release']`` is set."""
+    app = FastAPI()
+    state = {"calls": 0, "release": asyncio.Event()}
+
+    @app.get("/slow")
+    async def slow(page: int = 1):
+        state["calls"] += 1
+        await state["release"].wait()
+        return {"page": page, "call": state["calls"]}
+
+    @app.get("/fast")
+    async def fast():
+        return {"ok": True}
+
+    return app, state
+
+
+async def settle():
+    """Let queued requests reach the middleware."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestRequestCoalescing:
+    """Tests for RequestCoalescingMiddleware."""
+
+    def test_request_key_ignores_query_order(self):
+        first = request_key({"path": "/a", "query_string": b"page=2&is_active=true"})
+        second = request_key({"path": "/a", "query_string": b"is_active=true&page=2"})
+
+        assert first == second
+
+    def test_request_key_includes_credentials(self):
+        scope = {"path": "/a", "query_string": b""}
+        anonymous = request_key({**scope, "headers": []})
+        first = request_key({**scope, "headers": [(b"authorization", b"Bearer a")]})
+        second = request_key({**scope, "headers": [(b"authorization", b"Bearer b")]})
+
+        assert len({anonymous, first, second}) == 3
+
+    def test_cors_wraps_coalescing_in_main_app(self):
+        # The first entry in user_middleware is the outermost
+        classes = [middleware.cls for middleware in main_app.user_middleware]
+
+        assert classes[0] is CORSMiddleware
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_execution(self):
+        app, state = make_app()
+        middleware = RequestCoalescingMiddleware(app, paths=["/slow"])
+        transport = httpx.ASGITransport(app=middleware)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = [asyncio.create_task(client.get("/slow?page=1")) for _ in range(5)]
+            await settle()
+            state["release"].set()
+            responses = await asyncio.gather(*requests)
+
+        assert state["calls"] == 1
+        assert middleware.coalesced == 4
+        assert all(r.json() == {"page": 1, "call": 1} for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_different_queries_run_separately(self):
+        app, state = make_app()
+        middleware = RequestCoalescingMiddleware(app, paths=["/slow"])
+        transport = httpx.ASGITransport(app=middleware)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = [asyncio.create_task(client.get(f"/slow?page={p}")) for p in (1, 2)]
+            await settle()
+            state["release"].set()
+            await asyncio.gather(*requests)
+
+        assert state["calls"] == 2
+        assert middleware.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesced_responses_get_own_cors_headers(self):
+        app, state = make_app()
+        coalescing = RequestCoalescingMiddleware(app, paths=["/slow"])
+        middleware = CORSMiddleware(
+            coalescing,
+            allow_origins=["http://one.test", "http://two.test"],
+            allow_credentials=True,
+        )
+        transport = httpx.ASGITransport(app=middleware)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = [
+                asyncio.create_task(client.get("/slow", headers={"Origin": origin}))
+                for origin in ("http://one.test", "http://two.test")
+            ]
+            await settle()
+            state["release"].set()
+            responses = await asyncio.gather(*requests)
+
+        assert coalescing.coalesced == 1
+        assert [r.headers["access-control-allow-origin"] for r in responses] == [
+            "http://one.test",
+            "http://two.test",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_responses_compressed_separately(self):
+        app, state = make_app()
+        coalescing = RequestCoalescingMiddleware(app, paths=["/slow"])
+        middleware = CompressionMiddleware(coalescing, minimum_size=0)
+        transport = httpx.ASGITransport(app=middleware)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = [
+                asyncio.create_task(client.get("/slow", headers={"Accept-Encoding": "gzip"}))
+                for _ in range(3)
+            ]
+            await settle()
+            state["release"].set()
+            responses = await asyncio.gather(*requests)
+
+        assert coalescing.coalesced == 2
+        for response in responses:
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.headers["vary"] == "Accept-Encoding"
+            assert response.json() == {"page": 1, "call": 1}
+
+
+class TestAdmissionControl:
+    """Tests for AdmissionControlMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_sheds_past_queue_threshold(self):
+        app, state = make_app()
+        middleware = AdmissionControlMiddleware(
+            app, max_concurrent=1, max_queue=1, retry_after_seconds=2
+        )
+        transport = httpx.ASGITransport(app=middleware)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            running = asyncio.create_task(client.get("/slow"))
+            await settle()
+            queued = asyncio.create_task(client.get("/slow"))
+            await settle()
+            assert middleware.queue_depth == 1
+
+            rejected = await client.get("/slow")
+
+            state["release"].set()
+            responses = await asyncio.gather(running, queued)
+
+        assert rejected.status_code == 503
+        assert rejected.headers["retry-after"] == "2"
+        assert middleware.shed == 1
+        assert [r.status_code for r in responses] == [200, 200]
+
+    @pytest.mark.asyncio
+    async def test_exempt_paths_bypass_limit(self):
+        app, state = make_app()
+        middleware = AdmissionControlMiddleware(
+            app, max_concurrent=1, max_queue=0, exempt_paths=["/fast"]
+        )
+        transport = httpx.ASGITransport(app=middleware)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            running = asyncio.create_task(client.get("/slow"))
+            await settle()
+
+            response = await client.get("/fast")
+
+            state["release"].set()
+            await running
+
+        assert response.status_code == 200
+        assert middleware.shed == 0
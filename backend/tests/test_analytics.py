@@ -0,0 +1,120 @@
+import uuid
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.asset import Asset
+from app.utils.analytics import allocation_by, concentration, summarize_gains
+
+
+class TestPortfolioAnalytics:
+    """Tests for GET /api/v1/analytics endpoint."""
+
+    def test_analytics_empty(self, client: TestClient):
+        """Test analytics when there are no assets."""
+        response = client.get("/api/v1/analytics")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["asset_count"] == 0
+        assert data["total_value"] == 0
+        assert data["return_pct"] is None
+        assert data["allocation"]["primary_asset_category"] == []
+        assert data["concentration"]["hhi"] is None
+
+    def test_allocation_and_concentration(self, client: TestClient, multiple_assets: list[Asset]):
+        """Test allocation weights and concentration across active assets."""
+        response = client.get("/api/v1/analytics?top_n=3")
+
+        assert response.status_code == 200
+        data = response.json()
+        # Active assets are indices 0-7 with balances 1000..8000
+        assert data["asset_count"] == 8
+        assert data["total_value"] == 36000.0
+
+        by_type = {entry["key"]: entry for entry in data["allocation"]["wealth_asset_type"]}
+        assert by_type["Investment"]["value"] == 20000.0
+        assert by_type["Cash"]["value"] == 16000.0
+        assert by_type["Cash"]["count"] == 4
+        assert by_type["Investment"]["weight"] == pytest.approx(20 / 36)
+        assert data["allocation"]["wealth_asset_type"][0]["key"] == "Investment"
+        assert data["allocation"]["institution_name"][0]["key"] == "Other"
+
+        conc = data["concentration"]
+        assert conc["top_n_share"] == pytest.approx(21 / 36)
+        assert conc["hhi"] == pytest.approx(sum(k * k for k in range(1, 9)) / 36**2)
+
+    def test_include_inactive(self, client: TestClient, multiple_assets: list[Asset]):
+        """Test that inactive assets can be included."""
+        response = client.get("/api/v1/analytics?include_inactive=true")
+
+        assert response.json()["asset_count"] == 10
+        assert response.json()["total_value"] == 55000.0
+
+    def test_scoped_to_user(self, client: TestClient, db: Session):
+        """Test analytics scoped to a single cognito_id with gains."""
+        db.add_all([
+            Asset(wid=uuid.uuid4(), cognito_id="user-a", balance_current=150.0, balance_cost_basis=100.0),
+            Asset(wid=uuid.uuid4(), cognito_id="user-a", balance_current=50.0, balance_cost_basis=0.0),
+            Asset(wid=uuid.uuid4(), cognito_id="user-b", balance_current=999.0, balance_cost_basis=1.0),
+            Asset(wid=uuid.uuid4(), cognito_id="user-a", balance_current=500.0, include_in_net_worth=False),
+        ])
+        db.commit()
+
+        response = client.get("/api/v1/analytics?cognito_id=user-a")
+
+        data = response.json()
+        assert data["cognito_id"] == "user-a"
+        assert data["asset_count"] == 2
+        assert data["total_value"] == 200.0
+        assert data["unrealized_gain"] == 50.0
+        assert data["return_pct"] == pytest.approx(50.0)
+
+
+class TestAnalyticsFunctions:
+    """Tests for the vectorized analytics helpers."""
+
+    def test_summarize_gains_ignores_missing_basis(self):
+        values = np.array([120.0, 80.0])
+        basis = np.array([100.0, np.nan])
+
+        result = summarize_gains(values, basis)
+
+        assert result["total_value"] == 200.0
+        assert result["unrealized_gain"] == pytest.approx(20.0)
+        assert result["return_pct"] == pytest.approx(20.0)
+
+    def test_summarize_gains_ignores_missing_balance(self):
+        # A missing balance is not a loss of the whole cost basis
+        values = np.array([120.0, np.nan])
+        basis = np.array([100.0, 10.0])
+
+        result = summarize_gains(values, basis)
+
+        assert result["total_value"] == 120.0
+        assert result["total_cost_basis"] == 100.0
+        assert result["unrealized_gain"] == pytest.approx(20.0)
+        assert result["return_pct"] == pytest.approx(20.0)
+
+    def test_allocation_groups_by_key(self):
+        keys = np.array(["b", "a", "b", "a"])
+        values = np.array([1.0, 5.0, 2.0, np.nan])
+        basis = np.array([np.nan, 4.0, np.nan, 10.0])
+
+        result = allocation_by(keys, values, basis)
+
+        assert [entry["key"] for entry in result] == ["a", "b"]
+        assert result[1]["value"] == 3.0
+        assert result[0]["unrealized_gain"] == pytest.approx(1.0)
+        assert result[0]["return_pct"] == pytest.approx(25.0)
+        assert result[1]["return_pct"] is None
+
+    def test_concentration_ignores_liabilities(self):
+        result = concentration(np.array([50.0, 50.0, -30.0]), top_n=5)
+
+        assert result["asset_count"] == 2
+        assert result["top_n_share"] == 1.0
+        assert result["hhi"] == pytest.approx(0.5)
+        assert result["effective_n"] == pytest.approx(2.0)
@@ -0,0 +1,109 @@
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.asset import Asset
+from app.models.asset_detail import AssetDetail
+from app.utils.details import legacy_detail_columns, migrate_inline_details
+
+
+@pytest.fixture
+def detailed_asset(db: Session) -> Asset:
+    """An asset with a large holdings payload."""
+    holdings = json.dumps({"positions": [{"symbol": f"S{i}", "value": i} for i in range(200)]})
+    asset = Asset(
+        wid=uuid.uuid4(),
+        nickname="Brokerage",
+        balance_current=100.0,
+        details=AssetDetail(holdings=holdings, ownership="Joint"),
+    )
+    db.add(asset)
+    db.commit()
+    return asset
+
+
+class TestAssetDetails:
+    """Tests for detail payloads stored in asset_details."""
+
+    def test_list_omits_details_by_default(self, client: TestClient, detailed_asset: Asset):
+        response = client.get("/api/v1/assets")
+
+        item = response.json()["items"][0]
+        assert item["nickname"] == "Brokerage"
+        assert item["holdings"] is None
+        assert item["ownership"] is None
+
+    def test_list_include_selected_fields(self, client: TestClient, detailed_asset: Asset):
+        response = client.get("/api/v1/assets?include=ownership")
+
+        item = response.json()["items"][0]
+        assert item["ownership"] == "Joint"
+        assert item["holdings"] is None
+
+    def test_list_include_all_details(self, client: TestClient, detailed_asset: Asset):
+        response = client.get("/api/v1/assets?include=details")
+
+        item = response.json()["items"][0]
+        assert item["ownership"] == "Joint"
+        assert json.loads(item["holdings"])["positions"][199]["symbol"] == "S199"
+
+    def test_list_include_unknown_field(self, client: TestClient):
+        response = client.get("/api/v1/assets?include=nickname")
+
+        assert response.status_code == 422
+
+    def test_get_asset_returns_details(self, client: TestClient, detailed_asset: Asset):
+        response = client.get(f"/api/v1/assets/{detailed_asset.wid}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["wid"] == str(detailed_asset.wid)
+        assert data["ownership"] == "Joint"
+        assert data["vendor_response"] is None
+
+    def test_get_asset_not_found(self, client: TestClient):
+        response = client.get(f"/api/v1/assets/{uuid.uuid4()}")
+
+        assert response.status_code == 404
+
+    def test_payload_stored_compressed(self, db: Session, detailed_asset: Asset):
+        stored = db.execute(
+            text("SELECT octet_length(holdings) FROM asset_details WHERE asset_wid = :wid"),
+            {"wid": detailed_asset.wid},
+        ).scalar()
+
+        assert stored < len(db.get(AssetDetail, detailed_asset.wid).holdings) / 2
+
+
+class TestMigrateInlineDetails:
+    """Tests for moving legacy inline columns into asset_details."""
+
+    def test_no_legacy_columns(self, db: Session):
+        assert legacy_detail_columns(db) == []
+        assert migrate_inline_details(db) == 0
+
+    def test_moves_and_drops_columns(self, db: Session, detailed_asset: Asset):
+        legacy = Asset(wid=uuid.uuid4(), nickname="Legacy")
+        db.add(legacy)
+        db.commit()
+        db.execute(text("ALTER TABLE assets ADD COLUMN ownership TEXT, ADD COLUMN holdings TEXT"))
+        db.execute(
+            text("UPDATE assets SET ownership = 'Sole', holdings = '{}' WHERE wid = :wid"),
+            {"wid": legacy.wid},
+        )
+        db.commit()
+
+        written = migrate_inline_details(db)
+
+        assert written == 1
+        assert legacy_detail_columns(db) == []
+        db.expire_all()
+        migrated = db.get(AssetDetail, legacy.wid)
+        assert migrated.ownership == "Sole"
+        assert migrated.holdings == "{}"
+        # Assets that already had a detail row are left untouched
+        assert db.get(AssetDetail, detailed_asset.wid).ownership == "Joint"
@@ -1,4 +1,8 @@
+import uuid
+from datetime import datetime, timezone
+
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 from app.models.asset import Asset
 
@@ -101,6 +105,57 @@ class TestListAssets:
         for item in data["items"]:
             assert item["wealth_asset_type"] == "Cash"
             assert item["is_active"] is True
+    
+    def test_list_assets_balance_range(self, client: TestClient, multiple_assets: list[Asset]):
+        """Test filtering by an inclusive balance range."""
+        response = client.get("/api/v1/assets?balance_current_min=3000&balance_current_max=5000")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert {item["balance_current"] for item in data["items"]} == {3000.0, 4000.0, 5000.0}
+    
+    def test_list_assets_balance_as_of_range(self, client: TestClient, db: Session):
+        """Test filtering by balance date and institution."""
+        db.add_all([
+            Asset(wid=uuid.uuid4(), institution_id=1, balance_as_of=datetime(2024, 1, 1, tzinfo=timezone.utc)),
+            Asset(wid=uuid.uuid4(), institution_id=1, balance_as_of=datetime(2024, 6, 1, tzinfo=timezone.utc)),
+            Asset(wid=uuid.uuid4(), institution_id=2, balance_as_of=datetime(2024, 6, 1, tzinfo=timezone.utc)),
+        ])
+        db.commit()
+        
+        response = client.get(
+            "/api/v1/assets?institution_id=1"
+            "&balance_as_of_after=2024-03-01T00:00:00Z&balance_as_of_before=2024-12-31T00:00:00Z"
+        )
+        
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["balance_as_of"].startswith("2024-06-01")
+    
+    def test_list_assets_sort_descending(self, client: TestClient, multiple_assets: list[Asset], db: Session):
+        """Test that descending sorts put the largest first and missing values last."""
+        db.add(Asset(wid=uuid.uuid4(), nickname="No balance"))
+        db.commit()
+        
+        response = client.get("/api/v1/assets?sort=-balance_current&page_size=100")
+        
+        balances = [item["balance_current"] for item in response.json()["items"]]
+        assert balances == [1000.0 * i for i in range(10, 0, -1)] + [None]
+    
+    def test_list_assets_sort_ascending_pages(self, client: TestClient, multiple_assets: list[Asset]):
+        """Test that ascending sorts page through assets in order."""
+        first = client.get("/api/v1/assets?sort=balance_current&page_size=3").json()
+        second = client.get("/api/v1/assets?sort=balance_current&page_size=3&page=2").json()
+        
+        balances = [item["balance_current"] for item in first["items"] + second["items"]]
+        assert balances == [1000.0, 2000.0, 3000.0, 4000.0, 5000.0, 6000.0]
+    
+    def test_list_assets_unknown_sort(self, client: TestClient):
+        """Test that sorting by a column that isn't whitelisted is rejected."""
+        response = client.get("/api/v1/assets?sort=nickname")
+        
+        assert response.status_code == 422
 
 
 class TestHealthCheck:
@@ -0,0 +1,143 @@
+import gzip
+
+import zstandard
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware, negotiate_encoding
+from app.models.asset import Asset
+
+LARGE_BODY = "asset " * 1000
+
+
+def make_app(**kwargs) -> CompressionMiddleware:
+    """Build a small app wrapped in the compression middleware."""
+    app = FastAPI()
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(LARGE_BODY)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([LARGE_BODY, LARGE_BODY]), media_type="text/plain")
+
+    return CompressionMiddleware(app, **kwargs)
+
+
+class TestNegotiateEncoding:
+    """Tests for Accept-Encoding negotiation."""
+
+    def test_server_preference_breaks_ties(self):
+        assert negotiate_encoding("gzip, br, zstd", ["zstd", "br", "gzip"]) == "zstd"
+
+    def test_highest_q_value_wins(self):
+        assert negotiate_encoding("zstd;q=0.5, gzip", ["zstd", "br", "gzip"]) == "gzip"
+
+    def test_zero_q_value_is_rejected(self):
+        assert negotiate_encoding("gzip;q=0", ["gzip"]) is None
+
+    def test_wildcard(self):
+        assert negotiate_encoding("*", ["br", "gzip"]) == "br"
+
+    def test_identity_only(self):
+        assert negotiate_encoding("identity", ["zstd", "br", "gzip"]) is None
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware."""
+
+    def test_gzip_response(self):
+        """Test that large responses are gzip-compressed when requested."""
+        app = make_app()
+        client = TestClient(app)
+
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert response.text == LARGE_BODY
+
+    def test_zstd_response(self):
+        """Test that zstd is preferred when the client accepts it."""
+        app = make_app()
+        client = TestClient(app)
+
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, zstd"})
+
+        assert response.headers["content-encoding"] == "zstd"
+        raw = zstandard.ZstdDecompressor().decompress(response.content)
+        assert raw.decode() == LARGE_BODY
+
+    def test_small_response_not_compressed(self):
+        """Test that responses below the size threshold are sent as-is."""
+        app = make_app()
+        client = TestClient(app)
+
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == "tiny"
+
+    def test_no_accept_encoding(self):
+        """Test that clients without Accept-Encoding get identity responses."""
+        app = make_app()
+        client = TestClient(app)
+
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == LARGE_BODY
+
+    def test_streaming_response_passes_through(self):
+        """Test that streaming responses are not buffered or compressed."""
+        app = make_app()
+        client = TestClient(app)
+
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == LARGE_BODY * 2
+
+    def test_compressed_payload_is_cached(self):
+        """Test that identical payloads are compressed only once."""
+        app = make_app(gzip_level=9)
+        client = TestClient(app)
+        cache = app.cache
+
+        first = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        second = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert first.text == second.text == LARGE_BODY
+        assert cache.misses == 1
+        assert cache.hits == 1
+        assert gzip.decompress(next(iter(cache._entries.values()))).decode() == LARGE_BODY
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays within its byte budget."""
+        app = make_app()
+        cache = app.cache
+        cache.max_bytes = 10
+
+        cache.put((b"a", "gzip"), b"12345")
+        cache.put((b"b", "gzip"), b"12345")
+        cache.get((b"a", "gzip"))
+        cache.put((b"c", "gzip"), b"12345")
+
+        assert cache.get((b"a", "gzip")) == b"12345"
+        assert cache.get((b"b", "gzip")) is None
+        assert cache.current_bytes == 10
+
+
+def test_list_assets_compressed(client: TestClient, multiple_assets: list[Asset]):
+    """Test that the asset listing is compressed end to end."""
+    response = client.get("/api/v1/assets", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["total"] == 10
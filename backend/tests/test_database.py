@@ -0,0 +1,59 @@
+import os
+import runpy
+from pathlib import Path
+
+import pytest
+
+from app.config import settings
+from app.database import pool_limits
+
+GUNICORN_CONF = Path(__file__).parent.parent / "gunicorn.conf.py"
+
+
+class TestPoolLimits:
+    """Tests for splitting the connection budget across workers."""
+
+    def test_single_worker(self):
+        pool_size, max_overflow = pool_limits(30, 1)
+
+        assert (pool_size, max_overflow) == (14, 15)
+
+    def test_budget_never_exceeded(self):
+        for budget in (2, 4, 5, 30):
+            for workers in range(1, budget // 2 + 1):
+                pool_size, max_overflow = pool_limits(budget, workers)
+                # Pool, overflow and the LISTEN connection for every worker
+                assert workers * (pool_size + max_overflow + 1) <= budget
+
+    def test_small_budget_keeps_one_connection(self):
+        assert pool_limits(4, 2) == (1, 0)
+
+    def test_budget_too_small_for_workers(self):
+        with pytest.raises(ValueError, match="DB_CONNECTION_BUDGET=4"):
+            pool_limits(4, 8)
+
+
+class TestGunicornConfig:
+    """Tests for settings the gunicorn config applies before preloading."""
+
+    @pytest.fixture(autouse=True)
+    def restore_settings(self, monkeypatch):
+        # The config file assigns settings and environment variables directly
+        for name in ("web_concurrency", "db_connection_budget", "create_tables_on_startup"):
+            monkeypatch.setattr(settings, name, getattr(settings, name))
+        monkeypatch.setattr(os, "environ", os.environ.copy())
+
+    def test_workers_skip_table_creation(self):
+        settings.create_tables_on_startup = True
+
+        runpy.run_path(str(GUNICORN_CONF))
+
+        assert settings.create_tables_on_startup is False
+
+    def test_workers_capped_by_budget(self):
+        settings.web_concurrency = 8
+        settings.db_connection_budget = 6
+
+        config = runpy.run_path(str(GUNICORN_CONF))
+
+        assert config["workers"] == settings.web_concurrency == 3
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.main import app as main_app
+from app.models.asset import Asset
+from app.utils.events import AssetChangeBroker, RESYNC_EVENT, format_sse
+
+from .conftest import engine
+
+
+def add_assets(db: Session, count: int) -> list[Asset]:
+    assets = [
+        Asset(wid=uuid.uuid4(), asset_id=f"stream_{i}", balance_current=100.0 * i)
+        for i in range(count)
+    ]
+    db.add_all(assets)
+    db.commit()
+    return assets
+
+
+def parse_event(frame: str) -> tuple[str, dict]:
+    """Split a server-sent event frame into its event name and JSON data."""
+    assert frame.endswith("\n\n")
+    event_line, data_line = frame.removesuffix("\n\n").split("\n")
+    assert event_line.startswith("event: ") and data_line.startswith("data: ")
+    return event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))
+
+
+class TestAssetChangeBroker:
+    """Tests for the LISTEN/NOTIFY asset change broker."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_are_coalesced(self, db: Session):
+        """Test that a burst of inserts arrives as a single event."""
+        broker = AssetChangeBroker(engine, coalesce_seconds=0.05)
+        queue = broker.subscribe()
+        try:
+            assets = add_assets(db, 3)
+            message = await asyncio.wait_for(queue.get(), timeout=5)
+
+            assert message["event"] == "assets_changed"
+            assert message["inserted"] == sorted(str(a.wid) for a in assets)
+            assert message["updated"] == []
+            assert queue.empty()
+        finally:
+            broker.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_updates_are_reported(self, db: Session):
+        """Test that updating an asset notifies subscribers."""
+        assets = add_assets(db, 1)
+        broker = AssetChangeBroker(engine, coalesce_seconds=0.05)
+        queue = broker.subscribe()
+        try:
+            assets[0].balance_current = 42.0
+            db.commit()
+            message = await asyncio.wait_for(queue.get(), timeout=5)
+
+            assert message["updated"] == [str(assets[0].wid)]
+        finally:
+            broker.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_large_burst_becomes_resync(self, db: Session):
+        """Test that bursts above the wid limit collapse into a resync."""
+        broker = AssetChangeBroker(engine, coalesce_seconds=0.05, max_wids_per_event=2)
+        queue = broker.subscribe()
+        try:
+            add_assets(db, 5)
+            message = await asyncio.wait_for(queue.get(), timeout=5)
+
+            assert message == RESYNC_EVENT
+        finally:
+            broker.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_gets_resync(self):
+        """Test that a full subscriber queue is replaced by one resync event."""
+        broker = AssetChangeBroker(engine, queue_size=2)
+        queue = broker.subscribe()
+        try:
+            for i in range(5):
+                broker._broadcast({"event": "assets_changed", "inserted": [str(i)], "updated": []})
+
+            assert queue.qsize() == 1
+            assert queue.get_nowait() == RESYNC_EVENT
+        finally:
+            broker.unsubscribe(queue)
+
+    @pytest.mark.asyncio
+    async def test_listener_released_with_last_subscriber(self):
+        """Test that the shared connection closes once nobody is subscribed."""
+        broker = AssetChangeBroker(engine)
+        first = broker.subscribe()
+        second = broker.subscribe()
+        assert broker._conn is not None
+
+        broker.unsubscribe(first)
+        assert broker._conn is not None
+        broker.unsubscribe(second)
+        assert broker._conn is None
+
+
+class TestStreamEndpoint:
+    """Tests for GET /api/v1/assets/stream."""
+
+    @pytest.fixture
+    def broker(self, monkeypatch) -> AssetChangeBroker:
+        # The app's broker listens on the app database, not the test one
+        broker = AssetChangeBroker(engine, coalesce_seconds=0.05)
+        monkeypatch.setattr("app.api.assets.asset_change_broker", broker)
+        return broker
+
+    @pytest.mark.asyncio
+    async def test_streams_changes_as_events(self, db: Session, broker: AssetChangeBroker):
+        """Test the stream's headers, frames and event contents end to end."""
+        sent: asyncio.Queue = asyncio.Queue()
+        disconnected = asyncio.Event()
+        requested = False
+
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def next_frame() -> str:
+            message = await asyncio.wait_for(sent.get(), timeout=5)
+            assert message["type"] == "http.response.body"
+            assert message["more_body"] is True
+            return message["body"].decode()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/assets/stream",
+            "raw_path": b"/api/v1/assets/stream",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")],
+            "client": ("test", 1234),
+            "server": ("test", 80),
+        }
+        app_task = asyncio.create_task(main_app(scope, receive, sent.put))
+        try:
+            start = await asyncio.wait_for(sent.get(), timeout=5)
+            headers = dict(start["headers"])
+            assert start["status"] == 200
+            assert headers[b"content-type"].startswith(b"text/event-stream")
+            assert headers[b"cache-control"] == b"no-cache"
+            # Events are sent as they happen, never compressed
+            assert b"content-encoding" not in headers
+            assert await next_frame() == ": connected\n\n"
+            assert broker.subscriber_count == 1
+
+            assets = add_assets(db, 3)
+            event, data = parse_event(await next_frame())
+            assert event == "assets_changed"
+            assert data == {
+                "event": "assets_changed",
+                "inserted": sorted(str(a.wid) for a in assets),
+                "updated": [],
+            }
+
+            assets[1].balance_current = 42.0
+            db.commit()
+            event, data = parse_event(await next_frame())
+            assert event == "assets_changed"
+            assert data["updated"] == [str(assets[1].wid)]
+        finally:
+            disconnected.set()
+            await asyncio.wait_for(app_task, timeout=5)
+
+        # Disconnecting releases the subscription and the listener
+        assert broker.subscriber_count == 0
+        assert broker._conn is None
+
+
+def test_format_sse():
+    """Test the server-sent event frame format."""
+    assert format_sse(RESYNC_EVENT) == 'event: resync\ndata: {"event": "resync"}\n\n'
@@ -0,0 +1,64 @@
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.asset import Asset
+from app.utils.export import ASSET_SCHEMA, iter_asset_record_batches
+
+
+class TestExportAssets:
+    """Tests for GET /api/v1/assets/export endpoint."""
+
+    def test_export_parquet(self, client: TestClient, sample_asset: Asset):
+        """Test exporting assets as a Parquet file with typed columns."""
+        response = client.get("/api/v1/assets/export?format=parquet")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.parquet"
+        table = pq.read_table(io.BytesIO(response.content))
+        assert table.num_rows == 1
+        assert table.schema.field("balance_current").type == pa.float64()
+        assert table.schema.field("is_active").type == pa.bool_()
+        assert table.schema.field("balance_as_of").type == pa.timestamp("us", tz="UTC")
+
+        row = table.to_pylist()[0]
+        assert row["wid"] == str(sample_asset.wid)
+        assert row["balance_current"] == 5000.0
+        assert row["balance_as_of"] == sample_asset.balance_as_of
+        assert '"estimateValue": 5000' in row["asset_info"]
+
+    def test_export_arrow_stream(self, client: TestClient, multiple_assets: list[Asset]):
+        """Test exporting assets as an Arrow IPC stream."""
+        response = client.get("/api/v1/assets/export?format=arrow")
+
+        assert response.status_code == 200
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.num_rows == 10
+        assert sorted(table.column("balance_current").to_pylist()) == [
+            1000.0 * (i + 1) for i in range(10)
+        ]
+
+    def test_export_empty_table(self, client: TestClient):
+        """Test that an empty table still produces a valid file."""
+        response = client.get("/api/v1/assets/export")
+
+        assert response.status_code == 200
+        table = pq.read_table(io.BytesIO(response.content))
+        assert table.num_rows == 0
+        assert table.schema == ASSET_SCHEMA
+
+    def test_export_invalid_format(self, client: TestClient):
+        """Test that unsupported formats are rejected."""
+        response = client.get("/api/v1/assets/export?format=csv")
+
+        assert response.status_code == 422
+
+
+def test_record_batches_follow_batch_size(db: Session, multiple_assets: list[Asset]):
+    """Test that rows are read from the cursor in batch-sized chunks."""
+    batches = list(iter_asset_record_batches(db, batch_size=4))
+
+    assert [batch.num_rows for batch in batches] == [4, 4, 2]
@@ -0,0 +1,155 @@
+import threading
+import uuid
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.asset import Asset
+from app.utils.fx import FxRates, UnknownCurrencyError, fx_rate_cache, ingest_fx_rates
+
+
+@pytest.fixture(autouse=True)
+def reset_fx_cache():
+    """Tables are recreated per test, so cached rate versions can't be trusted."""
+    fx_rate_cache.invalidate()
+    yield
+    fx_rate_cache.invalidate()
+
+
+@pytest.fixture
+def mixed_currency_assets(db: Session) -> list[Asset]:
+    """Assets in several currencies across two categories."""
+    assets = [
+        Asset(wid=uuid.uuid4(), primary_asset_category="Cash", wealth_asset_type="Cash",
+              currency_code=None, balance_current=100.0),
+        Asset(wid=uuid.uuid4(), primary_asset_category="Cash", wealth_asset_type="Cash",
+              currency_code="eur", balance_current=200.0),
+        Asset(wid=uuid.uuid4(), primary_asset_category="Retirement", wealth_asset_type="Investment",
+              currency_code="GBP", balance_current=50.0, balance_cost_basis=40.0),
+        Asset(wid=uuid.uuid4(), primary_asset_category="Retirement", wealth_asset_type="Investment",
+              currency_code="XYZ", balance_current=1000.0),
+    ]
+    db.add_all(assets)
+    db.commit()
+    ingest_fx_rates(db, {"USD": 1.0, "EUR": 1.1, "GBP": 1.25})
+    return assets
+
+
+class TestAssetSummary:
+    """Tests for GET /api/v1/assets/summary endpoint."""
+
+    def test_summary_defaults_to_usd(self, client: TestClient, multiple_assets: list[Asset]):
+        """Test totals from the local rates file when no rates are ingested."""
+        response = client.get("/api/v1/assets/summary")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["base_currency"] == "USD"
+        assert data["fx_version"] == 0
+        assert data["total"] == 55000.0
+        assert data["count"] == 10
+        assert [c["name"] for c in data["categories"]] == ["Cash", "Retirement"]
+
+    def test_summary_converts_currencies(self, client: TestClient, mixed_currency_assets: list[Asset]):
+        """Test that balances are converted before they are added up."""
+        response = client.get("/api/v1/assets/summary")
+
+        data = response.json()
+        cash, retirement = data["categories"]
+        assert cash["total"] == pytest.approx(100.0 + 200.0 * 1.1)
+        assert retirement["total"] == pytest.approx(50.0 * 1.25)
+        assert data["total"] == pytest.approx(320.0 + 62.5)
+        assert data["unconverted_currencies"] == ["XYZ"]
+        assert data["unconverted_count"] == 1
+        assert data["fx_version"] == 1
+
+    def test_summary_in_other_base_currency(self, client: TestClient, mixed_currency_assets: list[Asset]):
+        """Test reporting totals in a non-USD base currency."""
+        response = client.get("/api/v1/assets/summary?base_currency=eur")
+
+        data = response.json()
+        assert data["base_currency"] == "EUR"
+        assert data["total"] == pytest.approx((100.0 + 220.0 + 62.5) / 1.1)
+
+    def test_summary_unknown_base_currency(self, client: TestClient):
+        """Test that an unknown base currency is rejected."""
+        response = client.get("/api/v1/assets/summary?base_currency=XYZ")
+
+        assert response.status_code == 422
+
+    def test_analytics_base_currency(self, client: TestClient, mixed_currency_assets: list[Asset]):
+        """Test that analytics values are converted to the base currency."""
+        response = client.get("/api/v1/analytics?base_currency=GBP")
+
+        data = response.json()
+        assert data["base_currency"] == "GBP"
+        assert data["total_value"] == pytest.approx((100.0 + 220.0 + 62.5) / 1.25)
+        assert data["unrealized_gain"] == pytest.approx(10.0)
+        assert data["unconverted_currencies"] == ["XYZ"]
+        assert data["unconverted_count"] == 1
+
+
+class TestFxRates:
+    """Tests for exchange rate conversion and caching."""
+
+    def test_convert_array(self):
+        rates = FxRates(version=1, rates={"USD": 1.0, "EUR": 1.1})
+        amounts = np.array([10.0, 10.0, 10.0])
+        currencies = np.array(["USD", "EUR", "ZZZ"])
+
+        converted = rates.convert_array(amounts, currencies, "EUR")
+
+        assert converted[0] == pytest.approx(10 / 1.1)
+        assert converted[1] == pytest.approx(10.0)
+        assert np.isnan(converted[2])
+
+    def test_cache_reloads_on_new_version(self, db: Session):
+        ingest_fx_rates(db, {"EUR": 1.1})
+        first = fx_rate_cache.get(db)
+        assert fx_rate_cache.get(db) is first
+
+        ingest_fx_rates(db, {"EUR": 1.2})
+        second = fx_rate_cache.get(db)
+
+        assert second.version == first.version + 1
+        assert second.rate("EUR") == 1.2
+        assert second.rate("USD") == 1.0
+
+    def test_ingest_replaces_rate_set(self, db: Session):
+        ingest_fx_rates(db, {"EUR": 1.1, "GBP": 1.25})
+        version = ingest_fx_rates(db, {"EUR": 1.2})
+
+        rates = fx_rate_cache.get(db)
+
+        assert rates.version == version
+        assert rates.rates == {"EUR": 1.2, "USD": 1.0}
+        with pytest.raises(UnknownCurrencyError):
+            rates.rate("GBP")
+
+    def test_ingest_rejects_empty_rate_set(self, db: Session):
+        ingest_fx_rates(db, {"EUR": 1.1})
+
+        with pytest.raises(ValueError, match="No exchange rates"):
+            ingest_fx_rates(db, {})
+
+        assert fx_rate_cache.get(db).rate("EUR") == 1.1
+
+    def test_concurrent_ingests_get_own_versions(self, db: Session):
+        versions = []
+
+        def ingest(rate: float):
+            session = Session(bind=db.get_bind())
+            try:
+                versions.append(ingest_fx_rates(session, {"EUR": rate}))
+            finally:
+                session.close()
+
+        threads = [threading.Thread(target=ingest, args=(1.0 + i / 10,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(versions) == [1, 2, 3, 4]
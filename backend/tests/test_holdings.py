@@ -0,0 +1,128 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.holding import AssetHolding
+from app.utils.holdings import extract_positions, rebuild_holdings
+from app.utils.seed import load_seed_data, seed_database
+
+
+@pytest.fixture
+def seeded(db: Session) -> Session:
+    """Seed the database from the bundled assets.json."""
+    seed_database(db, load_seed_data())
+    return db
+
+
+class TestExtractPositions:
+    """Tests for flattening holdings into position rows."""
+
+    def test_vendor_security_list(self):
+        asset = {
+            "holdings": {
+                "positions": [
+                    {"symbol": "aapl", "quantity": 10, "price": 150, "value": 1500, "costBasis": 1000},
+                    {"description": "no symbol", "value": 5},
+                ]
+            }
+        }
+
+        positions = extract_positions(asset)
+
+        assert positions == [
+            {"symbol": "AAPL", "quantity": 10.0, "price": 150.0, "value": 1500.0, "cost_basis": 1000.0}
+        ]
+
+    def test_manual_symbol_from_asset_info(self):
+        asset = {
+            "asset_info": '{"symbol": "BTC", "quantity": 5}',
+            "balance_current": 500.0,
+            "balance_cost_basis": 100.0,
+        }
+
+        positions = extract_positions(asset)
+
+        assert positions[0]["symbol"] == "BTC"
+        assert positions[0]["quantity"] == 5.0
+        assert positions[0]["price"] == 100.0
+
+    def test_asset_class_breakdown_skips_zero_lines(self):
+        asset = {
+            "holdings": '{"majorAssetClasses": [{"majorClass": "Alt", "assetClasses": ['
+                        '{"minorAssetClass": "HedgeFunds", "value": 8000}, '
+                        '{"minorAssetClass": "Other", "value": 0}]}]}'
+        }
+
+        positions = extract_positions(asset)
+
+        assert positions == [
+            {"major_asset_class": "Alt", "minor_asset_class": "HedgeFunds", "value": 8000.0}
+        ]
+
+
+class TestHoldingsIngest:
+    """Tests for populating asset_holdings during seeding."""
+
+    def test_seed_populates_positions(self, seeded: Session):
+        """Test that seeding writes normalized positions."""
+        btc = seeded.execute(select(AssetHolding).where(AssetHolding.symbol == "BTC")).scalars().all()
+
+        assert len(btc) == 1
+        assert btc[0].quantity == 5.0
+
+        classes = seeded.execute(
+            select(AssetHolding.minor_asset_class).where(AssetHolding.symbol.is_(None))
+        ).scalars().all()
+        assert "PrivateEquity" in classes
+        assert "UsEquity" not in classes  # zero-valued line
+
+    def test_rebuild_holdings_is_idempotent(self, seeded: Session):
+        """Test that rebuilding replaces rather than duplicates positions."""
+        before = seeded.execute(select(func.count()).select_from(AssetHolding)).scalar()
+
+        written = rebuild_holdings(seeded)
+
+        after = seeded.execute(select(func.count()).select_from(AssetHolding)).scalar()
+        assert written == before == after
+
+
+class TestHoldingsApi:
+    """Tests for the /api/v1/holdings endpoints."""
+
+    def test_list_holders_of_symbol(self, client: TestClient, seeded: Session):
+        """Test listing everyone holding a symbol."""
+        response = client.get("/api/v1/holdings?symbol=btc")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["symbol"] == "BTC"
+        assert data["items"][0]["cognito_id"] is not None
+
+    def test_exposure_by_symbol(self, client: TestClient, seeded: Session):
+        """Test aggregate exposure per security."""
+        response = client.get("/api/v1/holdings/exposure?group_by=symbol")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["key"] for item in data["items"]] == ["BTC"]
+        assert data["items"][0]["value"] == pytest.approx(416285.7540045374)
+        assert data["items"][0]["user_count"] == 1
+
+    def test_exposure_by_asset_class(self, client: TestClient, seeded: Session):
+        """Test aggregate exposure per asset class, largest first."""
+        response = client.get("/api/v1/holdings/exposure?group_by=minor_asset_class")
+
+        data = response.json()
+        assert data["items"][0]["key"] == "PersonalRealEstate"
+        assert data["items"][0]["value"] == 1450000.0
+        assert data["items"][0]["asset_count"] == 2
+        by_key = {item["key"]: item for item in data["items"]}
+        assert by_key["CreditCard"]["value"] == -17500.0
+
+    def test_exposure_unknown_base_currency(self, client: TestClient):
+        """Test that an unknown base currency is rejected."""
+        response = client.get("/api/v1/holdings/exposure?base_currency=XYZ")
+
+        assert response.status_code == 422
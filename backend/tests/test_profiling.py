@@ -0,0 +1,138 @@
+import logging
+from typing import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.middleware.profiling import QueryProfilingMiddleware
+from app.models.asset import Asset
+from app.utils.profiling import QueryStats, install_query_profiling
+from app.utils.seed import seed_database
+
+from .conftest import TEST_DATABASE_URL
+
+
+@pytest.fixture
+def profiled_engine() -> Generator[Engine, None, None]:
+    """A separate engine with profiling listeners, logging every statement as slow."""
+    engine = create_engine(TEST_DATABASE_URL)
+    install_query_profiling(engine, slow_query_ms=0.001, explain_slow_queries=True)
+    yield engine
+    engine.dispose()
+
+
+def make_feed(count: int) -> list[dict]:
+    return [
+        {
+            "assetId": f"feed_{i}",
+            "nickname": f"Feed Asset {i}",
+            "wealthAssetType": "Cash",
+            "balanceCurrent": 100.0 * i,
+            "holdings": {"positions": [{"symbol": "abc", "quantity": 1, "price": 10}]},
+        }
+        for i in range(count)
+    ]
+
+
+class TestQueryStats:
+    """Tests for grouping statements by shape."""
+
+    def test_repeated_shapes(self):
+        stats = QueryStats()
+        for _ in range(3):
+            stats.record("SELECT * FROM assets WHERE wid = %(wid)s", 0.001)
+        stats.record("SELECT count(*) FROM assets", 0.001)
+
+        assert stats.count == 4
+        assert stats.repeated(3) == [("SELECT * FROM assets WHERE wid = %(wid)s", 3)]
+        assert stats.repeated(4) == []
+        assert "3x SELECT * FROM assets" in stats.report()
+
+
+class TestQueryCounts:
+    """Statement budgets for code paths that used to loop over rows."""
+
+    def test_seed_query_count_independent_of_size(self, db: Session, assert_max_queries):
+        with assert_max_queries(10, max_repeats=1) as small:
+            seed_database(db, make_feed(5))
+        db.execute(Asset.__table__.delete())
+        db.commit()
+
+        with assert_max_queries(10, max_repeats=1) as large:
+            seed_database(db, make_feed(50))
+
+        assert large.count == small.count
+
+    def test_seed_skips_existing_and_duplicates(self, db: Session):
+        seed_database(db, make_feed(3))
+        result = seed_database(db, make_feed(5) + make_feed(5))
+
+        assert (result.inserted, result.skipped) == (2, 8)
+        assert db.scalar(select(Asset.asset_id).where(Asset.asset_id == "feed_4")) == "feed_4"
+
+    def test_list_with_details(self, client: TestClient, multiple_assets, assert_max_queries):
+        with assert_max_queries(3, max_repeats=1):
+            response = client.get("/api/v1/assets?include=details&is_active=true")
+
+        assert len(response.json()["items"]) == 8
+
+
+class TestQueryProfilingMiddleware:
+    """Tests for per-request statement counting."""
+
+    @pytest.fixture
+    def app(self, profiled_engine: Engine) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/queries")
+        def queries(n: int = 1):
+            with profiled_engine.connect() as conn:
+                for i in range(n):
+                    conn.execute(text("SELECT :i"), {"i": i})
+            return {"ok": True}
+
+        app.add_middleware(QueryProfilingMiddleware, n_plus_one_threshold=5)
+        return app
+
+    def test_counts_statements(self, app: FastAPI, caplog):
+        with TestClient(app) as client, caplog.at_level(logging.WARNING, "app.middleware.profiling"):
+            response = client.get("/queries?n=2")
+
+        assert response.headers["X-Query-Count"] == "2"
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+        assert "Possible N+1" not in caplog.text
+
+    def test_warns_about_repeated_statements(self, app: FastAPI, caplog):
+        with TestClient(app) as client, caplog.at_level(logging.WARNING, "app.middleware.profiling"):
+            response = client.get("/queries?n=6")
+
+        assert response.headers["X-Query-Count"] == "6"
+        assert "Possible N+1 in GET /queries: statement ran 6 times: SELECT" in caplog.text
+
+
+class TestSlowQueryLog:
+    """Tests for logging slow statements."""
+
+    def test_logs_parameters_and_plan(self, profiled_engine: Engine, caplog):
+        with caplog.at_level(logging.WARNING, "app.utils.profiling"):
+            with profiled_engine.connect() as conn:
+                assert conn.execute(text("SELECT :value AS value"), {"value": 42}).scalar() == 42
+
+        assert "Slow query" in caplog.text
+        assert "'value': 42" in caplog.text
+        assert "Execution Time" in caplog.text
+
+    def test_writes_are_not_explained(self, profiled_engine: Engine, caplog):
+        with caplog.at_level(logging.WARNING, "app.utils.profiling"):
+            with profiled_engine.begin() as conn:
+                conn.execute(text("CREATE TEMPORARY TABLE explain_probe (id int)"))
+                conn.execute(text("INSERT INTO explain_probe VALUES (1)"))
+                count = conn.execute(text("SELECT count(*) FROM explain_probe")).scalar()
+
+        # The INSERT ran exactly once
+        assert count == 1
+        assert caplog.text.count("Execution Time") == 1
@@ -0,0 +1,203 @@
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.asset import Asset
+from app.utils.refresh import (
+    RefreshScheduler,
+    StubVendorClient,
+    backoff_delay,
+    claim_due_assets,
+    load_vendor_client,
+)
+
+NOW = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def linked_asset(account: str, due_in: float = -60, **kwargs) -> Asset:
+    values = {
+        "wid": uuid.uuid4(),
+        "integration": "plaid",
+        "integration_account_id": account,
+        "is_linked_vendor": True,
+        "is_active": True,
+        "balance_current": 100.0,
+        "next_update": NOW + timedelta(seconds=due_in),
+        **kwargs,
+    }
+    return Asset(**values)
+
+
+def session_factory(db: Session):
+    return lambda: Session(bind=db.get_bind())
+
+
+@pytest.fixture
+def due_assets(db: Session) -> list[Asset]:
+    """Two due linked assets, plus assets that must never be claimed."""
+    assets = [
+        linked_asset("acct-1", due_in=-120),
+        linked_asset("acct-2", due_in=-60),
+        linked_asset("future", due_in=3600),
+        linked_asset("inactive", is_active=False),
+        linked_asset("manual", is_linked_vendor=False),
+    ]
+    db.add_all(assets)
+    db.commit()
+    return assets
+
+
+class TestClaimDueAssets:
+    """Tests for claiming due assets."""
+
+    def test_claims_due_linked_assets_in_order(self, db: Session, due_assets: list[Asset]):
+        targets = claim_due_assets(db, limit=10, lease_seconds=300, now=NOW)
+
+        assert [t.integration_account_id for t in targets] == ["acct-1", "acct-2"]
+        assert all(t.lease == NOW + timedelta(seconds=300) for t in targets)
+
+    def test_column_added_to_existing_table(self, db: Session, due_assets: list[Asset]):
+        db.execute(text("DROP INDEX ix_assets_refresh_due"))
+        db.execute(text("ALTER TABLE assets DROP COLUMN refresh_failures"))
+        db.commit()
+
+        Base.metadata.create_all(bind=db.get_bind())
+
+        targets = claim_due_assets(db, limit=10, lease_seconds=300, now=NOW)
+        assert [t.refresh_failures for t in targets] == [0, 0]
+
+    def test_claimed_assets_are_leased(self, db: Session, due_assets: list[Asset]):
+        claim_due_assets(db, limit=10, lease_seconds=300, now=NOW)
+
+        assert claim_due_assets(db, limit=10, lease_seconds=300, now=NOW) == []
+        # Once the lease expires the assets are due again
+        later = NOW + timedelta(seconds=301)
+        assert len(claim_due_assets(db, limit=10, lease_seconds=300, now=later)) == 2
+
+    def test_skips_rows_locked_by_another_worker(self, db: Session, due_assets: list[Asset]):
+        other = Session(bind=db.get_bind())
+        try:
+            other.execute(
+                text("SELECT wid FROM assets WHERE wid = :wid FOR UPDATE"),
+                {"wid": due_assets[0].wid},
+            )
+
+            targets = claim_due_assets(db, limit=10, lease_seconds=300, now=NOW)
+        finally:
+            other.close()
+
+        assert [t.integration_account_id for t in targets] == ["acct-2"]
+
+    def test_uses_due_index(self, db: Session, due_assets: list[Asset]):
+        db.execute(text("SET enable_seqscan = off"))
+        plan = db.execute(text(
+            "EXPLAIN SELECT wid FROM assets WHERE is_linked_vendor IS true "
+            "AND is_active IS NOT false AND next_update <= now() ORDER BY next_update LIMIT 10"
+        )).scalars().all()
+        db.rollback()
+
+        assert "ix_assets_refresh_due" in "\n".join(plan)
+
+
+class TestRefreshScheduler:
+    """Tests for refreshing claimed assets."""
+
+    def test_success_writes_balance(self, db: Session, due_assets: list[Asset]):
+        client = StubVendorClient(balances={"acct-1": 250.0, "acct-2": 75.0})
+        scheduler = RefreshScheduler(session_factory(db), client, interval_seconds=3600)
+
+        stats = scheduler.run_once(now=NOW)
+
+        assert (stats.claimed, stats.refreshed, stats.failed) == (2, 2, 0)
+        db.expire_all()
+        asset = db.get(Asset, due_assets[0].wid)
+        assert asset.balance_current == 250.0
+        assert asset.last_update == NOW
+        assert asset.next_update == NOW + timedelta(seconds=3600)
+        assert asset.status_code == "Updated"
+
+    def test_failure_backs_off(self, db: Session, due_assets: list[Asset]):
+        client = StubVendorClient(failing={"acct-1"})
+        scheduler = RefreshScheduler(
+            session_factory(db), client, backoff_base_seconds=60, backoff_max_seconds=3600
+        )
+
+        stats = scheduler.run_once(now=NOW)
+
+        assert (stats.refreshed, stats.failed) == (1, 1)
+        db.expire_all()
+        asset = db.get(Asset, due_assets[0].wid)
+        assert asset.balance_current == 100.0
+        assert asset.refresh_failures == 1
+        assert asset.status_code == "RefreshFailed"
+        assert NOW + timedelta(seconds=54) <= asset.next_update <= NOW + timedelta(seconds=60)
+
+    def test_expired_claim_is_not_written(self, db: Session, due_assets: list[Asset]):
+        def steal_claim(target):
+            # Another worker re-claims the asset after this lease expired
+            other = Session(bind=db.get_bind())
+            other.execute(
+                text("UPDATE assets SET next_update = next_update + interval '1 second' WHERE wid = :wid"),
+                {"wid": target.wid},
+            )
+            other.commit()
+            other.close()
+
+        client = StubVendorClient(default_balance=999.0, on_fetch=steal_claim)
+        scheduler = RefreshScheduler(session_factory(db), client)
+
+        stats = scheduler.run_once(now=NOW)
+
+        assert (stats.refreshed, stats.lost) == (0, 2)
+        db.expire_all()
+        assert db.get(Asset, due_assets[0].wid).balance_current == 100.0
+
+    def test_per_integration_limit(self, db: Session):
+        db.add_all([linked_asset(f"p{i}") for i in range(6)])
+        db.add_all([linked_asset(f"y{i}", integration="yodlee") for i in range(2)])
+        db.commit()
+
+        lock = threading.Lock()
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        def track(target):
+            with lock:
+                in_flight[target.integration] = in_flight.get(target.integration, 0) + 1
+                peak[target.integration] = max(peak.get(target.integration, 0), in_flight[target.integration])
+            time.sleep(0.02)
+            with lock:
+                in_flight[target.integration] -= 1
+
+        client = StubVendorClient(on_fetch=track)
+        scheduler = RefreshScheduler(
+            session_factory(db), client, max_workers=8, default_limit=2,
+            integration_limits={"yodlee": 1},
+        )
+
+        stats = scheduler.run_once(now=NOW)
+        scheduler.close()
+
+        assert stats.refreshed == 8
+        assert peak["plaid"] == 2
+        assert peak["yodlee"] == 1
+
+
+class TestHelpers:
+    """Tests for backoff and client loading."""
+
+    def test_backoff_grows_and_caps(self):
+        assert backoff_delay(1, 60, 3600) <= timedelta(seconds=60)
+        assert backoff_delay(3, 60, 3600) >= timedelta(seconds=216)
+        assert backoff_delay(20, 60, 3600) <= timedelta(seconds=3600)
+
+    def test_load_vendor_client(self):
+        client = load_vendor_client("app.utils.refresh:StubVendorClient")
+
+        assert isinstance(client, StubVendorClient)
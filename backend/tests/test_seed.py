@@ -0,0 +1,401 @@
+import copy
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.asset import Asset
+from app.models.asset_detail import AssetDetail
+from app.models.holding import AssetHolding
+from app.models.seed_job import SeedJob
+from app.utils.seed import (
+    SeedResult,
+    content_hash,
+    deactivate_missing_assets,
+    load_seed_data,
+    seed_database,
+    sync_database,
+)
+from app.utils.seed_jobs import (
+    SeedJobRunner,
+    claim_seed_jobs,
+    job_progress,
+    run_seed_job,
+    seed_job_runner,
+)
+
+
+@pytest.fixture
+def feed() -> list[dict]:
+    """A fresh copy of the bundled seed feed."""
+    return copy.deepcopy(load_seed_data())
+
+
+class TestContentHash:
+    """Tests for feed record hashing."""
+
+    def test_independent_of_key_order(self):
+        assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+
+    def test_changes_with_values(self):
+        assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+class TestSyncDatabase:
+    """Tests for incremental syncs."""
+
+    def test_initial_sync_inserts(self, db: Session, feed: list[dict]):
+        result = sync_database(db, feed)
+
+        assert (result.inserted, result.updated, result.unchanged) == (len(feed), 0, 0)
+        assert db.query(Asset).count() == len(feed)
+
+    def test_resync_leaves_unchanged_rows(self, db: Session, feed: list[dict]):
+        seed_database(db, feed)
+        before = {a.asset_id: a.wid for a in db.query(Asset)}
+        db.expire_all()
+
+        result = sync_database(db, feed)
+
+        assert (result.inserted, result.updated, result.unchanged) == (0, 0, len(feed))
+        assert {a.asset_id: a.wid for a in db.query(Asset)} == before
+
+    def test_updates_only_changed_assets(self, db: Session, feed: list[dict]):
+        sync_database(db, feed)
+        changed = next(item for item in feed if item.get("holdings"))
+        changed["balanceCurrent"] = 123.45
+        changed["ownership"] = "Trust"
+        wid = db.execute(select(Asset.wid).where(Asset.asset_id == changed["assetId"])).scalar()
+        positions = db.query(AssetHolding).filter(AssetHolding.asset_wid == wid).count()
+
+        result = sync_database(db, feed)
+
+        assert (result.inserted, result.updated, result.unchanged) == (0, 1, len(feed) - 1)
+        db.expire_all()
+        asset = db.get(Asset, wid)
+        assert asset.balance_current == 123.45
+        assert asset.content_hash == content_hash(changed)
+        assert db.get(AssetDetail, wid).ownership == "Trust"
+        # Positions are rewritten, not duplicated
+        assert db.query(AssetHolding).filter(AssetHolding.asset_wid == wid).count() == positions
+
+    def test_deactivate_missing(self, db: Session, feed: list[dict]):
+        sync_database(db, feed)
+        removed = feed.pop()
+
+        result = sync_database(db, feed, deactivate_missing=True)
+
+        assert result.deactivated == 1
+        db.expire_all()
+        asset = db.query(Asset).filter(Asset.asset_id == removed["assetId"]).one()
+        assert asset.is_active is False
+
+        # An asset that reappears is written again
+        feed.append(removed)
+        result = sync_database(db, feed)
+        assert result.updated == 1
+
+    def test_deactivate_binds_ids_as_one_array(self, db: Session, feed: list[dict], assert_max_queries):
+        sync_database(db, feed)
+
+        with assert_max_queries(10) as stats:
+            deactivate_missing_assets(db, [item["assetId"] for item in feed])
+
+        statement = next(shape for shape in stats.shapes if shape.startswith("UPDATE assets"))
+        assert "!= ALL (%(asset_ids)s" in statement
+
+    def test_malformed_record_does_not_abort_sync(self, db: Session, feed: list[dict]):
+        sync_database(db, feed)
+        changed = [copy.deepcopy(item) for item in feed[:2]]
+        for item in changed:
+            item["nickname"] = "Renamed"
+        # Rejected by the database, failing the first upsert batch
+        changed[0]["balanceCurrent"] = "not a number"
+
+        result = sync_database(db, ["not a record"] + changed + feed[2:], deactivate_missing=True)
+
+        assert len(result.errors) == 2
+        assert changed[0]["assetId"] in result.errors[1]
+        assert (result.updated, result.unchanged) == (1, len(feed) - 2)
+        # The broken record is still in the feed, so its asset stays active
+        assert result.deactivated == 0
+
+    def test_adds_column_to_existing_table(self, db: Session, feed: list[dict]):
+        db.execute(text("ALTER TABLE assets DROP COLUMN content_hash"))
+        db.commit()
+
+        Base.metadata.create_all(bind=db.get_bind())
+
+        assert sync_database(db, feed).inserted == len(feed)
+
+    def test_records_without_asset_id(self, db: Session):
+        result = sync_database(db, [{"nickname": "No id"}])
+
+        assert result.inserted == 0
+        assert len(result.errors) == 1
+
+
+def create_job(db: Session, **kwargs) -> SeedJob:
+    job = SeedJob(**kwargs)
+    db.add(job)
+    db.commit()
+    return job
+
+
+def session_factory(db: Session):
+    return lambda: Session(bind=db.get_bind())
+
+
+def wait_for_lock_waiters(db: Session, timeout: float = 5.0) -> None:
+    """Block until another connection is waiting on a row lock."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with db.get_bind().connect() as conn:
+            waiting = conn.scalar(text(
+                "SELECT count(*) FROM pg_stat_activity WHERE wait_event_type = 'Lock'"
+            ))
+        if waiting:
+            return
+        time.sleep(0.01)
+    raise AssertionError("No connection started waiting on a lock")
+
+
+class TestSeedJobs:
+    """Tests for background seed jobs."""
+
+    def test_chunked_run(self, db: Session, feed: list[dict]):
+        job = create_job(db)
+
+        run_seed_job(session_factory(db), job.id, chunk_size=4)
+
+        db.refresh(job)
+        assert job.status == "completed"
+        assert job.total_rows == job.processed_rows == len(feed)
+        assert job.inserted == len(feed)
+        assert db.query(Asset).count() == len(feed)
+
+    def test_sync_job_deactivates_missing(self, db: Session, feed: list[dict], tmp_path: Path):
+        sync_database(db, feed)
+        feed_file = tmp_path / "feed.json"
+        feed_file.write_text(json.dumps(feed[1:]))
+        job = create_job(db, sync=True, deactivate_missing=True)
+
+        run_seed_job(session_factory(db), job.id, file_path=feed_file, chunk_size=2)
+
+        db.refresh(job)
+        assert job.status == "completed"
+        assert job.unchanged == len(feed) - 1
+        assert job.deactivated == 1
+
+    def test_cancel_before_next_chunk(self, db: Session):
+        job = create_job(db, cancel_requested=True)
+
+        run_seed_job(session_factory(db), job.id, chunk_size=2)
+
+        db.refresh(job)
+        assert job.status == "cancelled"
+        assert job.processed_rows == 0
+        assert db.query(Asset).count() == 0
+
+    def test_failed_job_records_error(self, db: Session, tmp_path: Path):
+        job = create_job(db)
+
+        run_seed_job(session_factory(db), job.id, file_path=tmp_path / "missing.json")
+
+        db.refresh(job)
+        assert job.status == "failed"
+        assert "missing.json" in job.errors[-1]
+
+    def test_stop_interrupts_for_resume(self, db: Session, feed: list[dict]):
+        job = create_job(db)
+        stop = threading.Event()
+        stop.set()
+
+        run_seed_job(session_factory(db), job.id, chunk_size=2, stop=stop)
+
+        db.refresh(job)
+        assert (job.status, job.heartbeat_at) == ("pending", None)
+        assert claim_seed_jobs(db) == [job.id]
+
+        run_seed_job(session_factory(db), job.id, chunk_size=2)
+
+        db.refresh(job)
+        assert job.status == "completed"
+        assert job.attempts == 1
+        assert job.inserted == len(feed)
+
+    def test_resumes_after_last_chunk(self, db: Session, feed: list[dict]):
+        job = create_job(db, status="running", processed_rows=4, heartbeat_at=None)
+
+        run_seed_job(session_factory(db), job.id, chunk_size=2)
+
+        db.refresh(job)
+        assert job.status == "completed"
+        assert job.processed_rows == len(feed)
+        assert job.inserted == len(feed) - 4
+
+    def test_stale_job_is_taken_over(self, db: Session):
+        now = datetime.now(timezone.utc)
+        stale = create_job(db, status="running", heartbeat_at=now - timedelta(minutes=10))
+        alive = create_job(db, status="running", heartbeat_at=now)
+        create_job(db, status="completed", heartbeat_at=now - timedelta(minutes=10))
+
+        assert claim_seed_jobs(db, stale_seconds=60) == [stale.id]
+        # Claiming refreshes the heartbeat, so nobody else claims it
+        assert claim_seed_jobs(db, stale_seconds=60) == []
+
+        db.refresh(stale)
+        assert stale.attempts == 2
+        assert alive.id not in claim_seed_jobs(db, stale_seconds=60)
+
+    def test_stale_job_fails_after_max_attempts(self, db: Session):
+        heartbeat = datetime.now(timezone.utc) - timedelta(minutes=10)
+        job = create_job(db, status="running", heartbeat_at=heartbeat, attempts=3)
+
+        assert claim_seed_jobs(db, stale_seconds=60, max_attempts=3) == []
+
+        db.refresh(job)
+        assert job.status == "failed"
+        assert "stopped responding" in job.errors[-1]
+
+    def test_failed_chunk_leaves_counters_matching_data(self, db: Session):
+        job = create_job(db)
+        calls = []
+
+        def seed_then_crash(db_, chunk, commit=True):
+            result = seed_database(db_, chunk, commit=commit)
+            calls.append(chunk)
+            if len(calls) == 2:
+                raise RuntimeError("worker crashed")
+            return result
+
+        with patch("app.utils.seed_jobs.seed_database", side_effect=seed_then_crash):
+            run_seed_job(session_factory(db), job.id, chunk_size=2)
+
+        db.refresh(job)
+        assert job.status == "failed"
+        # The second chunk's assets were rolled back with its counters
+        assert job.processed_rows == job.inserted == 2
+        assert db.query(Asset).count() == 2
+
+    def test_taken_over_run_stops(self, db: Session):
+        job = create_job(db)
+        claimed = []
+        threads: list[threading.Thread] = []
+
+        def claim():
+            other = Session(bind=db.get_bind())
+            claimed.extend(claim_seed_jobs(other, stale_seconds=-60))
+            other.close()
+
+        def seed_and_lose_job(db_, chunk, commit=True):
+            # Another worker tries to claim the job while this chunk runs; it
+            # waits on the job row until the chunk is committed
+            if not claimed:
+                thread = threading.Thread(target=claim)
+                thread.start()
+                wait_for_lock_waiters(db)
+                threads.append(thread)
+            return SeedResult(inserted=len(chunk), skipped=0, errors=[])
+
+        with patch("app.utils.seed_jobs.seed_database", side_effect=seed_and_lose_job):
+            run_seed_job(session_factory(db), job.id, chunk_size=2)
+        threads[0].join()
+
+        db.refresh(job)
+        assert claimed == [job.id]
+        # The new owner's job row is left alone after the first chunk
+        assert (job.status, job.attempts) == ("running", 2)
+        assert job.processed_rows == 2
+
+    def test_runner_takes_over_stale_jobs(self, db: Session, feed: list[dict]):
+        runner = SeedJobRunner()
+        assert runner.start(session_factory(db), interval=0.01) == []
+
+        heartbeat = datetime.now(timezone.utc) - timedelta(minutes=10)
+        job = create_job(db, status="running", heartbeat_at=heartbeat)
+        deadline = time.monotonic() + 5
+        while job.status != "completed" and time.monotonic() < deadline:
+            time.sleep(0.01)
+            db.refresh(job)
+            db.commit()
+        runner.close()
+
+        assert job.status == "completed"
+        assert job.attempts == 2
+        assert job.inserted == len(feed)
+
+    def test_progress_estimates(self):
+        started = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        job = SeedJob(status="running", started_at=started, total_rows=300, processed_rows=100)
+
+        throughput, eta = job_progress(job, now=started + timedelta(seconds=10))
+
+        assert throughput == 10.0
+        assert eta == 20.0
+
+
+class TestSeedApi:
+    """Tests for the /api/v1/seed endpoints."""
+
+    def test_seed_job_lifecycle(self, client: TestClient, db: Session):
+        response = client.post("/api/v1/seed")
+
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+
+        seed_job_runner.wait()
+        data = client.get(f"/api/v1/seed/{job_id}").json()
+        assert data["status"] == "completed"
+        assert data["inserted"] == data["total_rows"] > 0
+        assert data["eta_seconds"] == 0.0
+
+    def test_sync_mode(self, client: TestClient, db: Session):
+        first = client.post("/api/v1/seed?sync=true").json()
+        second = client.post("/api/v1/seed?sync=true").json()
+        seed_job_runner.wait()
+
+        first = client.get(f"/api/v1/seed/{first['id']}").json()
+        second = client.get(f"/api/v1/seed/{second['id']}").json()
+        assert first["inserted"] > 0
+        assert second["inserted"] == 0
+        assert second["unchanged"] == first["inserted"]
+
+    def test_get_does_not_take_over_jobs(self, client: TestClient, db: Session):
+        heartbeat = datetime.now(timezone.utc) - timedelta(minutes=10)
+        job = create_job(db, status="running", heartbeat_at=heartbeat)
+
+        data = client.get(f"/api/v1/seed/{job.id}").json()
+
+        db.refresh(job)
+        assert data["status"] == job.status == "running"
+        assert (job.attempts, job.heartbeat_at) == (1, heartbeat)
+
+    def test_cancel(self, client: TestClient, db: Session):
+        job = create_job(db)
+
+        response = client.post(f"/api/v1/seed/{job.id}/cancel")
+
+        assert response.status_code == 200
+        assert response.json()["cancel_requested"] is True
+
+    def test_cancel_finished_job(self, client: TestClient, db: Session):
+        job = create_job(db, status="completed")
+
+        response = client.post(f"/api/v1/seed/{job.id}/cancel")
+
+        assert response.status_code == 409
+
+    def test_unknown_job(self, client: TestClient):
+        response = client.get(f"/api/v1/seed/{uuid.uuid4()}")
+
+        assert response.status_code == 404
@@ -1,4 +1,4 @@
-import type { Asset, AssetListResponse } from '../types/asset';
+import type { Asset, AssetListResponse, AssetSummary } from '../types/asset';
 
 // Use environment variable for API URL in production, fallback to relative path for local dev
 const API_BASE = import.meta.env.VITE_API_URL 
@@ -11,7 +11,7 @@ export async function fetchAssets(params?: {
   wealth_asset_type?: string;
   primary_asset_category?: string;
   is_active?: boolean;
-}): Promise<AssetListResponse> {
+}, signal?: AbortSignal): Promise<AssetListResponse> {
   const searchParams = new URLSearchParams();
   
   if (params?.page) searchParams.set('page', params.page.toString());
@@ -23,7 +23,7 @@ export async function fetchAssets(params?: {
   const queryString = searchParams.toString();
   const url = `${API_BASE}/assets${queryString ? `?${queryString}` : ''}`;
   
-  const response = await fetch(url);
+  const response = await fetch(url, { signal });
   
   if (!response.ok) {
     throw new Error(`Failed to fetch assets: ${response.statusText}`);
@@ -32,19 +32,60 @@ export async function fetchAssets(params?: {
   return response.json();
 }
 
-export async function fetchAllAssets(): Promise<Asset[]> {
-  const allAssets: Asset[] = [];
-  let page = 1;
-  const pageSize = 100;
-  let hasMore = true;
-  
-  while (hasMore) {
-    const response = await fetchAssets({ page, page_size: pageSize });
-    allAssets.push(...response.items);
-    hasMore = page < response.pages;
-    page++;
+export interface PageProgress {
+  loaded: number;
+  total: number;
+}
+
+/**
+ * Fetch every page of assets, calling `onPage` as each page arrives.
+ *
+ * The first page reports how many pages there are; the rest are fetched in
+ * parallel, at most `concurrency` at a time. Pages may arrive out of order.
+ */
+export async function fetchAssetPages(
+  onPage: (items: Asset[], progress: PageProgress) => void,
+  { pageSize = 100, concurrency = 4, signal }: {
+    pageSize?: number;
+    concurrency?: number;
+    signal?: AbortSignal;
+  } = {},
+): Promise<void> {
+  const first = await fetchAssets({ page: 1, page_size: pageSize }, signal);
+  let loaded = first.items.length;
+  onPage(first.items, { loaded, total: first.total });
+  
+  let nextPage = 2;
+  async function worker() {
+    while (nextPage <= first.pages) {
+      const page = nextPage++;
+      const response = await fetchAssets({ page, page_size: pageSize }, signal);
+      loaded += response.items.length;
+      onPage(response.items, { loaded, total: first.total });
+    }
   }
   
+  const workers = Math.min(concurrency, first.pages - 1);
+  await Promise.all(Array.from({ length: workers }, worker));
+}
+
+export async function fetchAllAssets(): Promise<Asset[]> {
+  const allAssets: Asset[] = [];
+  await fetchAssetPages((items) => allAssets.push(...items));
   return allAssets;
 }
 
+
+export async function fetchAssetSummary(
+  baseCurrency = 'USD',
+  signal?: AbortSignal,
+): Promise<AssetSummary> {
+  const searchParams = new URLSearchParams({ base_currency: baseCurrency });
+  const response = await fetch(`${API_BASE}/assets/summary?${searchParams.toString()}`, { signal });
+  
+  if (!response.ok) {
+    throw new Error(`Failed to fetch asset summary: ${response.statusText}`);
+  }
+  
+  return response.json();
+}
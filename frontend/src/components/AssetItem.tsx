@@ -1,6 +1,9 @@
 import type { Asset } from '../types/asset';
 import { formatCurrency } from '../utils/format';
 
+// Rows have a fixed height so long lists can be virtualized
+export const ASSET_ITEM_HEIGHT = 64;
+
 interface AssetItemProps {
   asset: Asset;
 }
@@ -9,18 +12,21 @@ export function AssetItem({ asset }: AssetItemProps) {
   const displayName = asset.nickname || asset.asset_name || 'Unnamed Asset';
   
   return (
-    <div className="flex items-center justify-between py-3 px-4 bg-white border-b border-slate-100 last:border-b-0 hover:bg-slate-50 transition-colors">
-      <div>
-        <p className="text-sm font-medium text-slate-700">{displayName}</p>
+    <div
+      className="flex items-center justify-between px-4 bg-white border-b border-slate-100 last:border-b-0 hover:bg-slate-50 transition-colors"
+      style={{ height: ASSET_ITEM_HEIGHT }}
+    >
+      <div className="min-w-0">
+        <p className="text-sm font-medium text-slate-700 truncate">{displayName}</p>
         {asset.institution_name && (
-          <p className="text-xs text-slate-500">{asset.institution_name}</p>
+          <p className="text-xs text-slate-500 truncate">{asset.institution_name}</p>
         )}
       </div>
       <div className="text-right">
         <p className={`text-sm font-semibold ${
           (asset.balance_current ?? 0) >= 0 ? 'text-slate-800' : 'text-red-600'
         }`}>
-          {formatCurrency(asset.balance_current)}
+          {formatCurrency(asset.balance_current, asset.currency_code)}
         </p>
         {asset.balance_as_of && (
           <p className="text-xs text-slate-400">
@@ -1,16 +1,30 @@
-import { useEffect, useState } from 'react';
-import type { Asset, GroupedAssets } from '../types/asset';
-import { fetchAllAssets } from '../api/assets';
+import { useEffect, useMemo, useState } from 'react';
+import type { Asset, AssetSummary, GroupedAssets } from '../types/asset';
+import { fetchAssetPages, fetchAssetSummary } from '../api/assets';
+import type { PageProgress } from '../api/assets';
 import { formatCurrency } from '../utils/format';
 import { CategoryGroup } from './CategoryGroup';
 
-function groupAssets(assets: Asset[]): GroupedAssets {
+function groupAssets(assets: Asset[], summary: AssetSummary): GroupedAssets {
   const grouped: GroupedAssets = {};
   
+  // Totals come from the summary endpoint, already converted to one currency
+  for (const category of summary.categories) {
+    grouped[category.name] = {
+      total: category.total,
+      subcategories: {},
+    };
+    for (const subcategory of category.subcategories) {
+      grouped[category.name].subcategories[subcategory.name] = {
+        total: subcategory.total,
+        assets: [],
+      };
+    }
+  }
+  
   for (const asset of assets) {
     const category = asset.primary_asset_category || 'Other';
     const subcategory = asset.wealth_asset_type || 'Other';
-    const balance = asset.balance_current ?? 0;
     
     if (!grouped[category]) {
       grouped[category] = {
@@ -26,8 +40,6 @@ function groupAssets(assets: Asset[]): GroupedAssets {
       };
     }
     
-    grouped[category].total += balance;
-    grouped[category].subcategories[subcategory].total += balance;
     grouped[category].subcategories[subcategory].assets.push(asset);
   }
   
@@ -36,27 +48,52 @@ function groupAssets(assets: Asset[]): GroupedAssets {
 
 export function AssetList() {
   const [assets, setAssets] = useState<Asset[]>([]);
+  const [summary, setSummary] = useState<AssetSummary | null>(null);
+  const [progress, setProgress] = useState<PageProgress | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   
   useEffect(() => {
+    const controller = new AbortController();
+    
     async function loadAssets() {
       try {
         setLoading(true);
         setError(null);
-        const data = await fetchAllAssets();
-        setAssets(data);
+        setAssets([]);
+        // Totals render as soon as the summary arrives; assets fill in
+        // page by page
+        await Promise.all([
+          fetchAssetSummary(undefined, controller.signal).then((data) => {
+            if (!controller.signal.aborted) setSummary(data);
+          }),
+          fetchAssetPages(
+            (items, pageProgress) => {
+              if (controller.signal.aborted) return;
+              setAssets((loaded) => loaded.concat(items));
+              setProgress(pageProgress);
+            },
+            { signal: controller.signal },
+          ),
+        ]);
       } catch (err) {
+        if (controller.signal.aborted) return;
         setError(err instanceof Error ? err.message : 'Failed to load assets');
       } finally {
-        setLoading(false);
+        if (!controller.signal.aborted) setLoading(false);
       }
     }
     
     loadAssets();
+    return () => controller.abort();
   }, []);
   
-  if (loading) {
+  const groupedAssets = useMemo(
+    () => (summary ? groupAssets(assets, summary) : null),
+    [assets, summary],
+  );
+  
+  if (!groupedAssets && !error) {
     return (
       <div className="flex items-center justify-center py-12">
         <div className="flex items-center gap-3 text-slate-500">
@@ -91,7 +128,7 @@ export function AssetList() {
     );
   }
   
-  if (assets.length === 0) {
+  if (!groupedAssets || !summary || (!loading && assets.length === 0)) {
     return (
       <div className="bg-slate-100 border border-slate-200 rounded-lg p-8 text-center text-slate-500">
         <svg
@@ -113,8 +150,7 @@ export function AssetList() {
     );
   }
   
-  const groupedAssets = groupAssets(assets);
-  const totalNetWorth = assets.reduce((sum, asset) => sum + (asset.balance_current ?? 0), 0);
+  const baseCurrency = summary.base_currency;
   
   const categoryEntries = Object.entries(groupedAssets).sort(([a], [b]) => 
     (a || 'zzz').localeCompare(b || 'zzz')
@@ -124,10 +160,20 @@ export function AssetList() {
     <div>
       <div className="bg-gradient-to-r from-primary-900 to-primary-800 rounded-lg p-6 mb-6 shadow-lg">
         <p className="text-primary-200 text-sm font-medium uppercase tracking-wide">Total Net Worth</p>
-        <p className="text-3xl font-bold text-white mt-1">{formatCurrency(totalNetWorth)}</p>
+        <p className="text-3xl font-bold text-white mt-1">{formatCurrency(summary.total, baseCurrency)}</p>
         <p className="text-primary-300 text-sm mt-2">
-          {assets.length} {assets.length === 1 ? 'asset' : 'assets'} across {categoryEntries.length} {categoryEntries.length === 1 ? 'category' : 'categories'}
+          {summary.count} {summary.count === 1 ? 'asset' : 'assets'} across {categoryEntries.length} {categoryEntries.length === 1 ? 'category' : 'categories'}
         </p>
+        {loading && progress && (
+          <p className="text-primary-300 text-xs mt-1">
+            Loading assets... {progress.loaded} of {progress.total}
+          </p>
+        )}
+        {summary.unconverted_currencies.length > 0 && (
+          <p className="text-primary-300 text-xs mt-1">
+            Excludes {summary.unconverted_count} {summary.unconverted_count === 1 ? 'asset' : 'assets'} in {summary.unconverted_currencies.join(', ')} (no exchange rate)
+          </p>
+        )}
       </div>
       
       <div>
@@ -136,6 +182,7 @@ export function AssetList() {
             key={categoryName}
             name={categoryName}
             total={data.total}
+            currency={baseCurrency}
             subcategories={data.subcategories}
           />
         ))}
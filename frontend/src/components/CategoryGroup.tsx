@@ -11,10 +11,11 @@ interface SubcategoryData {
 interface CategoryGroupProps {
   name: string;
   total: number;
+  currency: string;
   subcategories: Record<string, SubcategoryData>;
 }
 
-export function CategoryGroup({ name, total, subcategories }: CategoryGroupProps) {
+export function CategoryGroup({ name, total, currency, subcategories }: CategoryGroupProps) {
   const [isExpanded, setIsExpanded] = useState(true);
   
   const subcategoryEntries = Object.entries(subcategories).sort(([a], [b]) => 
@@ -49,7 +50,7 @@ export function CategoryGroup({ name, total, subcategories }: CategoryGroupProps
           </span>
         </div>
         <span className="text-lg font-bold text-white">
-          {formatCurrency(total)}
+          {formatCurrency(total, currency)}
         </span>
       </button>
       
@@ -63,6 +64,7 @@ export function CategoryGroup({ name, total, subcategories }: CategoryGroupProps
             key={subcategoryName}
             name={subcategoryName}
             total={data.total}
+            currency={currency}
             assets={data.assets}
           />
         ))}
@@ -1,15 +1,16 @@
 import { useState } from 'react';
 import type { Asset } from '../types/asset';
 import { formatCurrency } from '../utils/format';
-import { AssetItem } from './AssetItem';
+import { VirtualAssetList } from './VirtualAssetList';
 
 interface SubcategoryGroupProps {
   name: string;
   total: number;
+  currency: string;
   assets: Asset[];
 }
 
-export function SubcategoryGroup({ name, total, assets }: SubcategoryGroupProps) {
+export function SubcategoryGroup({ name, total, currency, assets }: SubcategoryGroupProps) {
   const [isExpanded, setIsExpanded] = useState(false);
   
   return (
@@ -35,7 +36,7 @@ export function SubcategoryGroup({ name, total, assets }: SubcategoryGroupProps)
           </span>
         </div>
         <span className="text-sm font-semibold text-slate-700">
-          {formatCurrency(total)}
+          {formatCurrency(total, currency)}
         </span>
       </button>
       
@@ -44,11 +45,12 @@ export function SubcategoryGroup({ name, total, assets }: SubcategoryGroupProps)
           isExpanded ? 'max-h-[2000px] opacity-100' : 'max-h-0 opacity-0'
         }`}
       >
-        <div className="ml-6 border-l-2 border-slate-200">
-          {assets.map((asset) => (
-            <AssetItem key={asset.wid} asset={asset} />
-          ))}
-        </div>
+        {/* Rows are only mounted while the group is open */}
+        {isExpanded && (
+          <div className="ml-6 border-l-2 border-slate-200">
+            <VirtualAssetList assets={assets} />
+          </div>
+        )}
       </div>
     </div>
   );
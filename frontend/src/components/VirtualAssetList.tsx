@@ -0,0 +1,53 @@
+import { useState } from 'react';
+import type { Asset } from '../types/asset';
+import { AssetItem, ASSET_ITEM_HEIGHT } from './AssetItem';
+
+// Lists up to this length render every row; longer ones are windowed
+const VIRTUALIZE_THRESHOLD = 25;
+const VIEWPORT_HEIGHT = 480;
+// Rows mounted above and below the visible window to avoid blank edges
+const OVERSCAN = 5;
+
+interface VirtualAssetListProps {
+  assets: Asset[];
+}
+
+/**
+ * Renders a list of assets, mounting only the rows visible in a fixed-height
+ * scroll viewport once the list is long.
+ */
+export function VirtualAssetList({ assets }: VirtualAssetListProps) {
+  const [scrollTop, setScrollTop] = useState(0);
+  
+  if (assets.length <= VIRTUALIZE_THRESHOLD) {
+    return (
+      <>
+        {assets.map((asset) => (
+          <AssetItem key={asset.wid} asset={asset} />
+        ))}
+      </>
+    );
+  }
+  
+  const start = Math.max(0, Math.floor(scrollTop / ASSET_ITEM_HEIGHT) - OVERSCAN);
+  const end = Math.min(
+    assets.length,
+    Math.ceil((scrollTop + VIEWPORT_HEIGHT) / ASSET_ITEM_HEIGHT) + OVERSCAN,
+  );
+  
+  return (
+    <div
+      className="overflow-y-auto"
+      style={{ height: VIEWPORT_HEIGHT }}
+      onScroll={(event) => setScrollTop(event.currentTarget.scrollTop)}
+    >
+      <div style={{ height: assets.length * ASSET_ITEM_HEIGHT }}>
+        <div style={{ transform: `translateY(${start * ASSET_ITEM_HEIGHT}px)` }}>
+          {assets.slice(start, end).map((asset) => (
+            <AssetItem key={asset.wid} asset={asset} />
+          ))}
+        </div>
+      </div>
+    </div>
+  );
+}
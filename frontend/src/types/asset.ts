@@ -60,6 +60,29 @@ export interface AssetListResponse {
   pages: number;
 }
 
+export interface SubcategorySummary {
+  name: string;
+  total: number;
+  count: number;
+}
+
+export interface CategorySummary {
+  name: string;
+  total: number;
+  count: number;
+  subcategories: SubcategorySummary[];
+}
+
+export interface AssetSummary {
+  base_currency: string;
+  fx_version: number;
+  total: number;
+  count: number;
+  categories: CategorySummary[];
+  unconverted_currencies: string[];
+  unconverted_count: number;
+}
+
 export interface GroupedAssets {
   [category: string]: {
     total: number;
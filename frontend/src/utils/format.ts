@@ -1,14 +1,23 @@
-export function formatCurrency(amount: number | null | undefined): string {
-  if (amount === null || amount === undefined) {
-    return '$0.00';
+export function formatCurrency(
+  amount: number | null | undefined,
+  currency: string | null = 'USD',
+): string {
+  const code = currency || 'USD';
+  try {
+    return new Intl.NumberFormat('en-US', {
+      style: 'currency',
+      currency: code,
+      minimumFractionDigits: 2,
+      maximumFractionDigits: 2,
+    }).format(amount ?? 0);
+  } catch {
+    // Intl throws a RangeError for malformed currency codes
+    const number = new Intl.NumberFormat('en-US', {
+      minimumFractionDigits: 2,
+      maximumFractionDigits: 2,
+    }).format(amount ?? 0);
+    return `${number} ${code}`;
   }
-  
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency: 'USD',
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 2,
-  }).format(amount);
 }
 
 export function formatDate(dateString: string | null | undefined): string {